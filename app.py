@@ -19,8 +19,11 @@ from components.mlops_engineer_dashboard import render_mlops_engineer_dashboard
 from components.risk_operations_dashboard import render_risk_operations_dashboard
 from components.executive_dashboard import render_executive_dashboard
 from components.workflow_visualization import render_workflow_visualization
-from utils.mock_data import generate_mock_metrics, get_deployment_flows
+from utils.mock_data import generate_mock_metrics, get_deployment_flows, generate_kpi_events
 from utils.styling import apply_custom_css
+from utils.shared_metrics import get_shared_metrics
+from utils.deployment_scheduler import DeploymentScheduler
+from utils.kpi_ledger import KpiLedger
 
 # Page configuration
 st.set_page_config(
@@ -30,6 +33,15 @@ st.set_page_config(
     initial_sidebar_state="expanded"
 )
 
+def load_metrics():
+    """Load platform metrics, shared across workers when run by the multi-worker launcher"""
+    shared = get_shared_metrics()
+    if shared is not None:
+        metrics = shared.read()
+        if metrics is not None:
+            return metrics
+    return generate_mock_metrics()
+
 def initialize_session_state():
     """Initialize session state variables"""
     if 'current_persona' not in st.session_state:
@@ -37,14 +49,23 @@ def initialize_session_state():
     if 'active_view' not in st.session_state:
         st.session_state.active_view = 'overview'
     if 'metrics' not in st.session_state:
-        st.session_state.metrics = generate_mock_metrics()
+        st.session_state.metrics = load_metrics()
     if 'last_update' not in st.session_state:
         st.session_state.last_update = datetime.now()
+    if 'deployment_scheduler' not in st.session_state:
+        # Quotas follow the MLOps Configuration defaults until saved there
+        st.session_state.deployment_scheduler = DeploymentScheduler(cpu_quota=4, memory_quota_gb=8)
+    if 'kpi_ledger' not in st.session_state:
+        st.session_state.kpi_ledger = KpiLedger()
+        for event in generate_kpi_events():
+            st.session_state.kpi_ledger.add(event['kind'], event['amount'], event['category'],
+                                            event['date'], event.get('fraud_type'))
 
 def main():
     """Main application function"""
     # Initialize session state
     initialize_session_state()
+    st.session_state.deployment_scheduler.advance()
     
     # Apply custom CSS styling
     apply_custom_css()
@@ -52,7 +73,7 @@ def main():
     # Update metrics every 3 seconds for real-time simulation
     current_time = datetime.now()
     if (current_time - st.session_state.last_update).seconds >= 3:
-        st.session_state.metrics = generate_mock_metrics()
+        st.session_state.metrics = load_metrics()
         st.session_state.last_update = current_time
         st.rerun()
     
@@ -2,7 +2,54 @@ import streamlit as st
 import pandas as pd
 import plotly.express as px
 import plotly.graph_objects as go
-from utils.mock_data import generate_experiment_data, generate_feature_data, generate_model_performance_data
+import os
+import tempfile
+import time
+import numpy as np
+from utils.mock_data import generate_experiment_data, generate_feature_data, generate_model_performance_data, generate_country_risk_scores, generate_transaction_stream
+from utils.feature_importance import compute_feature_discovery_importance
+from utils.geo_risk import GeoRiskResolver, build_sample_geo_database, is_valid_ip, risk_level
+from utils.chart_payload import compact_figure
+from utils.dataset_factory import CATEGORICAL_FEATURES, FEATURE_COLUMNS
+from utils.fraud_model import encode_features, score_sellers, train_reference_model
+from utils.batch_scoring import RISK_LEVELS, RISK_LEVEL_CUTS
+from utils.retraining import RetrainingPipeline
+from utils.streaming_sketch import SellerVelocityAggregator
+from components.experiments import launch_hyperparameter_search, load_metric_store, render_search_progress
+
+@st.cache_resource(show_spinner="Loading geo risk database...")
+def load_geo_resolver():
+    """Open the geo risk database, building a sample one on first use"""
+    database_dir = os.environ.get('GEO_RISK_DB') or os.path.join(tempfile.gettempdir(), 'seller-risk-geo-db')
+    if not os.path.exists(os.path.join(database_dir, 'countries.json')):
+        build_sample_geo_database(database_dir, generate_country_risk_scores())
+    return GeoRiskResolver(database_dir)
+
+@st.cache_data(show_spinner="Computing permutation importance...")
+def load_feature_importance(n_eval=500_000, n_repeats=5):
+    """Rank catalog features by permutation importance on a held-out set"""
+    return compute_feature_discovery_importance(generate_feature_data(), n_eval=n_eval, n_repeats=n_repeats)
+
+@st.cache_resource(show_spinner="Training scoring model...")
+def load_scoring_model():
+    """Reference fraud model shared by the playground and batch scoring"""
+    return train_reference_model()
+
+@st.cache_resource(ttl=60, show_spinner="Aggregating recent transactions...")
+def load_velocity_aggregator():
+    """Velocity sketches over the last ten minutes of transactions, rebuilt every minute"""
+    # Distinct grids sized to the ~40K sellers active in the sample stream
+    aggregator = SellerVelocityAggregator(count_width=2**16, distinct_width=2**16)
+    aggregator.ingest(generate_transaction_stream())
+    return aggregator
+
+@st.cache_resource(show_spinner="Loading model checkpoints...")
+def load_retraining_pipeline():
+    """Open the fraud model checkpoint history, fitting the first checkpoint on first use"""
+    pipeline = RetrainingPipeline(os.environ.get('MODEL_CHECKPOINT_DIR') or os.path.join(tempfile.gettempdir(), 'fraud-model-checkpoints'))
+    if pipeline.incumbent is None:
+        pipeline.bootstrap()
+    return pipeline
 
 def render_data_scientist_dashboard():
     """Render the Data Scientist workspace dashboard"""
@@ -59,6 +106,42 @@ def render_data_scientist_dashboard():
                 st.markdown(f"**{exp['runtime']}**")
             
             st.divider()
+        
+        render_search_progress()
+        
+        st.markdown("### Run Comparison")
+        
+        store = load_metric_store()
+        run_ids = store.run_ids()
+        if not run_ids:
+            st.info("No runs in the metric store yet. Launch a search or log a run to compare curves here.")
+        else:
+            col1, col2 = st.columns([1, 2])
+            with col1:
+                metric_labels = {'val_loss': 'Validation Loss', 'val_f1': 'Validation F1', 'train_loss': 'Training Loss (per step)'}
+                metric = st.selectbox("Metric", list(metric_labels), format_func=metric_labels.get)
+            with col2:
+                if len(run_ids) > 1:
+                    n_runs = st.slider("Runs to overlay", 1, min(50, len(run_ids)), min(50, len(run_ids)))
+                else:
+                    n_runs = 1
+                    st.caption(f"Showing the only run in the store: {run_ids[0]}")
+            
+            started = time.perf_counter()
+            curves = store.compare(run_ids[-n_runs:], metric)
+            query_ms = (time.perf_counter() - started) * 1000
+            
+            fig_runs = go.Figure()
+            for run_id, (steps, values) in curves.items():
+                fig_runs.add_trace(go.Scattergl(
+                    x=steps, y=values, mode='lines', name=run_id,
+                    hovertext=store.runs[run_id].get('name'), line=dict(width=1)
+                ))
+            fig_runs.update_layout(height=400, template="plotly_white", title=f"{metric_labels[metric]} by Run",
+                                   xaxis_title="Step (search trials: training budget)", showlegend=n_runs <= 10)
+            st.plotly_chart(compact_figure(fig_runs, decimals=4), use_container_width=True)
+            n_points = sum(len(values) for _, values in curves.values())
+            st.caption(f"Loaded {n_points:,} points for {len(curves)} runs in {query_ms:.1f}ms from a store of {len(run_ids)} runs")
     
     with tab2:
         st.markdown("### Model Performance Comparison")
@@ -77,7 +160,7 @@ def render_data_scientist_dashboard():
         )
         
         fig.update_layout(height=400, template="plotly_white")
-        st.plotly_chart(fig, use_container_width=True)
+        st.plotly_chart(compact_figure(fig, decimals=1), use_container_width=True)
         
         # Model details
         st.markdown("### Model Registry")
@@ -96,9 +179,10 @@ def render_data_scientist_dashboard():
     with tab3:
         st.markdown("### Feature Discovery")
         
-        features = generate_feature_data()
+        features, importance_seconds = load_feature_importance()
         
         st.markdown("#### Top Features by Importance")
+        st.caption(f"Permutation importance (log-loss increase) on a 500K-row held-out set, computed in {importance_seconds:.1f}s")
         
         for feature in features:
             col1, col2, col3, col4 = st.columns([3, 1, 1, 1])
@@ -130,7 +214,7 @@ def render_data_scientist_dashboard():
             color_continuous_scale='Blues'
         )
         fig_features.update_layout(height=400, template="plotly_white")
-        st.plotly_chart(fig_features, use_container_width=True)
+        st.plotly_chart(compact_figure(fig_features, decimals=3), use_container_width=True)
     
     with tab4:
         st.markdown("### Model Testing Playground")
@@ -150,27 +234,61 @@ def render_data_scientist_dashboard():
             decline_rate = st.slider("Payment Decline Rate (7d)", 0.0, 1.0, 0.15)
             seller_age = st.number_input("Seller Age (days)", 1, 365, 45)
             avg_amount = st.number_input("Avg Transaction Amount", 0.0, 1000.0, 150.50)
-            country_risk = st.selectbox("Country Risk Score", ["low", "medium", "high"])
+            seller_ip = st.text_input("Seller IP Address (optional)", placeholder="e.g. 203.0.113.7 or 2001:db8::1").strip()
+            ip_valid = bool(seller_ip) and is_valid_ip(seller_ip)
+            if seller_ip and not ip_valid:
+                st.error(f"'{seller_ip}' is not a valid IPv4 or IPv6 address")
+            if ip_valid:
+                geo_score = float(load_geo_resolver().lookup_ips([seller_ip])[0])
+                country_risk = risk_level(geo_score)
+                st.caption(f"Geo risk score {geo_score:.2f} → country risk **{country_risk}**")
+            else:
+                country_risk = st.selectbox("Country Risk Score", ["low", "medium", "high"])
             category_risk = st.selectbox("Product Category", ["electronics", "clothing", "home", "other"])
             
+            # Velocity and payment method come from the streaming sketches; unknown IDs get typical values
+            seller_number = seller_id.strip().lstrip('Ss')
+            if seller_number.isdigit():
+                activity = load_velocity_aggregator().features([int(seller_number)])
+                velocity, payment_method = float(activity['velocity_score'][0]), int(activity['payment_method_risk'][0])
+                st.caption(f"Last 10 min: ~{activity['transactions'][0]:.0f} transactions ({velocity:.1f}× average), "
+                           f"~{activity['distinct_cards'][0]:.0f} cards, ~{activity['distinct_buyers'][0]:.0f} buyers, "
+                           f"~{activity['distinct_ips'][0]:.0f} IPs → payment method risk "
+                           f"**{CATEGORICAL_FEATURES['payment_method_risk'][payment_method]}**")
+            else:
+                velocity, payment_method = 1.0, 0
+            
             if st.button("🚀 Run Inference", use_container_width=True):
-                st.session_state.inference_run = True
+                seller = {
+                    'payment_decline_rate_7d': decline_rate,
+                    'seller_age_days': seller_age,
+                    'avg_transaction_amount': avg_amount,
+                    'country_risk_score': CATEGORICAL_FEATURES['country_risk_score'].index(country_risk),
+                    'product_category_risk': CATEGORICAL_FEATURES['product_category_risk'].index(category_risk),
+                    'velocity_score': velocity,
+                    'payment_method_risk': payment_method
+                }
+                st.session_state.inference_run = seller
         
         with col2:
             st.markdown("#### Model Output")
             
             if hasattr(st.session_state, 'inference_run'):
-                # Simulate model output
-                risk_score = 0.847
-                confidence = 0.942
-                prediction = "HIGH RISK"
-                inference_time = "23ms"
+                model = load_scoring_model()
+                columns = {name: np.array([value]) for name, value in st.session_state.inference_run.items()}
+                started = time.perf_counter()
+                risk_score = float(score_sellers(model, columns)[0])
+                inference_ms = (time.perf_counter() - started) * 1000
+                confidence = max(risk_score, 1 - risk_score)
+                level = RISK_LEVELS[int(np.searchsorted(RISK_LEVEL_CUTS, risk_score, side='right'))]
+                prediction = f"{level} RISK"
+                level_color = {'LOW': '#10b981', 'MEDIUM': '#f59e0b'}.get(level, '#ef4444')
                 
                 st.markdown(f"""
-                    <div style="background: #f8fafc; padding: 1rem; border-radius: 8px; border-left: 4px solid #ef4444;">
+                    <div style="background: #f8fafc; padding: 1rem; border-radius: 8px; border-left: 4px solid {level_color};">
                         <div style="display: flex; justify-content: space-between; margin-bottom: 0.5rem;">
                             <span><strong>Risk Score:</strong></span>
-                            <span style="color: #ef4444; font-weight: bold;">{risk_score}</span>
+                            <span style="color: {level_color}; font-weight: bold;">{risk_score:.3f}</span>
                         </div>
                         <div style="display: flex; justify-content: space-between; margin-bottom: 0.5rem;">
                             <span><strong>Confidence:</strong></span>
@@ -178,23 +296,23 @@ def render_data_scientist_dashboard():
                         </div>
                         <div style="display: flex; justify-content: space-between; margin-bottom: 0.5rem;">
                             <span><strong>Prediction:</strong></span>
-                            <span style="color: #ef4444; font-weight: bold;">{prediction}</span>
+                            <span style="color: {level_color}; font-weight: bold;">{prediction}</span>
                         </div>
                         <div style="display: flex; justify-content: space-between;">
                             <span><strong>Inference Time:</strong></span>
-                            <span style="color: #10b981; font-weight: bold;">{inference_time}</span>
+                            <span style="color: #10b981; font-weight: bold;">{inference_ms:.1f}ms</span>
                         </div>
                     </div>
                 """, unsafe_allow_html=True)
                 
                 st.markdown("#### Feature Contributions")
                 
-                contributions = [
-                    ("payment_decline_rate_7d", 0.34),
-                    ("seller_age_days", 0.28),
-                    ("country_risk_score", 0.21),
-                    ("avg_transaction_amount", 0.17)
-                ]
+                # Share of the absolute log-odds contribution of each feature
+                X, slices = encode_features(columns)
+                impact = {name: abs(float(model.contribution(X[:, slices[name]], slices[name])[0])) for name in FEATURE_COLUMNS}
+                total_impact = sum(impact.values()) or 1.0
+                contributions = sorted(((name, value / total_impact) for name, value in impact.items()),
+                                       key=lambda item: item[1], reverse=True)[:5]
                 
                 for feature, contrib in contributions:
                     col_name, col_bar, col_pct = st.columns([2, 2, 1])
@@ -213,7 +331,10 @@ def render_data_scientist_dashboard():
     
     with col1:
         if st.button("🆕 New Experiment", use_container_width=True):
-            st.success("New experiment created!")
+            search = launch_hyperparameter_search()
+            if search:
+                st.success(f"Hyperparameter search {search.search_id} started — {search.n_configs} configs across "
+                           f"{', '.join(search.families)}; results stream into the Experiments tab")
     
     with col2:
         if st.button("📊 Feature Store", use_container_width=True):
@@ -221,4 +342,14 @@ def render_data_scientist_dashboard():
     
     with col3:
         if st.button("🔄 Retrain Model", use_container_width=True):
-            st.success("Model retraining initiated!")
\ No newline at end of file
+            pipeline = load_retraining_pipeline()
+            with st.spinner("Updating model with data since the last checkpoint..."):
+                record = pipeline.retrain(mode='incremental')
+            summary = (f"v{record['version']} trained on {record['new_rows']:,} new rows in {record['seconds']:.1f}s — "
+                       f"validation loss {record['metrics']['log_loss']:.4f} vs incumbent "
+                       f"{record['incumbent_metrics']['log_loss']:.4f}, AUC {record['metrics']['auc']:.3f} vs "
+                       f"{record['incumbent_metrics']['auc']:.3f}")
+            if record['promoted']:
+                st.success(f"Model retrained and promoted: {summary}")
+            else:
+                st.warning(f"Retrained model rejected by the validation gate; v{record['parent']} stays live. {summary}")
\ No newline at end of file
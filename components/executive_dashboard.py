@@ -2,6 +2,7 @@ import streamlit as st
 import plotly.express as px
 import plotly.graph_objects as go
 import pandas as pd
+from utils.kpi_ledger import format_money_delta
 
 def render_executive_dashboard():
     """Render the Executive dashboard with strategic KPIs"""
@@ -9,13 +10,20 @@ def render_executive_dashboard():
     st.title("📈 Executive Dashboard")
     st.markdown("Strategic overview and key performance indicators")
     
+    # Financial KPIs come from the ledger's precomputed rollups
+    ledger = st.session_state.kpi_ledger
+    roi_series = ledger.cumulative_roi_series('quarter')
+    savings_12m = ledger.trailing_total('savings')
+    savings_prior_12m = ledger.trailing_total('savings', offset=12)
+    
     # Executive summary metrics
     col1, col2, col3, col4, col5 = st.columns(5)
     
     with col1:
-        st.metric("Platform ROI", "340%", "+45%")
+        roi_delta = roi_series[-1][1] - roi_series[-2][1] if len(roi_series) > 1 else 0.0
+        st.metric("Platform ROI", f"{roi_series[-1][1]:.0f}%" if roi_series else "—", f"{roi_delta:+.0f}%")
     with col2:
-        st.metric("Cost Savings", "$2.4M", "+$340K")
+        st.metric("Cost Savings", f"${savings_12m / 1e6:.1f}M", format_money_delta(savings_12m - savings_prior_12m))
     with col3:
         st.metric("Time to Market", "67% faster", "+12%")
     with col4:
@@ -32,8 +40,8 @@ def render_executive_dashboard():
         st.markdown("### 💰 Financial Impact")
         
         # ROI over time
-        quarters = ['Q1 2023', 'Q2 2023', 'Q3 2023', 'Q4 2023', 'Q1 2024', 'Q2 2024']
-        roi_values = [120, 180, 235, 280, 315, 340]
+        quarters = [period for period, _ in roi_series[-6:]]
+        roi_values = [round(roi, 1) for _, roi in roi_series[-6:]]
         
         fig_roi = px.line(
             x=quarters,
@@ -47,8 +55,10 @@ def render_executive_dashboard():
         
         # Cost breakdown
         st.markdown("#### Cost Savings Breakdown")
-        cost_categories = ['Fraud Prevention', 'Operational Efficiency', 'Developer Productivity', 'Infrastructure']
-        savings = [1.2, 0.6, 0.4, 0.2]
+        by_category = ledger.breakdown('savings', 'category', grain='month', periods=ledger.latest_periods('month', 12))
+        by_category = dict(sorted(by_category.items(), key=lambda item: item[1], reverse=True))
+        cost_categories = list(by_category)
+        savings = [round(amount / 1e6, 2) for amount in by_category.values()]
         
         fig_costs = px.bar(
             x=cost_categories,
@@ -269,7 +279,8 @@ def render_executive_dashboard():
     st.markdown("---")
     st.markdown("### 💡 Key Insights & Recommendations")
     
-    st.success("🎉 **Platform Performance**: Exceeding targets across all key metrics with 340% ROI")
+    st.success(f"🎉 **Platform Performance**: Exceeding targets across all key metrics with {roi_series[-1][1]:.0f}% ROI" if roi_series else
+               "🎉 **Platform Performance**: Exceeding targets across all key metrics")
     st.info("📈 **Growth Opportunity**: Ready to scale internationally with current infrastructure")
     st.warning("⚠️ **Action Required**: Model governance framework needs review and update")
     st.info("🚀 **Strategic Focus**: Invest in AI governance and security for next phase growth")
\ No newline at end of file
@@ -0,0 +1,69 @@
+import streamlit as st
+import pandas as pd
+import os
+import tempfile
+from utils.mock_data import generate_experiment_runs
+from utils.metric_store import MetricStore
+from utils.hyperparam_search import HyperparameterSearch
+
+@st.cache_resource(show_spinner="Opening experiment metric store...")
+def load_metric_store():
+    """Open the experiment metric store, seeding sample run history on first use"""
+    store = MetricStore(os.environ.get('METRIC_STORE_DIR') or os.path.join(tempfile.gettempdir(), 'experiment-metrics'))
+    if not store.run_ids():
+        for run in generate_experiment_runs():
+            store.log_run(run['id'], name=run['name'], algorithm=run['algorithm'], status='completed')
+            for metric, (steps, values) in run['metrics'].items():
+                store.log_many(run['id'], metric, steps, values)
+        store.flush()
+    return store
+
+def launch_hyperparameter_search():
+    """Start a successive-halving search in the background, streaming trials into the metric store.
+
+    Returns None (after showing why) when another search is still running.
+    """
+    try:
+        search = HyperparameterSearch(load_metric_store()).start()
+    except RuntimeError as e:
+        st.warning(str(e))
+        return None
+    if 'hparam_searches' not in st.session_state:
+        st.session_state.hparam_searches = []
+    st.session_state.hparam_searches.append(search)
+    return search
+
+def render_search_progress():
+    """Live status and leaderboard of this session's hyperparameter searches"""
+    searches = st.session_state.get('hparam_searches', [])
+    if not searches:
+        return
+
+    st.markdown("### Hyperparameter Searches")
+    for search in reversed(searches):
+        progress = search.progress()
+        status_icons = {'pending': '⚪', 'running': '🟡', 'completed': '🟢', 'failed': '🔴'}
+        with st.expander(f"{status_icons[search.status]} {search.search_id} — {search.status.title()}",
+                         expanded=search.status == 'running'):
+            leaderboard = search.leaderboard(10)
+            col1, col2, col3, col4 = st.columns(4)
+            with col1:
+                st.metric("Trials Finished", f"{progress['completed'] + progress['stopped']}/{search.n_configs}")
+            with col2:
+                st.metric("Stopped Early", progress['stopped'])
+            with col3:
+                st.metric("Rung Results", progress['rung_results'])
+            with col4:
+                st.metric("Best Val Loss", f"{leaderboard[0]['val_loss']:.4f}" if leaderboard else "—")
+
+            if search.error:
+                st.error(f"Search failed: {search.error}")
+            if leaderboard:
+                df = pd.DataFrame(leaderboard)
+                df['params'] = df['params'].map(lambda params: ', '.join(
+                    f"{k}={v:.3g}" if isinstance(v, float) else f"{k}={v}" for k, v in params.items()))
+                st.dataframe(df[['id', 'family', 'status', 'budget', 'val_loss', 'val_auc', 'val_f1', 'params']],
+                             use_container_width=True, hide_index=True)
+
+    if any(search.status in ('pending', 'running') for search in searches):
+        st.button("🔄 Refresh Results")
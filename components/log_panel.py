@@ -0,0 +1,64 @@
+import streamlit as st
+import os
+import re
+import tempfile
+from datetime import datetime, timedelta
+from utils.log_viewer import LogFile, write_sample_log
+
+TIME_RANGES = {
+    'Last 15 minutes': timedelta(minutes=15),
+    'Last hour': timedelta(hours=1),
+    'Last 24 hours': timedelta(days=1),
+    'All': None
+}
+
+def log_path(name):
+    """Path of a named log, under MLOPS_LOG_DIR or a temp directory"""
+    log_dir = os.environ.get('MLOPS_LOG_DIR') or os.path.join(tempfile.gettempdir(), 'seller-risk-logs')
+    return os.path.join(log_dir, f'{name}.log')
+
+@st.cache_resource(show_spinner="Opening logs...")
+def load_log_file(name):
+    """Open a log file, writing a sample one on first use"""
+    path = log_path(name)
+    if not os.path.exists(path):
+        write_sample_log(path, n_lines=50_000, seed=len(name))
+    return LogFile(path)
+
+def render_log_panel(name, title):
+    """Render a tail/search view over one log file"""
+    log = load_log_file(name)
+    key = f'log_panel_{name}'
+
+    with st.expander(f"📋 {title}", expanded=True):
+        col1, col2, col3 = st.columns([3, 2, 1])
+        with col1:
+            pattern = st.text_input("Filter (regex)", placeholder="e.g. ERROR|timeout", key=f'{key}_pattern')
+        with col2:
+            time_range = st.selectbox("Time Range", list(TIME_RANGES), key=f'{key}_range')
+        with col3:
+            limit = st.selectbox("Lines", [50, 200, 1000], key=f'{key}_limit')
+
+        follow = st.toggle("Follow new lines", key=f'{key}_follow')
+        if follow:
+            # Each session keeps its own read position on the shared LogFile
+            offset = st.session_state.get(f'{key}_offset', log.size)
+            new_lines, st.session_state[f'{key}_offset'] = log.read_from(offset)
+            st.caption(f"{len(new_lines)} new line(s) since last refresh")
+            if new_lines:
+                st.code('\n'.join(new_lines[-limit:]), language='log')
+
+        span = TIME_RANGES[time_range]
+        if not pattern and span is None:
+            lines = log.tail(limit)
+        else:
+            try:
+                re.compile(pattern)
+            except re.error as e:
+                st.error(f"Invalid filter: {e}")
+                return
+            start = datetime.now() - span if span else None
+            lines = log.search(pattern or None, start=start, limit=limit)
+
+        st.caption(f"{log.path} · {log.size / 1e6:.1f} MB · showing {len(lines)} line(s)")
+        st.code('\n'.join(lines) or 'No matching log lines', language='log')
@@ -1,6 +1,20 @@
 import streamlit as st
 import plotly.express as px
 import plotly.graph_objects as go
+import time
+from utils.alert_engine import AlertEngine
+from utils.mock_data import generate_infrastructure_metrics, generate_alert_rules, get_deployment_flows
+from utils.deployment_scheduler import PRIORITIES, submit_flow_deployment
+from components.log_panel import render_log_panel
+
+def format_age(timestamp):
+    """Format an epoch timestamp as a relative age ('5 min ago')"""
+    seconds = max(0, time.time() - timestamp)
+    if seconds < 60:
+        return "just now"
+    if seconds < 3600:
+        return f"{int(seconds // 60)} min ago"
+    return f"{int(seconds // 3600)} hours ago"
 
 def render_mlops_engineer_dashboard():
     """Render the MLOps Engineer dashboard"""
@@ -8,6 +22,13 @@ def render_mlops_engineer_dashboard():
     st.title("🔧 MLOps Engineering")
     st.markdown("Model deployment, infrastructure management, and CI/CD pipelines")
     
+    # Alert engine is evaluated against every metrics tick (each rerun)
+    if 'alert_engine' not in st.session_state:
+        metrics = generate_infrastructure_metrics()
+        st.session_state.alert_engine = AlertEngine(list(metrics))
+        st.session_state.alert_engine.add_rules(generate_alert_rules())
+    st.session_state.alert_engine.evaluate(generate_infrastructure_metrics())
+    
     # Key metrics
     col1, col2, col3, col4 = st.columns(4)
     
@@ -43,8 +64,45 @@ def render_mlops_engineer_dashboard():
                 st.markdown(dep['time'])
             st.divider()
         
+        st.markdown("### Deployment Queue")
+        scheduler = st.session_state.deployment_scheduler
+        queue_stats = scheduler.stats()
+        
+        col1, col2, col3, col4 = st.columns(4)
+        with col1:
+            st.metric("Queued", queue_stats['queued'])
+        with col2:
+            st.metric("Running", queue_stats['running'])
+        with col3:
+            st.metric("Queue Wait (p50 / p95)", f"{queue_stats['wait_p50']:.0f}s / {queue_stats['wait_p95']:.0f}s")
+        with col4:
+            st.metric("CPU / Memory Used", f"{queue_stats['cpu_utilization']:.0%} / {queue_stats['memory_utilization']:.0%}")
+        
+        for request in list(scheduler.running.values()) + scheduler.queued():
+            status_icon = "🔄" if request['status'] == 'running' else "⏳"
+            st.caption(f"{status_icon} {request['id']} · {request['project']} · {request['flow_id']} · "
+                       f"{request['priority']} · {request['cpu']} CPU / {request['memory_gb']} GB")
+        
+        flows = get_deployment_flows()
+        col1, col2, col3 = st.columns(3)
+        with col1:
+            flow_name = st.selectbox("Deployment Flow", [flow['name'] for flow in flows])
+        with col2:
+            project = st.selectbox("Project", ["seller-risk", "payments-risk", "catalog-risk"])
+        with col3:
+            priority = st.selectbox("Priority", list(PRIORITIES), index=1)
+        
         if st.button("🚀 New Deployment"):
-            st.success("Deployment pipeline started!")
+            flow = next(f for f in flows if f['name'] == flow_name)
+            try:
+                request = submit_flow_deployment(scheduler, flow, project=project, priority=priority)
+            except ValueError as e:
+                st.error(str(e))
+            else:
+                if request['status'] == 'running':
+                    st.success(f"Deployment {request['id']} started!")
+                else:
+                    st.info(f"Deployment {request['id']} queued — waiting for CPU/memory quota")
     
     with tab2:
         st.markdown("### Infrastructure Overview")
@@ -74,14 +132,18 @@ def render_mlops_engineer_dashboard():
         
         # Alert summary
         st.markdown("#### Recent Alerts")
-        alerts = [
-            {"level": "🟡 Warning", "message": "High memory usage on node-3", "time": "5 min ago"},
-            {"level": "🔴 Critical", "message": "Model endpoint timeout", "time": "12 min ago"},
-            {"level": "🟢 Info", "message": "Auto-scaling triggered", "time": "18 min ago"},
-        ]
+        severity_labels = {
+            'info': "🟢 Info",
+            'warning': "🟡 Warning",
+            'critical': "🔴 Critical"
+        }
+        alerts = st.session_state.alert_engine.recent_alerts(limit=5)
         
+        if not alerts:
+            st.caption("No alerts fired recently")
         for alert in alerts:
-            st.markdown(f"{alert['level']} - {alert['message']} ({alert['time']})")
+            repeats = f" ×{alert['count']}" if alert['count'] > 1 else ""
+            st.markdown(f"{severity_labels[alert['severity']]} - {alert['message']}{repeats} ({format_age(alert['first_seen'])})")
         
         # Performance metrics
         st.markdown("#### Performance Metrics")
@@ -110,12 +172,16 @@ def render_mlops_engineer_dashboard():
         
         with col2:
             st.markdown("#### Resource Limits")
-            st.slider("CPU Limit (cores)", 1, 8, 4)
-            st.slider("Memory Limit (GB)", 2, 16, 8)
+            cpu_limit = st.slider("CPU Limit (cores)", 1, 8, 4)
+            memory_limit = st.slider("Memory Limit (GB)", 2, 16, 8)
             st.slider("Storage (GB)", 10, 100, 50)
         
         if st.button("💾 Save Configuration"):
-            st.success("Configuration saved successfully!")
+            _, rejected = st.session_state.deployment_scheduler.set_quotas(cpu_limit, memory_limit)
+            st.success("Configuration saved successfully! Deployment quotas updated.")
+            if rejected:
+                st.warning(f"{len(rejected)} queued deployment(s) exceed the new limits and were rejected: "
+                           f"{', '.join(request['id'] for request in rejected)}")
     
     # Action buttons
     st.markdown("---")
@@ -127,7 +193,7 @@ def render_mlops_engineer_dashboard():
     
     with col2:
         if st.button("📊 View Logs", use_container_width=True):
-            st.info("Opening system logs...")
+            st.session_state.show_system_logs = not st.session_state.get('show_system_logs', False)
     
     with col3:
         if st.button("🔧 Maintenance", use_container_width=True):
@@ -135,4 +201,7 @@ def render_mlops_engineer_dashboard():
     
     with col4:
         if st.button("📈 Analytics", use_container_width=True):
-            st.info("Opening analytics dashboard...")
\ No newline at end of file
+            st.info("Opening analytics dashboard...")
+
+    if st.session_state.get('show_system_logs'):
+        render_log_panel('system', "System Logs")
\ No newline at end of file
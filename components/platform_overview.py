@@ -7,8 +7,12 @@ from utils.mock_data import (
     generate_time_series_data, 
     generate_system_health_data,
     generate_recent_activity,
-    generate_model_performance_data
+    generate_model_performance_data,
+    get_deployment_flows
 )
+from utils.deployment_scheduler import submit_flow_deployment
+from utils.chart_payload import compact_figure
+from components.experiments import launch_hyperparameter_search
 
 def render_metric_card(title, value, change, icon, trend="neutral"):
     """Render a metric card with styling"""
@@ -146,7 +150,8 @@ def render_platform_overview():
             template="plotly_white"
         )
         
-        st.plotly_chart(fig, use_container_width=True)
+        # Hourly timestamps go out as start + step, values at display precision
+        st.plotly_chart(compact_figure(fig, decimals=1), use_container_width=True)
     
     with col2:
         st.markdown("### 🔄 Deployment Flow Distribution")
@@ -237,11 +242,21 @@ def render_platform_overview():
     
     with col1:
         if st.button("🚀 Deploy New Model", use_container_width=True):
-            st.success("Deployment pipeline initiated!")
+            try:
+                request = submit_flow_deployment(st.session_state.deployment_scheduler, get_deployment_flows()[0])
+            except ValueError as e:
+                st.error(str(e))
+            else:
+                if request['status'] == 'running':
+                    st.success(f"Deployment {request['id']} started!")
+                else:
+                    st.info(f"Deployment {request['id']} queued — waiting for capacity")
     
     with col2:
         if st.button("🧪 Create Experiment", use_container_width=True):
-            st.success("New experiment created!")
+            search = launch_hyperparameter_search()
+            if search:
+                st.success(f"Hyperparameter search {search.search_id} started — follow it in the Data Science Experiments tab")
     
     with col3:
         if st.button("🛡️ Monitor Fraud", use_container_width=True):
@@ -274,7 +289,7 @@ def render_platform_overview():
         template="plotly_white"
     )
     
-    st.plotly_chart(fig_models, use_container_width=True)
+    st.plotly_chart(compact_figure(fig_models, decimals=1), use_container_width=True)
     
     # Success Metrics Summary
     st.markdown("---")
@@ -1,8 +1,131 @@
 import streamlit as st
 import plotly.express as px
 import pandas as pd
-from datetime import datetime
-from utils.mock_data import generate_fraud_detection_data
+import numpy as np
+import os
+import re
+import tempfile
+from datetime import datetime, timedelta
+from utils.mock_data import generate_fraud_detection_data, generate_seller_linkage_data, generate_seller_profiles
+from utils.risk_window import RiskEventWindow
+from utils.seller_actions import SellerActionLedger, RISK_LEVEL_ORDER, new_idempotency_key, sellers_matching
+from utils.review_queue import ReviewQueues
+from utils.kpi_ledger import format_money_delta
+from utils.account_linkage import AccountLinker, ATTRIBUTE_KINDS
+from utils.entity_resolution import EntityResolver, duplicate_signal
+from utils.dataset_factory import CATEGORICAL_FEATURES, generate_seller_chunk
+from utils.fraud_model import train_reference_model
+from utils.threshold_sweep import ALL_SEGMENTS, ThresholdSweep, strategy_scores
+
+# Decision threshold of the deployed fraud model and the false positive rate it must stay under
+CONFIDENCE_THRESHOLD = 0.85
+FPR_TARGET = 0.05
+
+@st.cache_resource
+def load_action_ledger():
+    """Seller action ledger shared by every session"""
+    path = os.environ.get('SELLER_ACTION_DB') or os.path.join(tempfile.gettempdir(), 'seller-risk-actions', 'ledger.db')
+    return SellerActionLedger(path)
+
+@st.cache_resource
+def load_review_queues():
+    """Manual-review queues shared by every analyst session"""
+    return ReviewQueues()
+
+@st.cache_resource(show_spinner="Linking seller accounts...")
+def load_account_linkage():
+    """Linked-account clusters over shared seller attributes, shared by every session"""
+    data = generate_seller_linkage_data()
+    linker = AccountLinker(len(data['risk_scores']), {kind: data['cardinality'] for kind in ATTRIBUTE_KINDS})
+    linker.add_edges(data['sellers'], data['kinds'], data['values'])
+    return {
+        'linker': linker,
+        'id_offset': data['id_offset'],
+        'cluster_size': linker.cluster_sizes(),
+        'cluster_risk': linker.cluster_risk(data['risk_scores'])
+    }
+
+def seller_linkage(seller_id, max_linked=5):
+    """Cluster size, cluster risk and a few linked seller IDs for a seller, or None if unknown"""
+    match = re.fullmatch(r'S(\d+)', seller_id.strip())
+    linkage = load_account_linkage()
+    index = int(match.group(1)) - linkage['id_offset'] if match else -1
+    if not 0 <= index < len(linkage['cluster_size']):
+        return None
+    linked = linkage['linker'].linked_sellers(index)[:max_linked]
+    return {
+        'cluster_size': int(linkage['cluster_size'][index]),
+        'cluster_risk': float(linkage['cluster_risk'][index]),
+        'linked': [f"S{linkage['id_offset'] + i}" for i in linked]
+    }
+
+@st.cache_resource(show_spinner="Resolving seller identities...")
+def load_entity_resolution():
+    """Near-duplicate seller profiles found with MinHash LSH, shared by every session"""
+    profiles = generate_seller_profiles()
+    result = EntityResolver().resolve(profiles['texts'])
+    counts, best = duplicate_signal(len(profiles['texts']), result)
+    return {
+        'texts': profiles['texts'],
+        'id_offset': profiles['id_offset'],
+        'result': result,
+        'duplicate_count': counts,
+        'duplicate_similarity': best
+    }
+
+def seller_duplicates(seller_id, max_shown=5):
+    """Near-duplicate seller IDs of a seller with their similarity, or None if unknown"""
+    match = re.fullmatch(r'S(\d+)', seller_id.strip())
+    resolution = load_entity_resolution()
+    index = int(match.group(1)) - resolution['id_offset'] if match else -1
+    if not 0 <= index < len(resolution['texts']):
+        return None
+    result = resolution['result']
+    mask = (result['first'] == index) | (result['second'] == index)
+    others = result['first'][mask] + result['second'][mask] - index
+    order = result['similarity'][mask].argsort()[::-1][:max_shown]
+    return {
+        'count': int(resolution['duplicate_count'][index]),
+        'similarity': float(resolution['duplicate_similarity'][index]),
+        'duplicates': [(f"S{resolution['id_offset'] + i}", float(sim))
+                       for i, sim in zip(others[order], result['similarity'][mask][order])]
+    }
+
+@st.cache_resource(show_spinner="Sweeping strategy thresholds...")
+def load_threshold_sweep(n_rows=2_000_000):
+    """Precision/recall/FPR curves per strategy and country risk segment, shared by every session"""
+    columns = generate_seller_chunk(n_rows, seed=7)
+    sweep = ThresholdSweep([f"{level.title()} country risk" for level in CATEGORICAL_FEATURES['country_risk_score']])
+    for strategy, scores in strategy_scores(columns, train_reference_model()).items():
+        sweep.add_strategy(strategy, scores, columns['is_fraud'], columns['country_risk_score'])
+    return sweep
+
+def format_wait(seconds):
+    """Compact wait time for queue metrics"""
+    if seconds < 60:
+        return f"{seconds:.0f}s"
+    if seconds < 3600:
+        return f"{seconds / 60:.0f}m"
+    return f"{seconds / 3600:.1f}h"
+
+def apply_seller_action(action, seller_ids, reason):
+    """Run a bulk action against the ledger and report the outcome"""
+    if not seller_ids:
+        st.warning("No sellers selected")
+        return
+    # One key per submission, kept until the write succeeds so a retried submission is not applied twice
+    request = (action, tuple(seller_ids), reason)
+    pending = st.session_state.get('pending_seller_action')
+    if pending is None or pending['request'] != request:
+        pending = {'request': request, 'key': new_idempotency_key()}
+        st.session_state.pending_seller_action = pending
+    result = load_action_ledger().apply(action, seller_ids, actor='risk-ops', reason=reason,
+                                        idempotency_key=pending['key'])
+    del st.session_state.pending_seller_action
+    if result['duplicate']:
+        st.info(f"This {result['action']} request for {result['sellers']:,} seller(s) was already applied")
+    else:
+        return result
 
 def render_risk_operations_dashboard():
     """Render the Risk Operations Center dashboard"""
@@ -20,7 +143,10 @@ def render_risk_operations_dashboard():
     with col3:
         st.metric("Avg Response Time", "1.2s", "-0.3s")
     with col4:
-        st.metric("Cost Savings", "$2.4M", "+$340K")
+        ledger = st.session_state.kpi_ledger
+        savings_12m = ledger.trailing_total('savings')
+        st.metric("Cost Savings", f"${savings_12m / 1e6:.1f}M",
+                  format_money_delta(savings_12m - ledger.trailing_total('savings', offset=12)))
     
     tab1, tab2, tab3, tab4 = st.tabs(["🚨 Real-time Monitoring", "📝 Strategy Management", "👁️ Seller Monitoring", "📊 Analytics"])
     
@@ -33,8 +159,20 @@ def render_risk_operations_dashboard():
         if auto_refresh:
             st.info("🔄 Live monitoring active - events updating automatically")
         
-        # Generate fraud events
-        fraud_events = generate_fraud_detection_data()
+        # Only events that arrived since the last rerun are folded into the sliding-window counters
+        if 'risk_event_window' not in st.session_state:
+            st.session_state.risk_event_window = RiskEventWindow(window_seconds=3600, bucket_seconds=60)
+        now = datetime.now()
+        new_events = generate_fraud_detection_data(since=st.session_state.get('fraud_events_ingested_at'), now=now)
+        st.session_state.fraud_events_ingested_at = now
+        st.session_state.risk_event_window.ingest(new_events)
+        
+        # Keep the last two hours of events as the live feed
+        feed_start = now - timedelta(hours=2)
+        fraud_events = new_events + [event for event in st.session_state.get('fraud_event_feed', [])
+                                     if event['timestamp'] > feed_start]
+        fraud_events.sort(key=lambda event: event['timestamp'], reverse=True)
+        st.session_state.fraud_event_feed = fraud_events
         
         # Display recent events
         for event in fraud_events[:8]:
@@ -64,21 +202,28 @@ def render_risk_operations_dashboard():
             
             with col5:
                 st.caption(event['reason'])
+                if event['reason'] == 'Multiple account flags':
+                    linkage = seller_linkage(event['seller_id'])
+                    if linkage and linkage['cluster_size'] > 1:
+                        st.caption(f"🔗 {linkage['cluster_size'] - 1} linked account(s)")
             
             st.divider()
         
         # Risk level distribution
         st.markdown("### Risk Level Distribution (Last Hour)")
-        risk_counts = pd.DataFrame(fraud_events).groupby('risk_level').size().reset_index(name='count')
+        level_counts = st.session_state.risk_event_window.level_counts()
         
         fig_risk = px.pie(
-            risk_counts, 
-            values='count', 
-            names='risk_level',
-            color='risk_level',
+            values=list(level_counts.values()), 
+            names=list(level_counts.keys()),
+            color=list(level_counts.keys()),
             color_discrete_map={'LOW': '#10b981', 'MEDIUM': '#f59e0b', 'HIGH': '#ef4444', 'CRITICAL': '#dc2626'}
         )
         st.plotly_chart(fig_risk, use_container_width=True)
+        
+        st.markdown("#### Top Risk Reasons (Last Hour)")
+        for reason, count in list(st.session_state.risk_event_window.reason_counts().items())[:5]:
+            st.caption(f"{reason}: {count}")
     
     with tab2:
         st.markdown("### 📝 Natural Language Strategy Management")
@@ -107,8 +252,11 @@ actions:
   - block_seller
   - send_alert
   - require_manual_review
-confidence_threshold: 0.85
+confidence_threshold: {CONFIDENCE_THRESHOLD}
                 """, language="yaml")
+                deployed = load_threshold_sweep().at('Fraud Model', CONFIDENCE_THRESHOLD)
+                st.caption(f"At confidence {CONFIDENCE_THRESHOLD}: precision {deployed['precision']:.1%}, "
+                           f"recall {deployed['recall']:.1%}, false positive rate {deployed['fpr']:.2%}")
                 
                 col1, col2 = st.columns(2)
                 with col1:
@@ -151,6 +299,10 @@ confidence_threshold: 0.85
         
         if seller_search:
             st.markdown(f"#### Risk Profile: {seller_search}")
+            seller_status = load_action_ledger().statuses([seller_search])[seller_search]
+            st.caption(f"Account status: **{seller_status.replace('_', ' ')}**")
+            linkage = seller_linkage(seller_search)
+            duplicates = seller_duplicates(seller_search)
             
             col1, col2, col3 = st.columns(3)
             
@@ -166,6 +318,22 @@ confidence_threshold: 0.85
                 st.metric("Risk Level", "HIGH", "↑")
                 st.metric("Last Activity", "2 hours ago", "")
             
+            if linkage:
+                col1, col2, col3 = st.columns(3)
+                with col1:
+                    st.metric("Linked Accounts", linkage['cluster_size'] - 1)
+                with col2:
+                    st.metric("Cluster Size", linkage['cluster_size'])
+                with col3:
+                    st.metric("Cluster Risk", f"{linkage['cluster_risk']:.3f}")
+                if linkage['linked']:
+                    st.caption("Shares a device, bank account, address or payout method with: " + ", ".join(linkage['linked'])
+                               + (" …" if linkage['cluster_size'] - 1 > len(linkage['linked']) else ""))
+            if duplicates and duplicates['count']:
+                st.warning(f"🧬 {duplicates['count']} near-duplicate identit{'y' if duplicates['count'] == 1 else 'ies'} "
+                           f"(profile similarity up to {duplicates['similarity']:.0%}): "
+                           + ", ".join(f"{other} ({sim:.0%})" for other, sim in duplicates['duplicates']))
+            
             # Risk history chart
             st.markdown("#### Risk Score History")
             dates = pd.date_range(start='2024-01-01', periods=30, freq='D')
@@ -203,7 +371,60 @@ confidence_threshold: 0.85
             
             with col4:
                 if st.button("🔍", key=f"investigate_{seller['seller_id']}"):
-                    st.info(f"Opening detailed investigation for {seller['seller_id']}")
+                    case, team, created = load_review_queues().submit(
+                        seller['seller_id'], seller['risk_score'], seller['reason'], source='investigate'
+                    )
+                    if created:
+                        st.info(f"Investigation opened for {seller['seller_id']} in the {team} queue")
+                    else:
+                        st.info(f"{seller['seller_id']} is already queued for {team} review")
+        
+        # Near-duplicate identities
+        st.markdown("#### 🧬 Near-Duplicate Identities")
+        resolution = load_entity_resolution()
+        result = resolution['result']
+        col1, col2, col3, col4 = st.columns(4)
+        with col1:
+            st.metric("Profiles Scanned", f"{result['rows']:,}")
+        with col2:
+            st.metric("Candidate Pairs", f"{result['candidates']:,}")
+        with col3:
+            st.metric("Near-Duplicate Pairs", f"{len(result['similarity']):,}")
+        with col4:
+            st.metric("Resolution Time", f"{sum(result['seconds'].values()):.1f}s")
+        
+        top = result['similarity'].argsort()[::-1][:10]
+        offset, texts = resolution['id_offset'], resolution['texts']
+        st.dataframe(pd.DataFrame({
+            'seller_id': [f"S{offset + i}" for i in result['first'][top]],
+            'duplicate_id': [f"S{offset + i}" for i in result['second'][top]],
+            'similarity': result['similarity'][top].round(3),
+            'profile': [texts[i] for i in result['second'][top]]
+        }), use_container_width=True, hide_index=True)
+        
+        # Manual review queue
+        st.markdown("#### 📥 Manual Review Queue")
+        review_queues = load_review_queues()
+        queue_stats = review_queues.stats()
+        
+        team_cols = st.columns(len(queue_stats['teams']))
+        for col, (team, stats) in zip(team_cols, queue_stats['teams'].items()):
+            with col:
+                st.metric(f"{team.title()} Queue", f"{stats['depth']:,}")
+                st.caption(f"Wait p50 {format_wait(stats['wait_p50'])} · p95 {format_wait(stats['wait_p95'])}")
+        
+        col1, col2 = st.columns([1, 2])
+        with col1:
+            review_team = st.selectbox("Team", list(queue_stats['teams']))
+            if st.button("📥 Claim Next Case", use_container_width=True):
+                case = review_queues.pop(review_team)
+                if case:
+                    st.success(f"Claimed {case['case_id']} (risk {case['risk_score']:.3f}) after {format_wait(case['waited_s'])}")
+                else:
+                    st.info(f"The {review_team} queue is empty")
+        with col2:
+            for case in review_queues.queues[review_team].peek(5):
+                st.caption(f"{case['case_id']} · risk {case['risk_score']:.3f} · {case.get('reason') or 'manual escalation'}")
     
     with tab4:
         st.markdown("### 📊 Fraud Prevention Analytics")
@@ -226,8 +447,10 @@ confidence_threshold: 0.85
         
         with col2:
             # Cost savings by category
-            categories = ['Payment Fraud', 'Account Fraud', 'Product Fraud', 'Other']
-            savings = [1.2, 0.8, 0.3, 0.1]
+            by_fraud_type = ledger.breakdown('savings', 'fraud_type', grain='month', periods=ledger.latest_periods('month', 12))
+            by_fraud_type = dict(sorted(by_fraud_type.items(), key=lambda item: item[1], reverse=True))
+            categories = list(by_fraud_type)
+            savings = [round(amount / 1e6, 2) for amount in by_fraud_type.values()]
             
             fig_savings = px.bar(
                 x=categories,
@@ -238,14 +461,61 @@ confidence_threshold: 0.85
             )
             st.plotly_chart(fig_savings, use_container_width=True)
         
+        # Threshold tuning over cached precision/recall/FPR curves
+        st.markdown("#### 🎚️ Threshold Tuning")
+        sweep = load_threshold_sweep()
+        
+        col1, col2, col3 = st.columns(3)
+        with col1:
+            tuned_strategy = st.selectbox("Strategy", sweep.strategies)
+        with col2:
+            tuned_segment = st.selectbox("Segment", [ALL_SEGMENTS] + sweep.segment_names)
+        with col3:
+            fpr_target = st.number_input("FPR Target (%)", 0.1, 50.0, FPR_TARGET * 100, step=0.5) / 100
+        
+        curve = sweep.curve(tuned_strategy, tuned_segment)
+        suggested = min(curve.threshold_for_fpr(fpr_target), 1.0)
+        # Round up to the slider step so the default stays within the target
+        threshold = st.slider("Decision Threshold", 0.0, 1.0, float(min(np.ceil(suggested * 1000) / 1000, 1.0)), step=0.001, format="%.3f",
+                              key=f"threshold_{tuned_strategy}_{tuned_segment}_{fpr_target}")
+        tuned = curve.at(threshold)
+        
+        col1, col2, col3, col4, col5 = st.columns(5)
+        with col1:
+            st.metric("Precision", f"{tuned['precision']:.1%}")
+        with col2:
+            st.metric("Recall", f"{tuned['recall']:.1%}")
+        with col3:
+            st.metric("False Positive Rate", f"{tuned['fpr']:.2%}",
+                      f"{(tuned['fpr'] - fpr_target) * 100:+.2f} pts vs target", delta_color="inverse")
+        with col4:
+            st.metric("Sellers Flagged", f"{tuned['flagged']:,}")
+        with col5:
+            st.metric("Expected Cost", f"${tuned['cost'] / 1e3:,.0f}K")
+        st.caption(f"FPR target {fpr_target:.1%} → threshold {suggested:.3f}; "
+                   f"{sweep.rows[tuned_strategy]:,} scored sellers, {len(curve.thresholds):,} distinct thresholds")
+        
+        points = curve.sample()
+        curve_df = pd.DataFrame({
+            'Threshold': curve.thresholds[points],
+            'Precision': curve.precision[points],
+            'Recall': curve.recall[points],
+            'FPR': curve.fpr[points]
+        }).melt(id_vars='Threshold', var_name='Metric', value_name='Rate')
+        fig_curve = px.line(curve_df, x='Threshold', y='Rate', color='Metric',
+                            title=f"{tuned_strategy} — {tuned_segment}")
+        fig_curve.add_vline(x=threshold, line_dash="dash", line_color="#6b7280")
+        st.plotly_chart(fig_curve, use_container_width=True)
+        
         # Performance summary
         st.markdown("#### 🎯 Performance Summary")
+        deployed = sweep.at('Fraud Model', CONFIDENCE_THRESHOLD)
         
         col1, col2, col3, col4 = st.columns(4)
         
         with col1:
             st.markdown("**False Positive Rate**")
-            st.markdown("2.3% (Target: <5%)")
+            st.markdown(f"{deployed['fpr']:.2%} (Target: <{FPR_TARGET:.0%})")
         
         with col2:
             st.markdown("**Detection Speed**")
@@ -263,19 +533,43 @@ confidence_threshold: 0.85
     st.markdown("---")
     st.markdown("### 🚨 Emergency Actions")
     
+    # Actions apply to explicit seller IDs or to every live event matching a strategy
+    col1, col2 = st.columns(2)
+    with col1:
+        target_ids = st.text_area("Seller IDs", placeholder="S12847, S98234 ... (one per line or comma-separated)", height=80)
+    with col2:
+        min_level = st.selectbox("Or all live events at risk level ≥", ["—"] + RISK_LEVEL_ORDER, index=3)
+        action_reason = st.text_input("Reason", value="Emergency response")
+    
+    targets = [s.strip() for s in target_ids.replace(',', '\n').split('\n') if s.strip()]
+    if not targets and min_level != "—":
+        targets = sellers_matching(fraud_events, min_risk_level=min_level)
+    st.caption(f"{len(targets):,} seller(s) targeted")
+    
     col1, col2, col3, col4 = st.columns(4)
     
     with col1:
         if st.button("🛑 Block Seller", use_container_width=True):
-            st.error("Seller blocking interface opened!")
+            result = apply_seller_action('block', targets, action_reason)
+            if result:
+                st.error(f"Blocked {result['sellers']:,} seller(s) in {result['seconds'] * 1000:.0f}ms")
     
     with col2:
         if st.button("📢 Send Alert", use_container_width=True):
-            st.warning("Alert notification sent!")
+            result = apply_seller_action('alert', targets, action_reason)
+            if result:
+                st.warning(f"Alert sent for {result['sellers']:,} seller(s)")
     
     with col3:
         if st.button("🔍 Manual Review", use_container_width=True):
-            st.info("Case escalated for manual review!")
+            result = apply_seller_action('escalate', targets, action_reason)
+            if result:
+                events_by_seller = {event['seller_id']: event for event in fraud_events}
+                for seller_id in targets:
+                    event = events_by_seller.get(seller_id, {})
+                    load_review_queues().submit(seller_id, event.get('risk_score', 0.5), event.get('reason'),
+                                                source='emergency')
+                st.info(f"{result['sellers']:,} seller(s) escalated for manual review")
     
     with col4:
         if st.button("📊 Generate Report", use_container_width=True):
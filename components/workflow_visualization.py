@@ -1,6 +1,62 @@
 import streamlit as st
+import os
+import tempfile
 import time
-from utils.mock_data import get_deployment_flows
+from utils.mock_data import get_deployment_flows, generate_flow_run_history, generate_iam_policies
+from utils.flow_executor import FlowExecutor, apply_flow_run, format_duration, simulate_subtask
+from utils.flow_stats import FlowRunLog, record_flow_run
+from utils.deployment_scheduler import submit_flow_deployment
+from utils.log_viewer import append_log_line
+from utils.audit_log import AuditLog, verify_audit_log
+from utils.policy_engine import PolicyEngine
+from components.log_panel import load_log_file, render_log_panel
+
+@st.cache_resource
+def load_audit_log():
+    """Process-wide audit trail shared by every session"""
+    path = os.environ.get('AUDIT_LOG_PATH') or os.path.join(tempfile.gettempdir(), 'seller-risk-audit', 'audit.log')
+    return AuditLog(path)
+
+# Permission checks behind the authorization sub-tasks of cross-project flows
+PERMISSION_CHECKS = {
+    'Check IAM policies': [
+        ('sa-element-deployer', 'model:export', 'projects/element-risk/models/seller-risk'),
+        ('sa-element-deployer', 'model:import', 'projects/element-payments/models/seller-risk')
+    ],
+    'Validate project permissions': [
+        ('sa-element-deployer', 'feature:read', 'projects/element-risk/features/seller-profile'),
+        ('sa-element-deployer', 'model:deploy', 'projects/element-payments/models/seller-risk')
+    ]
+}
+
+@st.cache_resource
+def load_policy_engine():
+    """Compiled IAM policies shared by every session"""
+    return PolicyEngine(generate_iam_policies())
+
+def run_flow_task(task):
+    """Sub-task runner that evaluates real permission checks for authorization tasks"""
+    checks = PERMISSION_CHECKS.get(task['detail'])
+    if not checks:
+        return simulate_subtask(task)
+    engine = load_policy_engine()
+    for principal, action, resource in checks:
+        engine.check(principal, action, resource)
+    return f"{task['detail']} done ({len(checks)} checks passed)"
+
+def audit_flow_run(audit_log, flow, run_summary, actor='flow-executor'):
+    """Record every executed sub-task of a flow run in the audit trail"""
+    for step in flow['steps']:
+        measured = run_summary.get(step['id'])
+        if not measured:
+            continue
+        for detail, task in zip(step.get('details', []), measured['tasks']):
+            audit_log.append(actor, 'flow.task', f"{flow['id']}/{step['id']}", {
+                'task': detail,
+                'status': task['status'],
+                'attempts': task['attempts'],
+                'error': task['error']
+            })
 
 def render_workflow_step(step, index, is_current=False):
     """Render a workflow step with status styling"""
@@ -14,6 +70,11 @@ def render_workflow_step(step, index, is_current=False):
     style = status_styles.get(step['status'], status_styles['pending'])
     border_style = "border: 2px solid #004c91;" if is_current else ""
     
+    # Measured runs carry real timestamps; fall back to the configured duration
+    timing = step.get('duration', '')
+    if step.get('started_at') and step.get('finished_at'):
+        timing = f"{step['started_at']:%H:%M:%S} → {step['finished_at']:%H:%M:%S} ({step['duration']})"
+    
     st.markdown(f"""
         <div style="background: {style['bg']}; border-left: 4px solid {style['color']}; padding: 1rem; margin: 0.5rem 0; border-radius: 8px; {border_style}">
             <div style="display: flex; align-items: center; justify-content: space-between; margin-bottom: 0.5rem;">
@@ -21,7 +82,7 @@ def render_workflow_step(step, index, is_current=False):
                     <span style="font-size: 1.2rem;">{style['icon']}</span>
                     <strong style="color: {style['color']};">{step['title']}</strong>
                 </div>
-                {f"<span style='color: #666; font-size: 0.9rem;'>{step.get('duration', '')}</span>" if step.get('duration') else ""}
+                {f"<span style='color: #666; font-size: 0.9rem;'>{timing}</span>" if timing else ""}
             </div>
             <p style="margin: 0.5rem 0; color: #333;">{step['description']}</p>
             <div style="margin-top: 0.5rem;">
@@ -41,9 +102,7 @@ def render_workflow_visualization():
     col1, col2, col3, col4 = st.columns([1, 1, 1, 1])
     
     with col1:
-        if st.button("▶️ Simulate Flow"):
-            st.session_state.simulation_running = True
-            st.session_state.current_step = 0
+        simulate_clicked = st.button("▶️ Simulate Flow")
     
     with col2:
         if st.button("⏸️ Pause"):
@@ -53,6 +112,7 @@ def render_workflow_visualization():
         if st.button("🔄 Reset"):
             st.session_state.simulation_running = False
             st.session_state.current_step = 0
+            st.session_state.flow_runs = {}
     
     with col4:
         if st.button("📊 View Stats"):
@@ -65,6 +125,14 @@ def render_workflow_visualization():
         st.session_state.simulation_running = False
     if 'current_step' not in st.session_state:
         st.session_state.current_step = 0
+    if 'flow_runs' not in st.session_state:
+        st.session_state.flow_runs = {}
+    if 'flow_executor' not in st.session_state:
+        st.session_state.flow_executor = FlowExecutor(max_workers=4, task_timeout=5.0, max_retries=2, task_runner=run_flow_task)
+    if 'flow_run_log' not in st.session_state:
+        st.session_state.flow_run_log = FlowRunLog()
+        for run in generate_flow_run_history():
+            st.session_state.flow_run_log.append(run['flow_id'], run['duration_s'], run['success'], run['finished_at'])
     
     st.markdown("---")
     
@@ -90,12 +158,37 @@ def render_workflow_visualization():
     # Get selected flow
     selected_flow = next((f for f in flows if f['id'] == st.session_state.selected_flow), flows[0])
     
+    # Execute the flow DAG and keep the measured step timings
+    if simulate_clicked:
+        with st.spinner(f"Executing {selected_flow['name']}..."):
+            st.session_state.flow_runs[selected_flow['id']] = st.session_state.flow_executor.run_flow(selected_flow)
+        record_flow_run(st.session_state.flow_run_log, selected_flow['id'], st.session_state.flow_runs[selected_flow['id']])
+        audit_flow_run(load_audit_log(), selected_flow, st.session_state.flow_runs[selected_flow['id']])
+        st.session_state.simulation_running = True
+        st.session_state.current_step = 0
+    
+    if selected_flow['id'] in st.session_state.flow_runs:
+        selected_flow = apply_flow_run(selected_flow, st.session_state.flow_runs[selected_flow['id']])
+    
     st.markdown("---")
     
     # Flow Details
     st.markdown(f"### {selected_flow['icon']} {selected_flow['name']}")
     st.markdown(selected_flow['description'])
     
+    # Flows with an audit step can check the trail's hash chain on demand
+    if any('Audit trail logging' in step.get('details', []) for step in selected_flow['steps']):
+        if st.button("🔏 Verify Audit Trail"):
+            audit_log = load_audit_log()
+            audit_log.flush()
+            with st.spinner("Verifying audit trail..."):
+                result = verify_audit_log(audit_log.path)
+            if result['valid']:
+                st.success(f"Audit trail intact: {result['records']:,} records verified in {result['seconds']:.2f}s")
+            else:
+                line_number, reason = result['error']
+                st.error(f"Audit trail verification failed at line {line_number:,}: {reason}")
+    
     # Workflow Steps
     st.markdown("#### Workflow Steps")
     
@@ -134,9 +227,10 @@ def render_workflow_visualization():
     
     with col1:
         st.markdown("#### 📊 Flow Performance")
-        st.metric("Average Duration", "8m 32s")
-        st.metric("Success Rate", "97.3%", "0.2%")
-        st.metric("Deployments Today", "23", "+5")
+        overall = st.session_state.flow_run_log.overall.summary()
+        st.metric("Average Duration", format_duration(overall['avg_duration']))
+        st.metric("Success Rate", f"{overall['success_rate']:.1%}")
+        st.metric("Deployments Today", str(overall['runs_today']))
     
     with col2:
         st.markdown("#### 🏥 Current Status")
@@ -158,11 +252,27 @@ def render_workflow_visualization():
     with col3:
         st.markdown("#### ⚡ Next Actions")
         if st.button("🚀 Deploy to Production", use_container_width=True):
-            st.success("Production deployment initiated!")
+            try:
+                request = submit_flow_deployment(st.session_state.deployment_scheduler, selected_flow, priority='high')
+            except ValueError as e:
+                st.error(str(e))
+            else:
+                load_audit_log().append('workflow-ui', 'deployment.submit', selected_flow['id'],
+                                        {'request_id': request['id'], 'priority': 'high', 'status': request['status']})
+                # Open (and seed) the log before appending so the sample history is not skipped
+                append_log_line(load_log_file('deployments').path, 'INFO', 'deployer',
+                                f"Production deployment {request['id']} of {selected_flow['id']} {request['status']}")
+                if request['status'] == 'running':
+                    st.success(f"Production deployment {request['id']} started!")
+                else:
+                    st.info(f"Production deployment {request['id']} queued — waiting for capacity")
         if st.button("🧪 Run A/B Test", use_container_width=True):
             st.info("A/B test configuration started!")
         if st.button("📋 View Logs", use_container_width=True):
-            st.info("Opening deployment logs...")
+            st.session_state.show_deployment_logs = not st.session_state.get('show_deployment_logs', False)
+
+    if st.session_state.get('show_deployment_logs'):
+        render_log_panel('deployments', "Deployment Logs")
     
     # Flow Comparison Table
     st.markdown("---")
@@ -170,12 +280,14 @@ def render_workflow_visualization():
     
     comparison_data = []
     for flow in flows:
+        stats = st.session_state.flow_run_log.stats(flow['id']).summary()
         comparison_data.append({
             'Flow': flow['name'],
             'Icon': flow['icon'],
-            'Avg Duration': '8m 32s' if flow['id'] == 'flow1' else '12m 15s' if flow['id'] == 'flow2' else '6m 45s' if flow['id'] == 'flow3' else '15m 20s',
-            'Success Rate': '97.3%' if flow['id'] == 'flow1' else '94.8%' if flow['id'] == 'flow2' else '98.9%' if flow['id'] == 'flow3' else '92.1%',
-            'Complexity': 'Medium' if flow['id'] == 'flow1' else 'High' if flow['id'] == 'flow2' else 'Low' if flow['id'] == 'flow3' else 'High'
+            'Avg Duration': format_duration(stats['avg_duration']),
+            'Percentiles': f"p50 {format_duration(stats['p50'])} · p95 {format_duration(stats['p95'])}",
+            'Success Rate': f"{stats['success_rate'] * 100:.1f}%",
+            'Complexity': flow['complexity']
         })
     
     # Display comparison table
@@ -190,6 +302,7 @@ def render_workflow_visualization():
         
         with col3:
             st.markdown(data['Avg Duration'])
+            st.caption(data['Percentiles'])
         
         with col4:
             success_rate = float(data['Success Rate'].replace('%', ''))
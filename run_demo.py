@@ -9,7 +9,13 @@ It provides an easy way to start the application with proper configuration and h
 
 import os
 import sys
+import argparse
+import importlib.util
+import itertools
+import socket
 import subprocess
+import threading
+import urllib.request
 import webbrowser
 import time
 from pathlib import Path
@@ -45,11 +51,12 @@ def check_dependencies():
     
     missing_packages = []
     
+    # Locate packages without importing them; importing streamlit/pandas
+    # just to test for presence costs seconds of startup
     for package in required_packages:
-        try:
-            __import__(package)
+        if importlib.util.find_spec(package) is not None:
             print(f"✅ {package}: Installed")
-        except ImportError:
+        else:
             missing_packages.append(package)
             print(f"❌ {package}: Missing")
     
@@ -98,35 +105,173 @@ def print_demo_info():
     """
     print(info)
 
-def launch_streamlit():
+def start_streamlit_worker(port, env=None):
+    """Start one Streamlit server process on the given port"""
+    return subprocess.Popen([
+        sys.executable, '-m', 'streamlit', 'run', 'app.py',
+        f'--server.port={port}',
+        '--server.address=localhost',
+        '--server.headless=true',
+        '--browser.gatherUsageStats=false'
+    ], env=env)
+
+def wait_until_ready(port, process, timeout=60):
+    """Poll the Streamlit health endpoint until the server answers"""
+    url = f"http://localhost:{port}/_stcore/health"
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if process.poll() is not None:
+            return False
+        try:
+            with urllib.request.urlopen(url, timeout=1) as response:
+                if response.status == 200:
+                    return True
+        except OSError:
+            pass
+        time.sleep(0.25)
+    return False
+
+def _pipe(source, destination):
+    """Copy bytes from one socket to another until either side closes"""
+    try:
+        while True:
+            data = source.recv(65536)
+            if not data:
+                break
+            destination.sendall(data)
+    except OSError:
+        pass
+    finally:
+        for sock in (source, destination):
+            try:
+                sock.shutdown(socket.SHUT_RDWR)
+            except OSError:
+                pass
+
+def run_proxy(front_port, backend_ports):
+    """Round-robin TCP proxy spreading connections over the worker ports.
+
+    Streamlit keeps each session on a single websocket connection, so
+    balancing per connection keeps every session pinned to one worker.
+    """
+    listener = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+    listener.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+    listener.bind(('localhost', front_port))
+    listener.listen(128)
+    backends = itertools.cycle(backend_ports)
+
+    def serve():
+        while True:
+            try:
+                client, _ = listener.accept()
+            except OSError:
+                break
+            try:
+                upstream = socket.create_connection(('localhost', next(backends)))
+            except OSError:
+                client.close()
+                continue
+            threading.Thread(target=_pipe, args=(client, upstream), daemon=True).start()
+            threading.Thread(target=_pipe, args=(upstream, client), daemon=True).start()
+
+    threading.Thread(target=serve, daemon=True).start()
+    return listener
+
+def publish_metrics(shared, stop_event, interval=3):
+    """Refresh the shared metrics block so every worker shows the same data"""
+    from utils.mock_data import generate_mock_metrics
+
+    while not stop_event.is_set():
+        shared.write(generate_mock_metrics())
+        stop_event.wait(interval)
+
+def launch_streamlit(port=8501):
     """Launch the Streamlit application"""
     print("🚀 Starting Streamlit application...")
-    print("   URL: http://localhost:8501")
+    print(f"   URL: http://localhost:{port}")
     print("   Press Ctrl+C to stop the server")
-    print("   The browser will open automatically in 3 seconds...")
+    print("   The browser will open as soon as the server is ready...")
     
     # Start Streamlit in a subprocess
+    process = None
     try:
-        # Wait a moment then open browser
-        time.sleep(3)
-        webbrowser.open('http://localhost:8501')
+        process = start_streamlit_worker(port)
+        
+        if wait_until_ready(port, process):
+            webbrowser.open(f'http://localhost:{port}')
+        else:
+            print("⚠️  Streamlit did not report ready; open the URL manually once it starts")
         
-        # Start Streamlit
-        subprocess.run([
-            sys.executable, '-m', 'streamlit', 'run', 'app.py',
-            '--server.port=8501',
-            '--server.address=localhost',
-            '--browser.gatherUsageStats=false'
-        ])
+        process.wait()
         
     except KeyboardInterrupt:
         print("\n\n👋 Demo stopped. Thank you for exploring the Seller Risk MLOps Platform!")
     except Exception as e:
         print(f"\n❌ Error starting Streamlit: {e}")
         print("   Try running manually: streamlit run app.py")
+    finally:
+        if process is not None and process.poll() is None:
+            process.terminate()
+
+def launch_workers(num_workers, port=8501):
+    """Launch several Streamlit workers behind a local round-robin proxy"""
+    from utils.shared_metrics import SharedMetrics, ENV_VAR
+
+    backend_ports = [port + 1 + i for i in range(num_workers)]
+    print(f"🚀 Starting {num_workers} Streamlit workers on ports {backend_ports[0]}-{backend_ports[-1]}...")
+    print(f"   URL: http://localhost:{port}")
+    print("   Press Ctrl+C to stop the servers")
+    
+    shared = SharedMetrics.create()
+    stop_event = threading.Event()
+    threading.Thread(target=publish_metrics, args=(shared, stop_event), daemon=True).start()
+    
+    env = dict(os.environ, **{ENV_VAR: shared.name})
+    processes = []
+    listener = None
+    try:
+        processes = [start_streamlit_worker(worker_port, env) for worker_port in backend_ports]
+        
+        ready = [wait_until_ready(worker_port, process) for worker_port, process in zip(backend_ports, processes)]
+        for worker_port, is_ready in zip(backend_ports, ready):
+            print(f"{'✅' if is_ready else '❌'} Worker on port {worker_port}: {'Ready' if is_ready else 'Not responding'}")
+        live_ports = [worker_port for worker_port, is_ready in zip(backend_ports, ready) if is_ready]
+        if not live_ports:
+            print("❌ No workers became ready. Try running manually: streamlit run app.py")
+            return
+        
+        listener = run_proxy(port, live_ports)
+        webbrowser.open(f'http://localhost:{port}')
+        
+        for process in processes:
+            process.wait()
+        
+    except KeyboardInterrupt:
+        print("\n\n👋 Demo stopped. Thank you for exploring the Seller Risk MLOps Platform!")
+    except Exception as e:
+        print(f"\n❌ Error starting Streamlit workers: {e}")
+        print("   Try running manually: streamlit run app.py")
+    finally:
+        stop_event.set()
+        if listener is not None:
+            listener.close()
+        for process in processes:
+            if process.poll() is None:
+                process.terminate()
+        shared.close()
+
+def parse_args():
+    """Parse launcher command-line options"""
+    parser = argparse.ArgumentParser(description="Launch the Seller Risk MLOps Platform demo")
+    parser.add_argument('--workers', type=int, default=1,
+                        help="number of Streamlit worker processes (default: 1)")
+    parser.add_argument('--port', type=int, default=8501,
+                        help="port to serve the demo on (default: 8501)")
+    return parser.parse_args()
 
 def main():
     """Main demo launcher function"""
+    args = parse_args()
     print_banner()
     
     # Check system requirements
@@ -151,7 +296,10 @@ def main():
     input("\n🎬 Press Enter to start the demo (or Ctrl+C to cancel)...")
     
     # Launch the application
-    launch_streamlit()
+    if args.workers > 1:
+        launch_workers(args.workers, args.port)
+    else:
+        launch_streamlit(args.port)
 
 if __name__ == "__main__":
     try:
@@ -0,0 +1,37 @@
+from utils.audit_log import AuditLog, verify_audit_log
+
+def _write_records(path, n):
+    log = AuditLog(path, fsync=False)
+    for i in range(n):
+        log.append('analyst', 'block', f'S{10000 + i}')
+    log.close()
+
+def test_reopen_after_torn_lines(tmp_path):
+    path = str(tmp_path / 'audit.log')
+    _write_records(path, 5)
+    with open(path, 'ab') as f:
+        f.write(b'{"action":"blo\n\x00\x00\x00\n{"act')
+
+    log = AuditLog(path, fsync=False)
+    assert log.append('analyst', 'alert', 'S20000', wait=True) == 6
+    log.close()
+    result = verify_audit_log(path)
+    assert result['valid'] and result['records'] == 6
+
+def test_verification_errors_report_line_numbers(tmp_path):
+    path = str(tmp_path / 'audit.log')
+    _write_records(path, 40)
+    with open(path, 'rb') as f:
+        lines = f.readlines()
+
+    tampered = list(lines)
+    tampered[29] = tampered[29].replace(b'S10029', b'S99999')
+    with open(path, 'wb') as f:
+        f.writelines(tampered)
+    assert verify_audit_log(path, chunk_bytes=1024)['error'] == (30, "hash mismatch")
+
+    tampered = list(lines)
+    tampered[0] = b'not json\n'
+    with open(path, 'wb') as f:
+        f.writelines(tampered)
+    assert verify_audit_log(path)['error'] == (1, "unparseable record")
@@ -0,0 +1,18 @@
+from utils.deployment_scheduler import DeploymentScheduler
+
+def test_lowered_quota_rejects_queued_requests_that_no_longer_fit():
+    now = [0.0]
+    scheduler = DeploymentScheduler(cpu_quota=8, memory_quota_gb=16, clock=lambda: now[0])
+    running = scheduler.submit('seller-risk', 'flow-a', cpu=8, memory_gb=8, duration_s=60)
+    large = scheduler.submit('seller-risk', 'flow-b', cpu=6, memory_gb=4, duration_s=60, priority='high')
+    small = scheduler.submit('seller-risk', 'flow-c', cpu=2, memory_gb=2, duration_s=60)
+    assert (large['status'], small['status']) == ('queued', 'queued')
+
+    admitted, rejected = scheduler.set_quotas(cpu_quota=4, memory_quota_gb=8)
+    assert admitted == [] and rejected == [large]
+    assert large['status'] == 'rejected'
+
+    now[0] = 60.0
+    scheduler.advance()
+    assert running['status'] == 'completed'
+    assert small['status'] == 'running'
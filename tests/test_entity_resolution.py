@@ -0,0 +1,19 @@
+from utils.entity_resolution import EntityResolver, encode_profiles
+
+STORE = "Golden Deals Emporium 412 | Maria Garcia-Hernandez | "
+
+def test_long_profiles_are_shingled_past_the_address():
+    texts = [
+        STORE + "Apartment 1204, 7781 North Riverside Boulevard, Springfield, Illinois 62704, United States",
+        STORE + "Unit 3, 15 Harbor Station Road, Newport Beach, California 92660, United States",
+        STORE + "Apartment 1204, 7781 North Riverside Boulevard, Springfield, Illinois 62704, United States",
+    ]
+    codes, lengths, truncated = encode_profiles(texts)
+    assert truncated == 0 and lengths.max() > 64 and codes.shape[1] == lengths.max()
+
+    result = EntityResolver(workers=1, threshold=0.8).resolve(texts)
+    assert set(zip(result['first'].tolist(), result['second'].tolist())) == {(0, 2)}
+
+def test_truncation_is_counted():
+    _, lengths, truncated = encode_profiles(["a" * 300, "short profile"], max_width=100)
+    assert truncated == 1 and lengths.tolist() == [100, 13]
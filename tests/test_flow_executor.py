@@ -0,0 +1,16 @@
+import time
+from utils.flow_executor import FlowExecutor
+
+def test_timed_out_attempt_does_not_delay_other_tasks():
+    def runner(task):
+        time.sleep(0.6 if task['detail'] == 'hang' else 0.1)
+        return 'done'
+    dag = {
+        task_id: {'id': task_id, 'step_id': 'deploy', 'detail': detail, 'deps': []}
+        for task_id, detail in [('a', 'hang'), ('b', 'work'), ('c', 'work')]
+    }
+
+    results = FlowExecutor(max_workers=1, task_timeout=0.3, max_retries=0, task_runner=runner).run_dag(dag)
+    assert results['a']['status'] == 'failed'
+    assert results['a']['error'] == 'timed out after 0.3s'
+    assert results['b']['status'] == 'completed' and results['c']['status'] == 'completed'
@@ -0,0 +1,35 @@
+import ipaddress
+import numpy as np
+from utils.geo_risk import GeoRiskResolver, build_geo_database, build_sample_geo_database, is_valid_ip, unmap_ipv4
+
+def test_unmap_ipv4():
+    assert unmap_ipv4(ipaddress.ip_address('::ffff:203.0.113.7')) == ipaddress.ip_address('203.0.113.7')
+    assert unmap_ipv4(ipaddress.ip_address('::ffff:cb00:7107')) == ipaddress.ip_address('203.0.113.7')
+    assert unmap_ipv4(ipaddress.ip_address('203.0.113.7')) == ipaddress.ip_address('203.0.113.7')
+    assert unmap_ipv4(ipaddress.ip_address('2001:db8::1')) == ipaddress.ip_address('2001:db8::1')
+
+def test_is_valid_ip():
+    for address in ['203.0.113.7', '2001:db8::1', '::ffff:203.0.113.7', '::']:
+        assert is_valid_ip(address), address
+    for address in ['', 'not an ip', '256.1.1.1', '01.2.3.4', '1.2.3', '1::2::3', '12345::']:
+        assert not is_valid_ip(address), address
+
+def test_ipv4_mapped_addresses_use_the_ipv4_table(tmp_path):
+    build_geo_database([('203.0.113.0/24', 'XX'), ('2001:db8::/32', 'YY')], {'XX': 0.9, 'YY': 0.1}, str(tmp_path))
+    resolver = GeoRiskResolver(str(tmp_path))
+    scores = resolver.lookup_ips(['203.0.113.7', '::ffff:203.0.113.7', '2001:db8::1', 'bogus'])
+    np.testing.assert_allclose(scores, [0.9, 0.9, 0.1, 0.5], rtol=1e-6)
+
+def test_sample_ipv6_ranges_stay_exact_near_the_top_of_the_space(tmp_path):
+    build_sample_geo_database(str(tmp_path), {'AA': 0.1, 'BB': 0.5, 'CC': 0.9}, n_ranges=20_000)
+    resolver = GeoRiskResolver(str(tmp_path))
+    starts, ends, countries = (np.asarray(table) for table in resolver.tables[6])
+    assert (starts[1:] > ends[:-1]).all()
+
+    # Probe the last few ranges, whose bounds are beyond float64 precision
+    addresses, expected = [], []
+    for start, end, country in zip(starts[-50:], ends[-50:], countries[-50:]):
+        for prefix in (int(start), int(end)):
+            addresses.append(str(ipaddress.IPv6Address(prefix << 64)))
+            expected.append(resolver.scores[country])
+    np.testing.assert_allclose(resolver.lookup_ips(addresses), expected, rtol=1e-6)
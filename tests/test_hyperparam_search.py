@@ -0,0 +1,34 @@
+import threading
+import pytest
+from utils.hyperparam_search import HyperparameterSearch
+
+def test_setup_failure_marks_background_search_failed(monkeypatch):
+    search = HyperparameterSearch(n_configs=3, workers=1, n_train=100, n_val=50, seed=0)
+    def broken():
+        raise MemoryError("cannot allocate training data")
+    monkeypatch.setattr(search, '_prepare_data', broken)
+
+    search.start().thread.join(timeout=10)
+    assert search.status == 'failed'
+    assert search.error == "cannot allocate training data"
+    assert search.finished_at is not None
+
+def test_only_one_background_search_runs_at_a_time(monkeypatch):
+    release = threading.Event()
+    first = HyperparameterSearch(n_configs=3, workers=1, n_train=100, n_val=50, seed=0)
+    def blocked():
+        release.wait(10)
+        raise RuntimeError("stopped by test")
+    monkeypatch.setattr(first, '_prepare_data', blocked)
+    first.start()
+
+    second = HyperparameterSearch(n_configs=3, workers=1, n_train=100, n_val=50, seed=0)
+    assert second.search_id != first.search_id
+    with pytest.raises(RuntimeError, match="still running"):
+        second.start()
+
+    release.set()
+    first.thread.join(timeout=10)
+    monkeypatch.setattr(second, '_prepare_data', blocked)
+    second.start().thread.join(timeout=10)
+    assert second.status == 'failed'
@@ -0,0 +1,15 @@
+import threading
+import pytest
+from utils import ingestion
+
+def test_writer_failure_stops_the_producer(tmp_path, monkeypatch):
+    path = str(tmp_path / 'transactions.csv')
+    ingestion.generate_sample_transactions(path, 5_000)
+    def failing_write(*args):
+        raise OSError("disk full")
+    monkeypatch.setattr(ingestion, 'write_partitions', failing_write)
+
+    threads_before = set(threading.enumerate())
+    with pytest.raises(OSError, match="disk full"):
+        ingestion.run_ingestion([path], str(tmp_path / 'out'), chunk_size=100, queue_size=1)
+    assert set(threading.enumerate()) <= threads_before
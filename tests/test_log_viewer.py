@@ -0,0 +1,52 @@
+import threading
+from datetime import datetime
+from utils.log_viewer import LogFile, append_log_line
+
+def test_search_anchors_match_at_every_line(tmp_path):
+    path = str(tmp_path / 'logs' / 'deployments.log')
+    when = datetime(2024, 5, 1, 12, 0, 0)
+    append_log_line(path, 'INFO', 'deployer', 'first ok', when)
+    append_log_line(path, 'ERROR', 'deployer', 'second failed', when)
+    append_log_line(path, 'INFO', 'deployer', 'third failed', when)
+    log = LogFile(path)
+    try:
+        assert log.search(r'^2024-05-01 12:00:00 ERROR') == ['2024-05-01 12:00:00 ERROR [deployer] second failed']
+        assert [line.split('] ')[1] for line in log.search(r'failed$')] == ['second failed', 'third failed']
+    finally:
+        log.close()
+
+def test_search_returns_the_newest_matches(tmp_path):
+    path = str(tmp_path / 'system.log')
+    for i in range(500):
+        append_log_line(path, 'ERROR' if i % 3 == 0 else 'INFO', 'gateway', f'event {i}', datetime(2024, 5, 1, 12, 0, i % 60))
+    log = LogFile(path, search_chunk=1024)
+    try:
+        assert [line.split('] ')[1] for line in log.search('ERROR', limit=3)] == ['event 492', 'event 495', 'event 498']
+        assert [line.split('] ')[1] for line in log.search(limit=2)] == ['event 498', 'event 499']
+        assert len(log.search('ERROR', limit=1000)) == 167
+    finally:
+        log.close()
+
+def test_shared_log_survives_concurrent_remaps(tmp_path):
+    path = str(tmp_path / 'system.log')
+    append_log_line(path, 'INFO', 'deployer', 'start')
+    log = LogFile(path)
+    errors = []
+
+    def read():
+        try:
+            for _ in range(200):
+                log.tail(20)
+                log.search('deployer', limit=20)
+        except Exception as e:
+            errors.append(e)
+
+    readers = [threading.Thread(target=read) for _ in range(4)]
+    for reader in readers:
+        reader.start()
+    for i in range(500):
+        append_log_line(path, 'INFO', 'deployer', f'step {i}')
+    for reader in readers:
+        reader.join()
+    log.close()
+    assert errors == []
@@ -0,0 +1,25 @@
+import os
+import numpy as np
+from utils.metric_store import MetricStore
+
+def test_torn_index_lines_do_not_swallow_later_writes(tmp_path):
+    path = str(tmp_path)
+    store = MetricStore(path, flush_points=2)
+    store.log_run('run-1', name='baseline')
+    store.log_many('run-1', 'loss', [1, 2], [0.5, 0.4])
+
+    # Simulate a crash in the middle of appending both index files
+    with open(os.path.join(path, 'segments.jsonl'), 'a') as f:
+        f.write('{"run_id": "run-1", "met')
+    with open(os.path.join(path, 'runs.jsonl'), 'a') as f:
+        f.write('{"run_id": "run-')
+
+    store = MetricStore(path, flush_points=2)
+    store.log_run('run-2', name='challenger')
+    store.log_many('run-1', 'loss', [3, 4], [0.3, 0.2])
+
+    store = MetricStore(path, flush_points=2)
+    steps, values = store.series('run-1', 'loss')
+    assert steps.tolist() == [1, 2, 3, 4]
+    np.testing.assert_allclose(values, [0.5, 0.4, 0.3, 0.2], rtol=1e-6)
+    assert sorted(store.runs) == ['run-1', 'run-2']
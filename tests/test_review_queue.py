@@ -0,0 +1,25 @@
+import threading
+from utils.review_queue import ReviewQueues
+
+def test_concurrent_submits_of_one_case_open_it_once():
+    queues = ReviewQueues()
+    results, errors = [], []
+    barrier = threading.Barrier(8)
+
+    def submit(score):
+        barrier.wait()
+        try:
+            results.append(queues.submit('S12847', score, 'Multiple account flags'))
+        except Exception as e:
+            errors.append(e)
+
+    threads = [threading.Thread(target=submit, args=((50 + i) / 100,)) for i in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert errors == []
+    assert sum(created for _, _, created in results) == 1
+    assert queues.case_teams == {'S12847': 'trust'}
+    assert queues.queues['trust'].cases['S12847']['risk_score'] == 0.57
@@ -0,0 +1,138 @@
+import time
+from collections import deque
+import numpy as np
+
+THRESHOLD = 0
+RATE_OF_CHANGE = 1
+
+SEVERITIES = ['info', 'warning', 'critical']
+
+class AlertEngine:
+    """Evaluate threshold and rate-of-change rules against a metrics stream.
+
+    Rules are stored column-wise in NumPy arrays so each tick is a handful of
+    vector operations regardless of how many rules are registered. Only rules
+    that actually fire are touched individually, for deduplication and to
+    build the alert records.
+    """
+
+    def __init__(self, metric_names, max_recent=50):
+        self.metric_index = {name: i for i, name in enumerate(metric_names)}
+        self.metric_names = list(metric_names)
+        self.rules = []
+
+        self.rule_metric = np.empty(0, dtype=np.int64)
+        self.rule_kind = np.empty(0, dtype=np.int8)
+        self.rule_sign = np.empty(0, dtype=np.float64)
+        self.rule_threshold = np.empty(0, dtype=np.float64)
+        self.rule_cooldown = np.empty(0, dtype=np.float64)
+        self.rule_rate = np.empty(0, dtype=np.float64)
+        self.rule_burst = np.empty(0, dtype=np.float64)
+        self.last_fired = np.empty(0, dtype=np.float64)
+        self.tokens = np.empty(0, dtype=np.float64)
+
+        self.previous_values = None
+        self.previous_time = None
+        self.last_tick = None
+        self.active = {}  # fingerprint -> alert
+        self.recent = deque(maxlen=max_recent)
+
+    def add_rules(self, rules):
+        """Register rules given as dicts.
+
+        Each rule needs ``metric``, ``op`` ('>' or '<'), ``threshold`` and
+        ``message``; optional keys are ``kind`` ('threshold' or 'rate', the
+        latter comparing change per second), ``severity``, ``cooldown``
+        (seconds between notifications) and ``max_per_hour``.
+        """
+        rules = list(rules)
+        for rule in rules:
+            if rule['metric'] not in self.metric_index:
+                raise ValueError(f"Unknown metric: {rule['metric']}")
+            if rule['op'] not in ('>', '<'):
+                raise ValueError(f"Unsupported operator: {rule['op']}")
+
+        max_per_hour = np.array([r.get('max_per_hour', 12) for r in rules], dtype=np.float64)
+        self.rule_metric = np.concatenate([self.rule_metric, [self.metric_index[r['metric']] for r in rules]]).astype(np.int64)
+        self.rule_kind = np.concatenate([self.rule_kind, [RATE_OF_CHANGE if r.get('kind') == 'rate' else THRESHOLD for r in rules]]).astype(np.int8)
+        self.rule_sign = np.concatenate([self.rule_sign, [1.0 if r['op'] == '>' else -1.0 for r in rules]])
+        self.rule_threshold = np.concatenate([self.rule_threshold, [r['threshold'] for r in rules]]).astype(np.float64)
+        self.rule_cooldown = np.concatenate([self.rule_cooldown, [r.get('cooldown', 300) for r in rules]]).astype(np.float64)
+        self.rule_rate = np.concatenate([self.rule_rate, max_per_hour / 3600.0])
+        self.rule_burst = np.concatenate([self.rule_burst, np.maximum(1.0, max_per_hour / 12)])
+        self.last_fired = np.concatenate([self.last_fired, np.full(len(rules), -np.inf)])
+        self.tokens = np.concatenate([self.tokens, np.maximum(1.0, max_per_hour / 12)])
+        self.rules.extend(rules)
+
+    def evaluate(self, metrics, now=None):
+        """Evaluate every rule against one tick of metrics and return new alerts"""
+        now = time.time() if now is None else now
+        values = np.full(len(self.metric_names), np.nan)
+        for name, value in metrics.items():
+            index = self.metric_index.get(name)
+            if index is not None:
+                values[index] = value
+
+        observed = values[self.rule_metric]
+        if self.previous_values is not None and now > self.previous_time:
+            rates = (observed - self.previous_values[self.rule_metric]) / (now - self.previous_time)
+        else:
+            rates = np.full(len(self.rules), np.nan)
+        observed = np.where(self.rule_kind == RATE_OF_CHANGE, rates, observed)
+
+        # NaN comparisons are False, so missing metrics never fire
+        breached = self.rule_sign * (observed - self.rule_threshold) > 0
+
+        if self.last_tick is not None:
+            self.tokens = np.minimum(self.rule_burst, self.tokens + self.rule_rate * (now - self.last_tick))
+        off_cooldown = now - self.last_fired >= self.rule_cooldown
+        notify = breached & off_cooldown & (self.tokens >= 1.0)
+
+        self.previous_values = values
+        self.previous_time = now
+        self.last_tick = now
+
+        new_alerts = []
+        breached_fingerprints = set()
+        for rule_id in np.flatnonzero(breached):
+            rule = self.rules[rule_id]
+            fingerprint = (rule_id, rule['metric'], rule.get('severity', 'warning'))
+            breached_fingerprints.add(fingerprint)
+
+            alert = self.active.get(fingerprint)
+            if alert is not None:
+                # Still firing: fold into the open alert instead of repeating it
+                alert['count'] += 1
+                alert['last_seen'] = now
+                alert['value'] = float(observed[rule_id])
+                continue
+            if not notify[rule_id]:
+                continue
+
+            alert = {
+                'fingerprint': fingerprint,
+                'rule_id': int(rule_id),
+                'severity': rule.get('severity', 'warning'),
+                'message': rule['message'],
+                'metric': rule['metric'],
+                'value': float(observed[rule_id]),
+                'first_seen': now,
+                'last_seen': now,
+                'count': 1
+            }
+            self.active[fingerprint] = alert
+            self.recent.appendleft(alert)
+            self.last_fired[rule_id] = now
+            self.tokens[rule_id] -= 1.0
+            new_alerts.append(alert)
+
+        # Resolve alerts whose condition cleared so they can fire again later
+        for fingerprint in list(self.active):
+            if fingerprint not in breached_fingerprints:
+                del self.active[fingerprint]
+
+        return new_alerts
+
+    def recent_alerts(self, limit=10):
+        """Most recent alerts, newest first"""
+        return list(self.recent)[:limit]
@@ -0,0 +1,261 @@
+import hashlib
+import json
+import os
+import threading
+import time
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime
+
+GENESIS_HASH = '0' * 64
+
+# Every line ends with ',"hash":"<64 hex chars>"}' so the hashed body can be
+# recovered without re-serializing the record
+HASH_SUFFIX_LENGTH = len(',"hash":""}') + 64
+
+def _record_hash(prev_hash, body):
+    return hashlib.sha256(prev_hash.encode('ascii') + body).hexdigest()
+
+def _serialize(record, prev_hash):
+    """Encode one record as a chained JSON line; returns (line, hash)"""
+    body = json.dumps(dict(record, prev=prev_hash), sort_keys=True, separators=(',', ':'), default=str).encode()
+    digest = _record_hash(prev_hash, body)
+    return body[:-1] + b',"hash":"' + digest.encode('ascii') + b'"}\n', digest
+
+def _parse_line(line):
+    """(record, stored hash, hashed body) of one log line; ValueError if it is torn or not a record"""
+    body = line[:-HASH_SUFFIX_LENGTH] + b'}'
+    stored_hash = line[-HASH_SUFFIX_LENGTH + 9:-2].decode('ascii')
+    record = json.loads(body)
+    if not isinstance(record, dict) or 'seq' not in record or 'prev' not in record:
+        raise ValueError("not an audit record")
+    return record, stored_hash, body
+
+def _read_last_line(f, size):
+    """Last newline-terminated line of an open binary file, or None"""
+    window = 64 * 1024
+    while True:
+        start = max(0, size - window)
+        f.seek(start)
+        data = f.read(size - start)
+        cut = data.rfind(b'\n', 0, len(data) - 1)
+        if cut != -1 or start == 0:
+            return data[cut + 1:-1] or None
+        window *= 4
+
+class AuditLog:
+    """Append-only, hash-chained audit trail with group commit.
+
+    ``append`` only queues a record; a writer thread chains and writes
+    everything queued so far and makes it durable with one fsync per batch,
+    so concurrent callers share the cost of each fsync. Each record stores
+    the previous record's hash and its own hash over (previous hash, body),
+    so editing, reordering or deleting a record breaks the chain. Publish
+    ``head()`` somewhere external to also detect truncation of the tail.
+    """
+
+    def __init__(self, path, max_batch=8192, max_delay=0.005, fsync=True):
+        self.path = path
+        self.max_batch = max_batch
+        self.max_delay = max_delay
+        self.fsync = fsync
+
+        os.makedirs(os.path.dirname(path) or '.', exist_ok=True)
+        self.file = open(path, 'ab+')
+        self.next_seq, self.last_hash = self._recover()
+        self.committed_seq = self.next_seq - 1
+
+        self.pending = []
+        self.condition = threading.Condition()
+        self.closed = False
+        self.error = None
+        self.batches = 0
+        self.writer = threading.Thread(target=self._write_loop, daemon=True)
+        self.writer.start()
+
+    def _recover(self):
+        """Drop a torn final write and resume the chain from the last complete record.
+
+        A crash can leave a partial last line, or newline-terminated garbage
+        when the file grew before its data reached disk. Both are truncated
+        back to the last line that parses as a record, like the metric
+        store's index replay.
+        """
+        size = os.fstat(self.file.fileno()).st_size
+        if size == 0:
+            return 1, GENESIS_HASH
+        self.file.seek(size - 1)
+        if self.file.read(1) != b'\n':
+            self.file.seek(0)
+            size = self.file.read().rfind(b'\n') + 1
+            self.file.truncate(size)
+        while size:
+            line = _read_last_line(self.file, size) or b''
+            try:
+                last, stored_hash, _ = _parse_line(line)
+            except ValueError:
+                size -= len(line) + 1
+                self.file.truncate(size)
+                continue
+            return last['seq'] + 1, stored_hash
+        return 1, GENESIS_HASH
+
+    def append(self, actor, action, resource, details=None, wait=False):
+        """Queue an audited action; with ``wait`` block until it is durable"""
+        with self.condition:
+            if self.closed:
+                raise ValueError("Audit log is closed")
+            if self.error:
+                raise self.error
+            seq = self.next_seq
+            self.next_seq += 1
+            self.pending.append({
+                'seq': seq,
+                'ts': datetime.now().isoformat(timespec='microseconds'),
+                'actor': actor,
+                'action': action,
+                'resource': resource,
+                'details': details or {}
+            })
+            if len(self.pending) == 1 or len(self.pending) >= self.max_batch:
+                self.condition.notify_all()
+        if wait:
+            self.wait_durable(seq)
+        return seq
+
+    def wait_durable(self, seq):
+        """Block until record ``seq`` has been fsynced"""
+        with self.condition:
+            while self.committed_seq < seq and self.error is None:
+                self.condition.wait()
+            if self.error:
+                raise self.error
+
+    def flush(self):
+        """Block until everything appended so far is durable"""
+        with self.condition:
+            last = self.next_seq - 1
+        self.wait_durable(last)
+
+    def head(self):
+        """(sequence, hash) of the last durable record"""
+        with self.condition:
+            return self.committed_seq, self.last_hash
+
+    def _write_loop(self):
+        while True:
+            with self.condition:
+                while not self.pending and not self.closed:
+                    self.condition.wait()
+                if not self.pending:
+                    return
+                # Give concurrent appenders a moment to join this batch
+                if len(self.pending) < self.max_batch and not self.closed:
+                    self.condition.wait(self.max_delay)
+                batch, self.pending = self.pending, []
+
+            try:
+                lines = []
+                prev_hash = self.last_hash
+                for record in batch:
+                    line, prev_hash = _serialize(record, prev_hash)
+                    lines.append(line)
+                self.file.write(b''.join(lines))
+                self.file.flush()
+                if self.fsync:
+                    os.fsync(self.file.fileno())
+            except OSError as e:
+                with self.condition:
+                    self.error = e
+                    self.condition.notify_all()
+                return
+
+            with self.condition:
+                self.last_hash = prev_hash
+                self.committed_seq = batch[-1]['seq']
+                self.batches += 1
+                self.condition.notify_all()
+
+    def close(self):
+        """Flush pending records and stop the writer"""
+        with self.condition:
+            self.closed = True
+            self.condition.notify_all()
+        self.writer.join()
+        self.file.close()
+
+def _verify_chunk(path, start, end):
+    """Check hashes and links inside one byte range of the log.
+
+    Errors carry the 1-based line number within the chunk.
+    """
+    with open(path, 'rb') as f:
+        f.seek(start)
+        data = f.read(end - start)
+
+    summary = {'records': 0, 'first_prev': None, 'first_seq': None, 'last_hash': None, 'last_seq': None, 'error': None}
+    for line_number, line in enumerate(data.splitlines(), 1):
+        try:
+            record, stored_hash, body = _parse_line(line)
+        except ValueError:
+            summary['error'] = (line_number, "unparseable record")
+            return summary
+
+        if summary['records'] == 0:
+            summary['first_prev'], summary['first_seq'] = record['prev'], record['seq']
+        elif record['prev'] != summary['last_hash'] or record['seq'] != summary['last_seq'] + 1:
+            summary['error'] = (line_number, "broken chain link")
+            return summary
+        if _record_hash(record['prev'], body) != stored_hash:
+            summary['error'] = (line_number, "hash mismatch")
+            return summary
+
+        summary['records'] += 1
+        summary['last_hash'], summary['last_seq'] = stored_hash, record['seq']
+    return summary
+
+def verify_audit_log(path, workers=None, chunk_bytes=16 << 20, expected_head=None):
+    """Verify the whole chain, checking newline-aligned chunks in parallel.
+
+    Records carry their predecessor's hash, so each chunk is verified on
+    its own and the chunks are then stitched together by comparing each
+    chunk's first ``prev`` with the previous chunk's last hash. ``error``
+    is (line number, reason).
+    """
+    started = time.perf_counter()
+    size = os.path.getsize(path)
+
+    boundaries = [0]
+    with open(path, 'rb') as f:
+        while boundaries[-1] + chunk_bytes < size:
+            f.seek(boundaries[-1] + chunk_bytes)
+            f.readline()
+            if f.tell() >= size:
+                break
+            boundaries.append(f.tell())
+    ranges = list(zip(boundaries, boundaries[1:] + [size]))
+
+    if len(ranges) == 1:
+        chunks = [_verify_chunk(path, *ranges[0])]
+    else:
+        with ProcessPoolExecutor(max_workers=workers or os.cpu_count()) as pool:
+            chunks = list(pool.map(_verify_chunk, [path] * len(ranges), *zip(*ranges)))
+
+    result = {'valid': True, 'records': 0, 'error': None, 'head': (0, GENESIS_HASH)}
+    prev_hash, prev_seq = GENESIS_HASH, 0
+    for chunk in chunks:
+        if chunk['records'] and chunk['error'] is None and (
+                chunk['first_prev'] != prev_hash or chunk['first_seq'] != prev_seq + 1):
+            chunk['error'] = (1, "broken chain link")
+        if chunk['error']:
+            line_number, reason = chunk['error']
+            result.update(valid=False, error=(result['records'] + line_number, reason))
+            break
+        result['records'] += chunk['records']
+        if chunk['records']:
+            prev_hash, prev_seq = chunk['last_hash'], chunk['last_seq']
+
+    result['head'] = (prev_seq, prev_hash)
+    if result['valid'] and expected_head is not None and tuple(expected_head) != result['head']:
+        result.update(valid=False, error=(result['records'], "log does not end at the expected head"))
+    result['seconds'] = time.perf_counter() - started
+    return result
@@ -0,0 +1,178 @@
+import argparse
+import os
+import time
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+import numpy as np
+import pandas as pd
+from utils.dataset_factory import CATEGORICAL_FEATURES, COLUMN_DTYPES, FEATURE_COLUMNS, generate_training_dataset, load_npy_dataset
+from utils.fraud_model import LogisticFraudModel, score_sellers, train_reference_model
+from utils.shared_arrays import SharedArray
+
+# Upper bounds of each risk level, matching the levels used on fraud events
+RISK_LEVELS = ['LOW', 'MEDIUM', 'HIGH', 'CRITICAL']
+RISK_LEVEL_CUTS = np.array([0.3, 0.6, 0.85], dtype=np.float32)
+
+def _frame_columns(df):
+    """Feature columns of a DataFrame as arrays in the training dtypes"""
+    columns = {}
+    for name in FEATURE_COLUMNS:
+        values = df[name]
+        if name in CATEGORICAL_FEATURES and not pd.api.types.is_numeric_dtype(values):
+            # Labels ('low', 'electronics', ...) map to their category codes
+            values = pd.Categorical(values, categories=CATEGORICAL_FEATURES[name]).codes
+        columns[name] = np.asarray(values, dtype=COLUMN_DTYPES[name])
+    return columns
+
+def read_feature_chunks(path, chunk_size):
+    """Yield (seller ids, feature columns) chunks from Parquet, CSV or a .npy dataset"""
+    if os.path.isdir(path) and os.path.exists(os.path.join(path, 'metadata.json')) \
+            and os.path.exists(os.path.join(path, 'seller_id.npy')):
+        columns, metadata = load_npy_dataset(path)
+        for start in range(0, metadata['rows'], chunk_size):
+            stop = min(start + chunk_size, metadata['rows'])
+            yield columns['seller_id'][start:stop], {name: columns[name][start:stop] for name in FEATURE_COLUMNS}
+    elif path.endswith('.csv') or path.endswith('.csv.gz'):
+        for df in pd.read_csv(path, chunksize=chunk_size):
+            yield df['seller_id'].to_numpy(), _frame_columns(df)
+    else:
+        import pyarrow.dataset as ds
+        dataset = ds.dataset(path, format='parquet')
+        for batch in dataset.to_batches(columns=['seller_id'] + FEATURE_COLUMNS, batch_size=chunk_size):
+            df = batch.to_pandas()
+            yield df['seller_id'].to_numpy(), _frame_columns(df)
+
+# Per-process state populated by the pool initializer
+_worker = {}
+
+def _init_worker(slot_specs, model_dict):
+    """Attach to every shared chunk slot once per worker"""
+    _worker['slots'] = [{name: SharedArray.attach(spec) for name, spec in slot.items()} for slot in slot_specs]
+    _worker['model'] = LogisticFraudModel.from_dict(model_dict)
+
+def _score_slot(slot, n_rows):
+    """Score the chunk staged in ``slot`` and write the scores next to it"""
+    arrays = _worker['slots'][slot]
+    columns = {name: arrays[name].array[:n_rows] for name in FEATURE_COLUMNS}
+    arrays['score'].array[:n_rows] = score_sellers(_worker['model'], columns)
+    return slot, n_rows
+
+def score_files(paths, output_path, model, chunk_size=500_000, workers=None):
+    """Score seller feature files into one Parquet file with constant memory.
+
+    A fixed ring of shared-memory chunk slots (two per worker) is allocated
+    up front. The parent reads a chunk straight into a free slot, a worker
+    scores it in place and writes the scores into the slot, and the parent
+    streams finished chunks to Parquet in input order before reusing the
+    slot. Memory is bounded by the slots, not by the input size.
+    """
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+
+    workers = workers or os.cpu_count()
+    n_slots = 2 * workers
+    slots = []
+    for _ in range(n_slots):
+        slot = {name: SharedArray.create((chunk_size,), COLUMN_DTYPES[name]) for name in FEATURE_COLUMNS}
+        slot['score'] = SharedArray.create((chunk_size,), np.float32)
+        slots.append(slot)
+
+    levels = pa.array(RISK_LEVELS)
+    timings = {'read': 0.0, 'wait': 0.0, 'write': 0.0}
+    rows = 0
+    writer = None
+    started_at = time.perf_counter()
+
+    def write_next(pending):
+        nonlocal writer
+        future, seller_ids = pending.popleft()
+        started = time.perf_counter()
+        slot, n_rows = future.result()
+        timings['wait'] += time.perf_counter() - started
+
+        started = time.perf_counter()
+        scores = slots[slot]['score'].array[:n_rows]
+        table = pa.table({
+            'seller_id': seller_ids,
+            'risk_score': scores,
+            'risk_level': pa.DictionaryArray.from_arrays(
+                np.searchsorted(RISK_LEVEL_CUTS, scores, side='right').astype(np.int8), levels
+            )
+        })
+        if writer is None:
+            writer = pq.ParquetWriter(output_path, table.schema)
+        writer.write_table(table)
+        timings['write'] += time.perf_counter() - started
+        return slot
+
+    try:
+        with ProcessPoolExecutor(
+            max_workers=workers,
+            initializer=_init_worker,
+            initargs=([{name: shared.spec for name, shared in slot.items()} for slot in slots], model.to_dict())
+        ) as pool:
+            free = deque(range(n_slots))
+            pending = deque()
+            for path in paths:
+                chunks = read_feature_chunks(path, chunk_size)
+                while True:
+                    started = time.perf_counter()
+                    chunk = next(chunks, None)
+                    timings['read'] += time.perf_counter() - started
+                    if chunk is None:
+                        break
+                    seller_ids, columns = chunk
+                    if not free:
+                        free.append(write_next(pending))
+                    slot = free.popleft()
+
+                    started = time.perf_counter()
+                    n_rows = len(seller_ids)
+                    for name in FEATURE_COLUMNS:
+                        slots[slot][name].array[:n_rows] = columns[name]
+                    timings['read'] += time.perf_counter() - started
+
+                    pending.append((pool.submit(_score_slot, slot, n_rows), np.array(seller_ids)))
+                    rows += n_rows
+            while pending:
+                free.append(write_next(pending))
+    finally:
+        if writer is not None:
+            writer.close()
+        for slot in slots:
+            for shared in slot.values():
+                shared.close()
+
+    elapsed = time.perf_counter() - started_at
+    return {
+        'rows': rows,
+        'seconds': elapsed,
+        'rows_per_second': rows / elapsed if elapsed else float('inf'),
+        'stage_seconds': timings,
+        'output_path': output_path
+    }
+
+def main():
+    """Command-line entry point for batch scoring"""
+    parser = argparse.ArgumentParser(description="Score seller feature files with the fraud model")
+    parser.add_argument('inputs', nargs='+', help="Parquet files/directories, CSV files or .npy dataset directories")
+    parser.add_argument('--output', required=True, help="output Parquet file")
+    parser.add_argument('--model', help="model JSON saved with LogisticFraudModel.save (default: reference model)")
+    parser.add_argument('--chunk-size', type=int, default=500_000)
+    parser.add_argument('--workers', type=int, default=None)
+    parser.add_argument('--generate-sample', type=int, metavar='ROWS',
+                        help="first write ROWS synthetic sellers as a .npy dataset at the (single) input path")
+    args = parser.parse_args()
+
+    if args.generate_sample:
+        generate_training_dataset(args.inputs[0], args.generate_sample, workers=args.workers)
+
+    model = LogisticFraudModel.load(args.model) if args.model else train_reference_model()
+    report = score_files(args.inputs, args.output, model, args.chunk_size, args.workers)
+    print(f"✅ Scored {report['rows']:,} sellers in {report['seconds']:.1f}s "
+          f"({report['rows_per_second']:,.0f} rows/s) → {report['output_path']}")
+    for stage, seconds in report['stage_seconds'].items():
+        print(f"   {stage:>6}: {seconds:.2f}s")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,102 @@
+import base64
+import json
+from datetime import datetime
+import numpy as np
+import pandas as pd
+from plotly.utils import PlotlyJSONEncoder
+
+# Plotly.js typed-array spec dtype codes (little-endian)
+TYPED_DTYPES = {'f4': '<f4', 'f8': '<f8', 'i4': '<i4', 'u4': '<u4', 'i2': '<i2', 'u2': '<u2', 'i1': 'i1', 'u1': 'u1'}
+
+def payload_bytes(figure):
+    """Size of the JSON a figure (or figure dict) is sent to the browser as"""
+    if isinstance(figure, dict):
+        return len(json.dumps(figure, cls=PlotlyJSONEncoder, separators=(',', ':')))
+    return len(figure.to_json())
+
+def _datetimes(values):
+    """Values as a DatetimeIndex if they are timestamps, else None"""
+    if isinstance(values, np.ndarray) and values.dtype.kind == 'M':
+        return pd.DatetimeIndex(values)
+    if len(values) and isinstance(values[0], (pd.Timestamp, datetime, np.datetime64)):
+        return pd.DatetimeIndex(values)
+    return None
+
+def _numeric(values):
+    array = np.asarray(values)
+    return array if array.dtype.kind in 'iuf' else None
+
+def compact_figure(figure, decimals=2):
+    """Shrink a figure's wire size in place without changing what is drawn.
+
+    Evenly spaced timestamp (or numeric) axes are replaced by Plotly's
+    ``x0``/``dx`` start-and-step form, so a week of hourly points costs two
+    values instead of 169 ISO strings. Float values are rounded to
+    ``decimals`` places — no more than the chart displays — and
+    whole-number floats are sent as integers.
+    """
+    for trace in figure.data:
+        for axis in ('x', 'y'):
+            values = getattr(trace, axis, None)
+            if values is None or len(values) < 3:
+                continue
+
+            timestamps = _datetimes(values)
+            if timestamps is not None:
+                steps = np.diff(timestamps.asi8)
+                if (steps == steps[0]).all() and steps[0] > 0:
+                    # Date axes take dx in milliseconds
+                    trace.update({axis: None, f'{axis}0': timestamps[0].isoformat(), f'd{axis}': steps[0] / 1e6})
+                continue
+
+            array = _numeric(values)
+            if array is None:
+                continue
+            if array.dtype.kind == 'f':
+                array = np.round(array, decimals)
+                if np.all(array == np.round(array)):
+                    array = array.astype(np.int64)
+            steps = np.diff(array)
+            if array.dtype.kind == 'i' and (steps == steps[0]).all() and steps[0] != 0:
+                trace.update({axis: None, f'{axis}0': int(array[0]), f'd{axis}': int(steps[0])})
+            else:
+                trace.update({axis: array})
+    return figure
+
+def encode_typed_array(values, dtype='f4'):
+    """Base64 typed-array form ({'dtype', 'bdata'}) understood by plotly.js >= 2.28"""
+    array = np.ascontiguousarray(values, dtype=TYPED_DTYPES[dtype])
+    return {'dtype': dtype, 'bdata': base64.b64encode(array.tobytes()).decode('ascii')}
+
+def to_typed_payload(figure, dtype='f4'):
+    """Figure dict with numeric arrays as base64 typed arrays.
+
+    Irregular timestamps become float64 epoch milliseconds, which date axes
+    accept. The Plotly/Streamlit versions pinned in requirements.txt
+    validate figures against plain arrays, so this form is for clients
+    with a newer plotly.js (and for measuring the potential saving).
+    """
+    payload = figure.to_plotly_json()
+    for trace in payload['data']:
+        for axis in ('x', 'y'):
+            values = trace.get(axis)
+            if values is None or len(values) < 3:
+                continue
+            timestamps = _datetimes(values)
+            if timestamps is not None:
+                trace[axis] = encode_typed_array(timestamps.asi8 / 1e6, 'f8')
+                continue
+            array = _numeric(values)
+            if array is not None:
+                is_int = array.dtype.kind in 'iu' and np.abs(array).max(initial=0) < 2 ** 31
+                trace[axis] = encode_typed_array(array, 'i4' if is_int else dtype)
+    return payload
+
+def measure_payload(figure, decimals=2):
+    """Wire size before and after compaction (the figure is left unchanged)"""
+    compact = compact_figure(type(figure)(figure), decimals)
+    return {
+        'original_bytes': payload_bytes(figure),
+        'compact_bytes': payload_bytes(compact),
+        'typed_bytes': payload_bytes(to_typed_payload(compact))
+    }
@@ -0,0 +1,204 @@
+import heapq
+import random
+import itertools
+import time
+
+PRIORITIES = {'low': 0, 'normal': 1, 'high': 2, 'critical': 3}
+
+class DeploymentScheduler:
+    """Admit deployment requests against CPU and memory quotas.
+
+    Requests wait in one priority heap per project. Whenever capacity frees
+    up, projects are visited in order of their dominant resource share
+    (the larger of their CPU and memory share of the quota), so a burst from
+    one project cannot crowd out the others. Within a project the highest
+    priority request goes first, FIFO among equals. A project whose next
+    request does not fit is skipped so smaller requests can still use the
+    remaining capacity.
+    """
+
+    def __init__(self, cpu_quota=4, memory_quota_gb=8, max_concurrent=None, clock=time.time):
+        self.cpu_quota = cpu_quota
+        self.memory_quota_gb = memory_quota_gb
+        self.max_concurrent = max_concurrent
+        self.clock = clock
+
+        self.queues = {}  # project -> heap of (-priority, sequence, request)
+        self.running = {}  # request id -> request
+        self.cpu_used = 0
+        self.memory_used = 0
+        self.project_usage = {}  # project -> [cpu, memory] currently held
+        self.sequence = itertools.count()
+        self.ids = itertools.count(1)
+
+        self.completed = 0
+        self.wait_times = []
+        self.max_wait_samples = 10000
+        self.started_at = clock()
+        self.last_accounted = self.started_at
+        self.cpu_seconds = 0.0
+        self.memory_seconds = 0.0
+
+    def set_quotas(self, cpu_quota, memory_quota_gb, max_concurrent=None):
+        """Apply new quotas and admit whatever now fits; returns (admitted, rejected).
+
+        Queued requests larger than the new quotas could never start and would
+        block their project's queue, so they are rejected.
+        """
+        self._account()
+        self.cpu_quota = cpu_quota
+        self.memory_quota_gb = memory_quota_gb
+        self.max_concurrent = max_concurrent
+
+        rejected = []
+        for project, queue in self.queues.items():
+            kept = []
+            for entry in queue:
+                request = entry[2]
+                if request['cpu'] > cpu_quota or request['memory_gb'] > memory_quota_gb:
+                    request['status'] = 'rejected'
+                    request['error'] = (f"Deployment needs {request['cpu']} CPU / {request['memory_gb']} GB, "
+                                        f"above the new quota")
+                    rejected.append(request)
+                else:
+                    kept.append(entry)
+            if len(kept) < len(queue):
+                heapq.heapify(kept)
+                self.queues[project] = kept
+        return self._admit(), rejected
+
+    def submit(self, project, flow_id, cpu, memory_gb, duration_s, priority='normal', model=None):
+        """Queue a deployment request and admit it immediately if capacity allows"""
+        if cpu > self.cpu_quota or memory_gb > self.memory_quota_gb:
+            raise ValueError(f"Deployment needs {cpu} CPU / {memory_gb} GB, above the configured quota")
+        request = {
+            'id': f"dep-{next(self.ids):05d}",
+            'project': project,
+            'flow_id': flow_id,
+            'model': model,
+            'cpu': cpu,
+            'memory_gb': memory_gb,
+            'duration_s': duration_s,
+            'priority': priority,
+            'status': 'queued',
+            'submitted_at': self.clock(),
+            'started_at': None
+        }
+        heapq.heappush(self.queues.setdefault(project, []), (-PRIORITIES[priority], next(self.sequence), request))
+        self._admit()
+        return request
+
+    def _dominant_share(self, project):
+        cpu, memory = self.project_usage.get(project, (0, 0))
+        return max(cpu / self.cpu_quota, memory / self.memory_quota_gb)
+
+    def _fits(self, request):
+        if self.max_concurrent is not None and len(self.running) >= self.max_concurrent:
+            return False
+        return (self.cpu_used + request['cpu'] <= self.cpu_quota
+                and self.memory_used + request['memory_gb'] <= self.memory_quota_gb)
+
+    def _admit(self, now=None):
+        """Start queued requests in fair-share order until nothing else fits"""
+        admitted = []
+        now = self.clock() if now is None else now
+        while True:
+            candidates = sorted((p for p, q in self.queues.items() if q), key=self._dominant_share)
+            started = None
+            for project in candidates:
+                request = self.queues[project][0][2]
+                if self._fits(request):
+                    heapq.heappop(self.queues[project])
+                    started = request
+                    break
+            if started is None:
+                return admitted
+
+            self._account(now)
+            started['status'] = 'running'
+            started['started_at'] = now
+            self.running[started['id']] = started
+            self.cpu_used += started['cpu']
+            self.memory_used += started['memory_gb']
+            usage = self.project_usage.setdefault(started['project'], [0, 0])
+            usage[0] += started['cpu']
+            usage[1] += started['memory_gb']
+            self._record_wait(now - started['submitted_at'])
+            admitted.append(started)
+
+    def _record_wait(self, wait):
+        self.wait_times.append(wait)
+        if len(self.wait_times) > self.max_wait_samples:
+            del self.wait_times[:len(self.wait_times) - self.max_wait_samples]
+
+    def _account(self, now=None):
+        """Accumulate resource-seconds for utilization reporting"""
+        now = self.clock() if now is None else now
+        elapsed = max(0.0, now - self.last_accounted)
+        self.cpu_seconds += self.cpu_used * elapsed
+        self.memory_seconds += self.memory_used * elapsed
+        self.last_accounted = max(self.last_accounted, now)
+
+    def complete(self, request_id, status='completed', now=None):
+        """Release a running request's resources and admit waiting requests"""
+        now = self.clock() if now is None else now
+        request = self.running.pop(request_id)
+        self._account(now)
+        request['status'] = status
+        self.cpu_used -= request['cpu']
+        self.memory_used -= request['memory_gb']
+        usage = self.project_usage[request['project']]
+        usage[0] -= request['cpu']
+        usage[1] -= request['memory_gb']
+        self.completed += 1
+        return self._admit(now)
+
+    def advance(self, now=None):
+        """Complete every running request whose expected duration has elapsed"""
+        now = self.clock() if now is None else now
+        # Completing one request can admit another that also finishes by now
+        while self.running:
+            request = min(self.running.values(), key=lambda r: r['started_at'] + r['duration_s'])
+            finished_at = request['started_at'] + request['duration_s']
+            if finished_at > now:
+                break
+            self.complete(request['id'], now=finished_at)
+
+    def queued(self):
+        """Queued requests in the order each project would run them"""
+        return [entry[2] for queue in self.queues.values() for entry in sorted(queue)]
+
+    def stats(self):
+        """Queue depth, wait-time percentiles and utilization"""
+        self._account()
+        elapsed = max(1e-9, self.last_accounted - self.started_at)
+        waits = sorted(self.wait_times)
+
+        def percentile(q):
+            return waits[min(len(waits) - 1, int(q * len(waits)))] if waits else 0.0
+
+        return {
+            'queued': sum(len(q) for q in self.queues.values()),
+            'running': len(self.running),
+            'completed': self.completed,
+            'wait_p50': percentile(0.50),
+            'wait_p95': percentile(0.95),
+            'cpu_utilization': self.cpu_used / self.cpu_quota,
+            'memory_utilization': self.memory_used / self.memory_quota_gb,
+            'avg_cpu_utilization': self.cpu_seconds / (self.cpu_quota * elapsed),
+            'avg_memory_utilization': self.memory_seconds / (self.memory_quota_gb * elapsed)
+        }
+
+def submit_flow_deployment(scheduler, flow, project='seller-risk', priority='normal', model=None, duration_s=None):
+    """Submit a deployment for one of the flows from get_deployment_flows()"""
+    resources = flow.get('resources', {'cpu': 1, 'memory_gb': 2})
+    return scheduler.submit(
+        project=project,
+        flow_id=flow['id'],
+        cpu=resources['cpu'],
+        memory_gb=resources['memory_gb'],
+        # Demo deployments finish within a minute or two of being admitted
+        duration_s=duration_s if duration_s is not None else random.uniform(30, 90),
+        priority=priority,
+        model=model
+    )
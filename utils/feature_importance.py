@@ -0,0 +1,143 @@
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+import numpy as np
+from utils.dataset_factory import generate_seller_chunk, FEATURE_COLUMNS
+from utils.fraud_model import LogisticFraudModel, encode_features, log_loss, roc_auc, _sigmoid
+from utils.shared_arrays import SharedArray
+
+METRICS = {
+    # metric name -> (scorer, sign so that a positive delta means "feature mattered")
+    'log_loss': (lambda y, logits: log_loss(y, _sigmoid(logits)), 1.0),
+    'auc': (lambda y, logits: roc_auc(y, logits), -1.0)
+}
+
+# Per-process state populated by the pool initializer
+_worker = {}
+
+def _init_worker(eval_specs, train_specs, model_dict, slices, metric):
+    """Attach to the shared evaluation (and training) arrays once per worker"""
+    X = SharedArray.attach(eval_specs[0])
+    y = SharedArray.attach(eval_specs[1])
+    model = LogisticFraudModel.from_dict(model_dict)
+    scorer, _ = METRICS[metric]
+    base_logits = model.decision_function(X.array)
+
+    _worker.update({
+        'X': X,
+        'y': y,
+        'model': model,
+        'slices': slices,
+        'metric': metric,
+        'base_logits': base_logits,
+        'base_score': scorer(y.array, base_logits),
+        'train': [SharedArray.attach(spec) for spec in train_specs] if train_specs else None
+    })
+
+def _permutation_task(feature, seed):
+    """Score the model with one feature's columns shuffled across rows"""
+    X, y, model = _worker['X'].array, _worker['y'].array, _worker['model']
+    columns = _worker['slices'][feature]
+    scorer, sign = METRICS[_worker['metric']]
+
+    # The model is additive, so only the permuted feature's term is recomputed
+    permutation = np.random.default_rng(seed).permutation(X.shape[0])
+    logits = (_worker['base_logits']
+              - model.contribution(X[:, columns], columns)
+              + model.contribution(X[permutation, columns], columns))
+    return feature, sign * (scorer(y, logits) - _worker['base_score'])
+
+def _drop_column_task(feature):
+    """Refit without one feature and score the difference on the evaluation set"""
+    X, y, model = _worker['X'].array, _worker['y'].array, _worker['model']
+    X_train, y_train = (shared.array for shared in _worker['train'])
+    scorer, sign = METRICS[_worker['metric']]
+
+    mask = np.ones(X.shape[1], dtype=bool)
+    mask[_worker['slices'][feature]] = False
+    refit = LogisticFraudModel(l2=model.l2).fit(X_train, y_train, feature_mask=mask)
+    return feature, sign * (scorer(y, refit.decision_function(X)) - _worker['base_score'])
+
+def permutation_importance(model, X_eval, y_eval, slices, n_repeats=5, metric='log_loss',
+                           workers=None, seed=0, X_train=None, y_train=None, drop_column=False):
+    """Compute permutation (and optionally drop-column) importance in a process pool.
+
+    The evaluation set is copied once into shared memory and every worker
+    attaches to it zero-copy; tasks are (feature, repeat) pairs.
+    Drop-column importance refits the model per feature and needs
+    ``X_train``/``y_train``.
+    """
+    if metric not in METRICS:
+        raise ValueError(f"Unsupported metric: {metric}")
+    if drop_column and (X_train is None or y_train is None):
+        raise ValueError("Drop-column importance requires X_train and y_train")
+
+    shared = [SharedArray.from_array(X_eval), SharedArray.from_array(np.asarray(y_eval))]
+    if drop_column:
+        shared += [SharedArray.from_array(X_train), SharedArray.from_array(np.asarray(y_train))]
+    train_specs = [s.spec for s in shared[2:]] if drop_column else None
+
+    features = list(slices)
+    seeds = np.random.SeedSequence(seed).generate_state(len(features) * n_repeats)
+    started = time.perf_counter()
+    try:
+        with ProcessPoolExecutor(
+            max_workers=workers or os.cpu_count(),
+            initializer=_init_worker,
+            initargs=([s.spec for s in shared[:2]], train_specs, model.to_dict(), slices, metric)
+        ) as pool:
+            permutation_futures = [
+                pool.submit(_permutation_task, feature, int(seeds[i * n_repeats + r]))
+                for i, feature in enumerate(features)
+                for r in range(n_repeats)
+            ]
+            drop_futures = [pool.submit(_drop_column_task, feature) for feature in features] if drop_column else []
+
+            deltas = {feature: [] for feature in features}
+            for future in permutation_futures:
+                feature, delta = future.result()
+                deltas[feature].append(delta)
+            drops = dict(future.result() for future in drop_futures)
+    finally:
+        for s in shared:
+            s.close()
+
+    results = []
+    for feature in features:
+        result = {
+            'name': feature,
+            'importance': float(np.mean(deltas[feature])),
+            'std': float(np.std(deltas[feature]))
+        }
+        if drop_column:
+            result['drop_column_importance'] = float(drops[feature])
+        results.append(result)
+
+    return {
+        'features': sorted(results, key=lambda r: r['importance'], reverse=True),
+        'metric': metric,
+        'seconds': time.perf_counter() - started
+    }
+
+def compute_feature_discovery_importance(feature_catalog, n_train=200_000, n_eval=500_000,
+                                         n_repeats=5, workers=None, seed=0):
+    """Train a model on synthetic sellers and rank the Feature Discovery catalog.
+
+    Returns the catalog entries (as from ``generate_feature_data``) with
+    ``importance`` replaced by each feature's share of the total permutation
+    importance, sorted from most to least important.
+    """
+    train = generate_seller_chunk(n_train, seed=seed)
+    held_out = generate_seller_chunk(n_eval, seed=seed + 1)
+    X_train, slices = encode_features(train)
+    X_eval, _ = encode_features(held_out)
+
+    model = LogisticFraudModel().fit(X_train, train['is_fraud'])
+    result = permutation_importance(model, X_eval, held_out['is_fraud'], slices,
+                                    n_repeats=n_repeats, workers=workers, seed=seed)
+
+    scores = {r['name']: max(0.0, r['importance']) for r in result['features']}
+    total = sum(scores.values()) or 1.0
+    ranked = [dict(feature, importance=round(scores.get(feature['name'], 0.0) / total, 3))
+              for feature in feature_catalog if feature['name'] in FEATURE_COLUMNS]
+    return sorted(ranked, key=lambda f: f['importance'], reverse=True), result['seconds']
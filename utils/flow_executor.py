@@ -0,0 +1,197 @@
+import random
+import time
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
+from datetime import datetime
+
+def simulate_subtask(task):
+    """Default sub-task runner: sleep for a short, random amount of work"""
+    time.sleep(random.uniform(0.05, 0.3))
+    return f"{task['detail']} done"
+
+def format_duration(seconds):
+    """Format seconds the way flow steps display durations ('30s', '2m 15s')"""
+    if seconds < 10:
+        return f"{max(0, seconds):.1f}s"
+    seconds = int(round(seconds))
+    if seconds < 60:
+        return f"{seconds}s"
+    minutes, seconds = divmod(seconds, 60)
+    return f"{minutes}m {seconds}s" if seconds else f"{minutes}m"
+
+def build_flow_dag(flow):
+    """Model a deployment flow as a DAG of sub-tasks.
+
+    Every entry in a step's ``details`` is an independent sub-task. All
+    sub-tasks of a step depend on every sub-task of the previous step, so
+    steps still run in order while their details run concurrently.
+    """
+    dag = {}
+    previous = []
+    for step in flow['steps']:
+        current = []
+        for i, detail in enumerate(step.get('details', [])):
+            task_id = f"{step['id']}.{i}"
+            dag[task_id] = {
+                'id': task_id,
+                'step_id': step['id'],
+                'detail': detail,
+                'deps': list(previous)
+            }
+            current.append(task_id)
+        previous = current or previous
+    return dag
+
+class FlowExecutor:
+    """Run flow DAGs on a bounded worker pool with per-task timeouts and retries.
+
+    A timed-out attempt cannot be interrupted and keeps its worker thread
+    until it returns, so after a timeout the pool is retired (its remaining
+    attempts finish on it) and later attempts go to a fresh pool. Each
+    attempt's timeout runs from when it starts executing, not from submit.
+    """
+
+    def __init__(self, max_workers=4, task_timeout=5.0, max_retries=2, task_runner=None):
+        self.max_workers = max_workers
+        self.task_timeout = task_timeout
+        self.max_retries = max_retries
+        self.task_runner = task_runner or simulate_subtask
+
+    def run_dag(self, dag):
+        """Execute a DAG and return per-task results keyed by task id"""
+        results = {
+            task_id: {'status': 'pending', 'attempts': 0, 'started_at': None, 'finished_at': None, 'error': None}
+            for task_id in dag
+        }
+        remaining_deps = {task_id: set(task['deps']) for task_id, task in dag.items()}
+        dependents = {task_id: [] for task_id in dag}
+        for task_id, task in dag.items():
+            for dep in task['deps']:
+                dependents[dep].append(task_id)
+
+        ready = [task_id for task_id, deps in remaining_deps.items() if not deps]
+        running = {}  # future -> (task_id, attempt)
+
+        pool = ThreadPoolExecutor(max_workers=self.max_workers)
+        try:
+            while ready or running:
+                while ready and len(running) < self.max_workers:
+                    task_id = ready.pop(0)
+                    result = results[task_id]
+                    result['attempts'] += 1
+                    result['status'] = 'running'
+                    if result['started_at'] is None:
+                        result['started_at'] = datetime.now()
+                    attempt = {'started': None}
+                    future = pool.submit(self._run_attempt, dag[task_id], attempt)
+                    running[future] = (task_id, attempt)
+
+                deadlines = [attempt['started'] + self.task_timeout
+                             for _, attempt in running.values() if attempt['started'] is not None]
+                next_deadline = min(deadlines, default=time.monotonic() + self.task_timeout)
+                done, _ = wait(running, timeout=max(0, next_deadline - time.monotonic()),
+                               return_when=FIRST_COMPLETED)
+
+                now = time.monotonic()
+                finished = []
+                timed_out = False
+                for future, (task_id, attempt) in list(running.items()):
+                    if future in done:
+                        error = future.exception()
+                    elif attempt['started'] is not None and now >= attempt['started'] + self.task_timeout:
+                        error = TimeoutError(f"timed out after {self.task_timeout}s")
+                        timed_out = True
+                    else:
+                        continue
+                    del running[future]
+                    finished.append((task_id, error))
+
+                if timed_out:
+                    # The abandoned thread still holds a worker; stop submitting to this pool
+                    pool.shutdown(wait=False)
+                    pool = ThreadPoolExecutor(max_workers=self.max_workers)
+
+                for task_id, error in finished:
+                    result = results[task_id]
+                    if error is None:
+                        result['status'] = 'completed'
+                        result['finished_at'] = datetime.now()
+                        for child in dependents[task_id]:
+                            remaining_deps[child].discard(task_id)
+                            if not remaining_deps[child] and results[child]['status'] == 'pending':
+                                ready.append(child)
+                    elif result['attempts'] <= self.max_retries:
+                        result['error'] = str(error)
+                        ready.append(task_id)
+                    else:
+                        result['status'] = 'failed'
+                        result['error'] = str(error)
+                        result['finished_at'] = datetime.now()
+                        self._skip_dependents(task_id, dependents, results)
+        finally:
+            pool.shutdown(wait=False, cancel_futures=True)
+
+        return results
+
+    def _run_attempt(self, task, attempt):
+        attempt['started'] = time.monotonic()
+        return self.task_runner(task)
+
+    def _skip_dependents(self, task_id, dependents, results):
+        """Mark everything downstream of a failed task as skipped"""
+        stack = list(dependents[task_id])
+        while stack:
+            child = stack.pop()
+            if results[child]['status'] == 'pending':
+                results[child]['status'] = 'skipped'
+                stack.extend(dependents[child])
+
+    def run_flow(self, flow):
+        """Execute a deployment flow and summarize the measured timings per step"""
+        dag = build_flow_dag(flow)
+        task_results = self.run_dag(dag)
+
+        steps = {}
+        for task_id, task in dag.items():
+            steps.setdefault(task['step_id'], []).append(task_results[task_id])
+
+        summary = {}
+        for step_id, tasks in steps.items():
+            statuses = {task['status'] for task in tasks}
+            if 'failed' in statuses:
+                status = 'failed'
+            elif statuses == {'completed'}:
+                status = 'completed'
+            else:
+                status = 'pending'
+
+            started = [task['started_at'] for task in tasks if task['started_at']]
+            finished = [task['finished_at'] for task in tasks if task['finished_at']]
+            started_at = min(started) if started else None
+            finished_at = max(finished) if finished and status != 'pending' else None
+
+            summary[step_id] = {
+                'status': status,
+                'started_at': started_at,
+                'finished_at': finished_at,
+                'retries': sum(max(0, task['attempts'] - 1) for task in tasks),
+                'tasks': tasks
+            }
+        return summary
+
+def apply_flow_run(flow, run_summary):
+    """Return a copy of the flow with measured status and durations on each step"""
+    updated = dict(flow)
+    updated['steps'] = []
+    for step in flow['steps']:
+        step = dict(step)
+        measured = run_summary.get(step['id'])
+        if measured:
+            step['status'] = measured['status']
+            step['started_at'] = measured['started_at']
+            step['finished_at'] = measured['finished_at']
+            step.pop('duration', None)
+            if measured['started_at'] and measured['finished_at']:
+                elapsed = (measured['finished_at'] - measured['started_at']).total_seconds()
+                step['duration'] = format_duration(elapsed)
+        updated['steps'].append(step)
+    return updated
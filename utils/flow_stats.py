@@ -0,0 +1,112 @@
+import json
+import os
+from bisect import bisect_left
+from datetime import datetime
+
+# Log-spaced duration buckets (seconds): 1s doubling every four buckets up to ~4.5h
+DURATION_BUCKETS = [2 ** (i / 4) for i in range(0, 57)]
+
+class FlowStats:
+    """Incrementally maintained aggregates for one deployment flow"""
+
+    def __init__(self):
+        self.count = 0
+        self.successes = 0
+        self.total_duration = 0.0
+        self.histogram = [0] * (len(DURATION_BUCKETS) + 1)
+        self.runs_by_day = {}
+
+    def add(self, duration_s, success, day):
+        """Fold a single run into the aggregates"""
+        self.count += 1
+        self.successes += 1 if success else 0
+        self.total_duration += duration_s
+        self.histogram[bisect_left(DURATION_BUCKETS, duration_s)] += 1
+        self.runs_by_day[day] = self.runs_by_day.get(day, 0) + 1
+
+    @property
+    def success_rate(self):
+        return self.successes / self.count if self.count else 0.0
+
+    @property
+    def avg_duration(self):
+        return self.total_duration / self.count if self.count else 0.0
+
+    def percentile(self, q):
+        """Approximate a duration percentile from the histogram (bucket upper bound)"""
+        if not self.count:
+            return 0.0
+        target = q * self.count
+        seen = 0
+        for i, bucket_count in enumerate(self.histogram):
+            seen += bucket_count
+            if seen >= target:
+                return DURATION_BUCKETS[min(i, len(DURATION_BUCKETS) - 1)]
+        return DURATION_BUCKETS[-1]
+
+    def summary(self, day=None):
+        """Snapshot of the aggregates for display"""
+        day = day or datetime.now().date().isoformat()
+        return {
+            'runs': self.count,
+            'success_rate': self.success_rate,
+            'avg_duration': self.avg_duration,
+            'p50': self.percentile(0.50),
+            'p95': self.percentile(0.95),
+            'runs_today': self.runs_by_day.get(day, 0)
+        }
+
+class FlowRunLog:
+    """Append-only log of flow runs with per-flow aggregates kept up to date on write.
+
+    When ``path`` is given, records are appended to a JSON-lines file and
+    replayed on startup; otherwise they are kept in memory only.
+    """
+
+    def __init__(self, path=None):
+        self.path = path
+        self.records = [] if path is None else None
+        self.flows = {}
+        self.overall = FlowStats()
+        if path and os.path.exists(path):
+            self._replay()
+
+    def _replay(self):
+        """Rebuild aggregates from an existing log file"""
+        with open(self.path) as f:
+            for line in f:
+                if line.strip():
+                    self._apply(json.loads(line))
+
+    def _apply(self, record):
+        day = record['finished_at'][:10]
+        self.flows.setdefault(record['flow_id'], FlowStats()).add(record['duration_s'], record['success'], day)
+        self.overall.add(record['duration_s'], record['success'], day)
+
+    def append(self, flow_id, duration_s, success, finished_at=None):
+        """Record a completed run and update the aggregates"""
+        record = {
+            'flow_id': flow_id,
+            'duration_s': float(duration_s),
+            'success': bool(success),
+            'finished_at': (finished_at or datetime.now()).isoformat()
+        }
+        if self.path:
+            with open(self.path, 'a') as f:
+                f.write(json.dumps(record) + '\n')
+        else:
+            self.records.append(record)
+        self._apply(record)
+        return record
+
+    def stats(self, flow_id):
+        """Aggregates for a flow (empty if it has never run)"""
+        return self.flows.get(flow_id, FlowStats())
+
+def record_flow_run(log, flow_id, run_summary):
+    """Append a FlowExecutor run summary to the log"""
+    started = [step['started_at'] for step in run_summary.values() if step['started_at']]
+    finished = [step['finished_at'] for step in run_summary.values() if step['finished_at']]
+    duration = (max(finished) - min(started)).total_seconds() if started and finished else 0.0
+    success = all(step['status'] == 'completed' for step in run_summary.values())
+    return log.append(flow_id, duration, success, max(finished) if finished else None)
@@ -0,0 +1,226 @@
+import json
+import numpy as np
+from utils.dataset_factory import NUMERICAL_FEATURES, CATEGORICAL_FEATURES, FEATURE_COLUMNS, generate_seller_chunk
+
+# Heavy-tailed numerical features are modelled on a log scale
+LOG_FEATURES = {'seller_age_days', 'avg_transaction_amount', 'velocity_score'}
+
+def encode_features(columns):
+    """Build the float32 design matrix for a dict of seller feature columns.
+
+    Numerical features become one column each; categorical feature codes are
+    one-hot encoded. Returns the matrix and the column slice of every
+    feature, so callers can permute or drop a feature as a unit.
+    """
+    n_rows = len(columns[FEATURE_COLUMNS[0]])
+    width = len(NUMERICAL_FEATURES) + sum(len(c) for c in CATEGORICAL_FEATURES.values())
+    X = np.empty((n_rows, width), dtype=np.float32)
+
+    slices = {}
+    offset = 0
+    for name in FEATURE_COLUMNS:
+        values = np.asarray(columns[name])
+        if name in CATEGORICAL_FEATURES:
+            n_categories = len(CATEGORICAL_FEATURES[name])
+            X[:, offset:offset + n_categories] = values[:, None] == np.arange(n_categories)
+            slices[name] = slice(offset, offset + n_categories)
+            offset += n_categories
+        else:
+            X[:, offset] = np.log1p(values) if name in LOG_FEATURES else values
+            slices[name] = slice(offset, offset + 1)
+            offset += 1
+    return X, slices
+
+def _sigmoid(z):
+    return 1.0 / (1.0 + np.exp(-np.clip(z, -35, 35)))
+
+class LogisticFraudModel:
+    """L2-regularized logistic regression fitted with Newton steps.
+
+    The decision function is additive over features, so the contribution of
+    any group of columns can be computed on its own (see ``contribution``).
+    """
+
+    def __init__(self, l2=1e-3, max_iter=25, tol=1e-6):
+        self.l2 = l2
+        self.max_iter = max_iter
+        self.tol = tol
+        self.coef = None
+        self.intercept = 0.0
+        self.mean = None
+        self.scale = None
+        self.precision = None
+        self.n_seen = 0
+
+    def _standardize(self, X):
+        return (X - self.mean) / self.scale
+
+    def fit(self, X, y, warm_start=False, feature_mask=None, sample_weight=None, max_iter=None):
+        """Fit on ``X``/``y``; with ``warm_start`` continue from the current weights.
+
+        ``feature_mask`` (bool per column) pins masked-out columns to zero,
+        which is how drop-column importance refits without a feature.
+        """
+        y = np.asarray(y, dtype=np.float64)
+        if not warm_start or self.coef is None:
+            self.mean = X.mean(axis=0, dtype=np.float64)
+            self.scale = X.std(axis=0, dtype=np.float64)
+            self.scale[self.scale == 0] = 1.0
+            self.coef = np.zeros(X.shape[1])
+            self.intercept = float(np.log((y.mean() + 1e-9) / (1 - y.mean() + 1e-9)))
+
+        mask = np.ones(X.shape[1], dtype=bool) if feature_mask is None else np.asarray(feature_mask, dtype=bool)
+        self.coef[~mask] = 0.0
+        Z = ((X[:, mask] - self.mean[mask]) / self.scale[mask]).astype(np.float64)
+        Z = np.hstack([Z, np.ones((Z.shape[0], 1))])
+        weights = np.ones(len(y)) if sample_weight is None else np.asarray(sample_weight, dtype=np.float64)
+        beta = np.append(self.coef[mask], self.intercept)
+        penalty = np.full(len(beta), self.l2 * weights.sum())
+        penalty[-1] = 0.0
+
+        def objective(b):
+            z = Z @ b
+            # log(1 + e^z) - y*z, written to stay finite for large |z|
+            return float(np.sum(weights * (np.logaddexp(0, z) - y * z)) + 0.5 * np.sum(penalty * b * b))
+
+        loss = objective(beta)
+        for _ in range(max_iter or self.max_iter):
+            p = _sigmoid(Z @ beta)
+            gradient = Z.T @ (weights * (p - y)) + penalty * beta
+            hessian = (Z * (weights * p * (1 - p))[:, None]).T @ Z + np.diag(penalty)
+            step = np.linalg.solve(hessian, gradient)
+
+            # Damped Newton: halve the step until the objective improves
+            for _ in range(30):
+                candidate = beta - step
+                candidate_loss = objective(candidate)
+                if candidate_loss <= loss:
+                    break
+                step = step / 2
+            beta, loss = candidate, candidate_loss
+            if np.abs(step).max() < self.tol:
+                break
+
+        self.coef[mask] = beta[:-1]
+        self.intercept = float(beta[-1])
+        self.n_seen = self.n_seen + len(y) if warm_start else len(y)
+        if feature_mask is None:
+            p = _sigmoid(Z @ beta)
+            self.precision = (Z * (weights * p * (1 - p))[:, None]).T @ Z + np.diag(penalty)
+        return self
+
+    def partial_fit(self, X, y, max_iter=None):
+        """Update a fitted model with new rows only.
+
+        The previous fit is summarized as a Gaussian prior centred on the
+        current weights with the fit's Hessian as precision (a Laplace
+        approximation), so a few Newton steps on the new rows approximate a
+        refit on all rows seen so far at a cost that depends only on
+        ``len(X)``. Standardization stays fixed from the initial fit.
+        """
+        if self.precision is None:
+            raise ValueError("partial_fit needs a model fitted on the full feature set")
+        y = np.asarray(y, dtype=np.float64)
+        Z = np.hstack([self._standardize(X).astype(np.float64), np.ones((X.shape[0], 1))])
+        prior_beta = np.append(self.coef, self.intercept)
+        prior = self.precision
+        beta = prior_beta.copy()
+
+        def objective(b):
+            z = Z @ b
+            d = b - prior_beta
+            return float(np.sum(np.logaddexp(0, z) - y * z) + 0.5 * d @ prior @ d)
+
+        loss = objective(beta)
+        for _ in range(max_iter or self.max_iter):
+            p = _sigmoid(Z @ beta)
+            gradient = Z.T @ (p - y) + prior @ (beta - prior_beta)
+            hessian = (Z * (p * (1 - p))[:, None]).T @ Z + prior
+            step = np.linalg.solve(hessian, gradient)
+            for _ in range(30):
+                candidate = beta - step
+                candidate_loss = objective(candidate)
+                if candidate_loss <= loss:
+                    break
+                step = step / 2
+            beta, loss = candidate, candidate_loss
+            if np.abs(step).max() < self.tol:
+                break
+
+        p = _sigmoid(Z @ beta)
+        self.precision = prior + (Z * (p * (1 - p))[:, None]).T @ Z
+        self.coef = beta[:-1]
+        self.intercept = float(beta[-1])
+        self.n_seen += len(y)
+        return self
+
+    def decision_function(self, X):
+        """Log-odds of fraud for each row"""
+        return self._standardize(X) @ self.coef + self.intercept
+
+    def contribution(self, block, columns):
+        """Additive log-odds contribution of ``block``, the values of a slice of columns"""
+        return ((block - self.mean[columns]) / self.scale[columns]) @ self.coef[columns]
+
+    def predict_proba(self, X):
+        """Probability of fraud for each row"""
+        return _sigmoid(self.decision_function(X))
+
+    def to_dict(self):
+        """Serializable snapshot of the fitted parameters"""
+        return {
+            'l2': self.l2,
+            'coef': self.coef.tolist(),
+            'intercept': self.intercept,
+            'mean': self.mean.tolist(),
+            'scale': self.scale.tolist(),
+            'precision': self.precision.tolist() if self.precision is not None else None,
+            'n_seen': self.n_seen
+        }
+
+    @classmethod
+    def from_dict(cls, data):
+        model = cls(l2=data['l2'])
+        model.coef = np.array(data['coef'])
+        model.intercept = data['intercept']
+        model.mean = np.array(data['mean'])
+        model.scale = np.array(data['scale'])
+        model.precision = np.array(data['precision']) if data.get('precision') is not None else None
+        model.n_seen = data.get('n_seen', 0)
+        return model
+
+    def save(self, path):
+        with open(path, 'w') as f:
+            json.dump(self.to_dict(), f)
+
+    @classmethod
+    def load(cls, path):
+        with open(path) as f:
+            return cls.from_dict(json.load(f))
+
+def score_sellers(model, columns):
+    """Fraud probability for every seller in a dict of feature columns"""
+    X, _ = encode_features(columns)
+    return model.predict_proba(X)
+
+def train_reference_model(n_rows=200_000, seed=0):
+    """Fit the model used for playground and batch scoring on synthetic sellers"""
+    train = generate_seller_chunk(n_rows, seed=seed)
+    X, _ = encode_features(train)
+    return LogisticFraudModel().fit(X, train['is_fraud'])
+
+def log_loss(y, p):
+    """Mean binary cross-entropy"""
+    p = np.clip(p, 1e-7, 1 - 1e-7)
+    return float(-np.mean(y * np.log(p) + (1 - y) * np.log(1 - p)))
+
+def roc_auc(y, scores):
+    """Area under the ROC curve via the rank-sum formulation"""
+    y = np.asarray(y).astype(bool)
+    n_pos = y.sum()
+    n_neg = len(y) - n_pos
+    if n_pos == 0 or n_neg == 0:
+        return float('nan')
+    ranks = np.empty(len(scores))
+    ranks[np.argsort(scores, kind='mergesort')] = np.arange(1, len(scores) + 1)
+    return float((ranks[y].sum() - n_pos * (n_pos + 1) / 2) / (n_pos * n_neg))
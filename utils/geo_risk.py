@@ -0,0 +1,169 @@
+import ipaddress
+import json
+import os
+import socket
+import numpy as np
+
+UNKNOWN = -1
+
+# Score cut points for the playground's low/medium/high country risk levels
+RISK_LEVEL_CUTS = [(0.66, 'high'), (0.33, 'medium'), (0.0, 'low')]
+
+def unmap_ipv4(ip):
+    """The IPv4 address behind an IPv4-mapped IPv6 address (``::ffff:a.b.c.d``); other addresses unchanged"""
+    return (ip.ipv4_mapped or ip) if ip.version == 6 else ip
+
+def is_valid_ip(address):
+    """Whether ``address`` is a valid IPv4 or IPv6 address string"""
+    try:
+        ipaddress.ip_address(address)
+    except ValueError:
+        return False
+    return True
+
+def _ip_key(address):
+    """Integer search key for an address: IPv4 (or IPv4-mapped) as 32 bits, IPv6 as its upper 64 bits"""
+    ip = unmap_ipv4(ipaddress.ip_address(address))
+    return (4, int(ip)) if ip.version == 4 else (6, int(ip) >> 64)
+
+def build_geo_database(ranges, country_scores, output_dir):
+    """Write a geo-risk database as memory-mappable sorted interval arrays.
+
+    ``ranges`` yields ``(first_ip, last_ip, country_code)`` or
+    ``(cidr, country_code)``; ``country_scores`` maps country codes to a risk
+    score in [0, 1]. IPv6 ranges are keyed on their /64 prefix, which is the
+    finest granularity geolocation data is published at.
+    """
+    codes = sorted(country_scores)
+    code_index = {code: i for i, code in enumerate(codes)}
+    tables = {4: [], 6: []}
+
+    for entry in ranges:
+        if len(entry) == 2:
+            network = ipaddress.ip_network(entry[0], strict=False)
+            first, last, country = network[0], network[-1], entry[1]
+        else:
+            first, last, country = entry
+        version, start = _ip_key(first)
+        _, end = _ip_key(last)
+        tables[version].append((start, end, code_index[country]))
+
+    os.makedirs(output_dir, exist_ok=True)
+    for version, rows in tables.items():
+        rows.sort()
+        starts = np.array([r[0] for r in rows], dtype=np.uint64)
+        ends = np.array([r[1] for r in rows], dtype=np.uint64)
+        if len(rows) > 1 and np.any(starts[1:] <= ends[:-1]):
+            raise ValueError(f"Overlapping IPv{version} ranges in geo database")
+        np.save(os.path.join(output_dir, f'ipv{version}_starts.npy'), starts)
+        np.save(os.path.join(output_dir, f'ipv{version}_ends.npy'), ends)
+        np.save(os.path.join(output_dir, f'ipv{version}_country.npy'), np.array([r[2] for r in rows], dtype=np.int16))
+
+    with open(os.path.join(output_dir, 'countries.json'), 'w') as f:
+        json.dump({'codes': codes, 'scores': [country_scores[code] for code in codes]}, f)
+
+def build_sample_geo_database(output_dir, country_scores, n_ranges=1_000_000, seed=0):
+    """Split the IPv4 space (and a slice of IPv6) into random country ranges"""
+    rng = np.random.default_rng(seed)
+    codes = sorted(country_scores)
+
+    os.makedirs(output_dir, exist_ok=True)
+    for version, space in ((4, 2 ** 32), (6, 2 ** 64)):
+        count = n_ranges if version == 4 else max(1, n_ranges // 10)
+        boundaries = np.unique(rng.integers(1, space - 1, count - 1, dtype=np.uint64, endpoint=False))
+        # Plain Python ints would promote the uint64 boundaries to float64 and round them
+        starts = np.concatenate([np.zeros(1, dtype=np.uint64), boundaries])
+        ends = np.concatenate([boundaries - np.uint64(1), np.array([space - 1], dtype=np.uint64)])
+        assert (starts[1:] > ends[:-1]).all()
+        # Leave every tenth range unallocated so unknown lookups are exercised
+        keep = np.arange(len(starts)) % 10 != 9
+        countries = rng.integers(0, len(codes), len(starts)).astype(np.int16)
+        np.save(os.path.join(output_dir, f'ipv{version}_starts.npy'), starts[keep])
+        np.save(os.path.join(output_dir, f'ipv{version}_ends.npy'), ends[keep])
+        np.save(os.path.join(output_dir, f'ipv{version}_country.npy'), countries[keep])
+
+    with open(os.path.join(output_dir, 'countries.json'), 'w') as f:
+        json.dump({'codes': codes, 'scores': [country_scores[code] for code in codes]}, f)
+
+class GeoRiskResolver:
+    """Resolve IP addresses and country codes to country risk scores.
+
+    Ranges are sorted, non-overlapping intervals loaded as memory-mapped
+    arrays, so opening a database with millions of ranges is instant and
+    each lookup is a binary search (``np.searchsorted``) over the starts.
+    """
+
+    def __init__(self, database_dir, default_score=0.5):
+        with open(os.path.join(database_dir, 'countries.json')) as f:
+            countries = json.load(f)
+        self.codes = countries['codes']
+        self.code_index = {code: i for i, code in enumerate(self.codes)}
+        self.scores = np.array(countries['scores'], dtype=np.float32)
+        self.default_score = default_score
+
+        self.tables = {}
+        for version in (4, 6):
+            self.tables[version] = tuple(
+                np.load(os.path.join(database_dir, f'ipv{version}_{name}.npy'), mmap_mode='r')
+                for name in ('starts', 'ends', 'country')
+            )
+
+    def _lookup_keys(self, version, keys):
+        """Country indices for integer keys; UNKNOWN where no range matches"""
+        starts, ends, countries = self.tables[version]
+        keys = np.asarray(keys, dtype=np.uint64)
+        if len(starts) == 0:
+            return np.full(keys.shape, UNKNOWN, dtype=np.int16)
+        position = np.searchsorted(starts, keys, side='right') - 1
+        clipped = np.maximum(position, 0)
+        found = (position >= 0) & (keys <= ends[clipped])
+        return np.where(found, countries[clipped], UNKNOWN).astype(np.int16)
+
+    def _scores_for(self, country):
+        return np.where(country >= 0, self.scores[np.maximum(country, 0)], self.default_score)
+
+    def lookup_ipv4(self, addresses):
+        """Bulk lookup for IPv4 addresses given as integers; returns (country codes index, scores)"""
+        country = self._lookup_keys(4, addresses)
+        return country, self._scores_for(country)
+
+    def lookup_ips(self, addresses):
+        """Bulk lookup for IP address strings (IPv4 and IPv6 mixed); returns risk scores.
+
+        IPv4-mapped IPv6 addresses resolve through the IPv4 table; invalid
+        addresses score ``default_score`` (check them with ``is_valid_ip``).
+        """
+        rows, keys = {4: [], 6: []}, {4: [], 6: []}
+        for row, address in enumerate(addresses):
+            try:
+                # Plain IPv4 is the common case and inet_pton parses it several times faster
+                version, key = 4, int.from_bytes(socket.inet_pton(socket.AF_INET, address), 'big')
+            except OSError:
+                try:
+                    version, key = _ip_key(address)
+                except ValueError:
+                    continue
+            rows[version].append(row)
+            keys[version].append(key)
+
+        country = np.full(len(addresses), UNKNOWN, dtype=np.int16)
+        for version in (4, 6):
+            if rows[version]:
+                country[rows[version]] = self._lookup_keys(version, np.array(keys[version], dtype=np.uint64))
+        return self._scores_for(country)
+
+    def country_codes(self, country):
+        """Map country indices back to ISO codes (None for unknown)"""
+        return [self.codes[i] if i >= 0 else None for i in country]
+
+    def lookup_countries(self, codes):
+        """Bulk lookup of risk scores for ISO country codes"""
+        country = np.array([self.code_index.get(code.upper(), UNKNOWN) for code in codes], dtype=np.int16)
+        return self._scores_for(country)
+
+def risk_level(score):
+    """Bucket a country risk score into the playground's low/medium/high levels"""
+    for cut, level in RISK_LEVEL_CUTS:
+        if score >= cut:
+            return level
+    return 'low'
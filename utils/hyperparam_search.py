@@ -0,0 +1,296 @@
+import argparse
+import os
+import threading
+import time
+import uuid
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from datetime import datetime
+import numpy as np
+from utils.dataset_factory import generate_seller_chunk
+from utils.fraud_model import LogisticFraudModel, encode_features, log_loss, roc_auc, _sigmoid
+from utils.shared_arrays import SharedArray
+from utils.threshold_sweep import threshold_curve
+from utils.tree_models import GradientBoostedTrees, RandomForest, bin_features
+
+# Each search already uses every core, so only one runs at a time per process
+_search_slot = threading.Lock()
+
+def _log_uniform(rng, low, high):
+    return float(np.exp(rng.uniform(np.log(low), np.log(high))))
+
+# Algorithm family -> (parameter sampler, smallest budget in the family's own units)
+SEARCH_SPACE = {
+    'XGBoost': (lambda rng: {
+        'learning_rate': _log_uniform(rng, 0.02, 0.5),
+        'max_depth': int(rng.integers(2, 6)),
+        'l2': _log_uniform(rng, 0.1, 20.0),
+        'min_child_weight': _log_uniform(rng, 0.5, 50.0),
+        'subsample': float(rng.uniform(0.5, 1.0))
+    }, 4),
+    'Random Forest': (lambda rng: {
+        'max_depth': int(rng.integers(3, 9)),
+        'feature_fraction': float(rng.uniform(0.3, 1.0)),
+        'min_child_weight': _log_uniform(rng, 1.0, 200.0)
+    }, 2),
+    'Logistic Regression': (lambda rng: {
+        'l2': _log_uniform(rng, 1e-6, 1e-1)
+    }, 1)
+}
+# What one budget unit means for each family
+BUDGET_UNITS = {'XGBoost': 'rounds', 'Random Forest': 'trees', 'Logistic Regression': 'Newton steps'}
+
+def build_model(family, params, seed=0):
+    """Untrained model of an algorithm family"""
+    if family == 'XGBoost':
+        return GradientBoostedTrees(seed=seed, **params)
+    if family == 'Random Forest':
+        return RandomForest(seed=seed, **params)
+    if family == 'Logistic Regression':
+        return LogisticFraudModel(l2=params['l2'])
+    raise ValueError(f"Unknown algorithm family: {family}")
+
+def best_f1(y, scores):
+    """Best F1 over all decision thresholds"""
+    f1 = threshold_curve(scores, y).f1()
+    return float(f1.max()) if len(f1) else 0.0
+
+# Per-process state populated by the pool initializer
+_worker = {}
+
+def _init_worker(specs):
+    """Attach to the shared training and validation arrays once per worker"""
+    _worker.update({name: SharedArray.attach(spec) for name, spec in specs.items()})
+
+def _train_trial(family, params, seed, model, done, budget):
+    """Continue training ``model`` (or a fresh one) from ``done`` to ``budget`` units and score it"""
+    started = time.perf_counter()
+    model = model or build_model(family, params, seed)
+    y_train, y_val = _worker['y_train'].array, _worker['y_val'].array
+    if family == 'Logistic Regression':
+        model.fit(_worker['X_train'].array, y_train, warm_start=True, max_iter=budget - done)
+        logits = model.decision_function(_worker['X_val'].array)
+    else:
+        model.fit_more(_worker['bins_train'].array, y_train, budget - done)
+        logits = model.decision_function(_worker['bins_val'].array)
+    metrics = {
+        'val_loss': log_loss(y_val, _sigmoid(logits)),
+        'val_auc': roc_auc(y_val, logits),
+        'val_f1': best_f1(y_val, logits)
+    }
+    return model, metrics, time.perf_counter() - started
+
+class HyperparameterSearch:
+    """Asynchronous successive halving (ASHA) over a local process pool.
+
+    ``n_configs`` configurations are sampled across the algorithm families
+    and each starts at its family's smallest budget. Whenever a worker is
+    free, the best not-yet-promoted trial in the top ``1/eta`` of any rung is
+    continued with ``eta`` times the budget; otherwise a new configuration
+    starts. There is no barrier between rungs, so every core stays busy and
+    poor configurations stop after their first, cheapest rung. Models are
+    resumed rather than retrained when promoted.
+
+    Every rung result is streamed into ``store`` (a MetricStore) as the
+    trial's ``val_loss``/``val_auc``/``val_f1`` at step = budget.
+    """
+
+    def __init__(self, store=None, n_configs=27, eta=3, max_rungs=3, workers=None,
+                 families=None, n_train=100_000, n_val=50_000, seed=None):
+        self.store = store
+        self.n_configs = n_configs
+        self.eta = eta
+        self.max_rungs = max_rungs
+        self.workers = workers or os.cpu_count()
+        self.families = families or list(SEARCH_SPACE)
+        self.n_train = n_train
+        self.n_val = n_val
+        self.seed = int(time.time()) if seed is None else seed
+        # Unique across sessions and restarts, since trial run ids in a shared store derive from it
+        self.search_id = f"hps-{datetime.now():%Y%m%d-%H%M%S}-{uuid.uuid4().hex[:6]}"
+        self.status = 'pending'
+        self.error = None
+        self.started_at = None
+        self.finished_at = None
+        self.trials = []
+        self.thread = None
+
+    def _sample_trials(self):
+        rng = np.random.default_rng(self.seed)
+        for i in range(self.n_configs):
+            family = self.families[i % len(self.families)]
+            sampler, min_budget = SEARCH_SPACE[family]
+            self.trials.append({
+                'id': f"{self.search_id}-t{i + 1:02d}",
+                'family': family,
+                'params': sampler(rng),
+                'seed': int(rng.integers(2**31)),
+                'min_budget': min_budget,
+                'rung': -1,
+                'results': [],  # one per completed rung
+                'promoted_to': -1,
+                'status': 'pending',
+                'model': None
+            })
+
+    def _budget(self, trial, rung):
+        return trial['min_budget'] * self.eta ** rung
+
+    def _next_job(self):
+        """Promote the best eligible trial from the highest rung, else start a new one"""
+        for rung in range(self.max_rungs - 2, -1, -1):
+            finished = [t for t in self.trials if len(t['results']) > rung]
+            ranked = sorted(finished, key=lambda t: t['results'][rung]['val_loss'])
+            for trial in ranked[:len(finished) // self.eta]:
+                if trial['promoted_to'] == rung and trial['status'] == 'paused':
+                    trial['promoted_to'] = rung + 1
+                    return trial, rung + 1
+        for trial in self.trials:
+            if trial['status'] == 'pending':
+                trial['promoted_to'] = 0
+                return trial, 0
+        return None
+
+    def _prepare_data(self):
+        data = generate_seller_chunk(self.n_train + self.n_val, seed=self.seed)
+        X, _ = encode_features(data)
+        y = data['is_fraud'].astype(np.float64)
+        bins, edges = bin_features(X[:self.n_train])
+        bins_val, _ = bin_features(X[self.n_train:], edges=edges)
+        return {
+            'X_train': SharedArray.from_array(X[:self.n_train]),
+            'X_val': SharedArray.from_array(X[self.n_train:]),
+            'bins_train': SharedArray.from_array(bins),
+            'bins_val': SharedArray.from_array(bins_val),
+            'y_train': SharedArray.from_array(y[:self.n_train]),
+            'y_val': SharedArray.from_array(y[self.n_train:])
+        }
+
+    def _record(self, trial, rung, metrics, seconds):
+        budget = self._budget(trial, rung)
+        trial['results'].append({'rung': rung, 'budget': budget, 'seconds': seconds, **metrics})
+        trial['rung'] = rung
+        if self.store is not None:
+            for metric, value in metrics.items():
+                self.store.log(trial['id'], metric, budget, value)
+
+    def _set_status(self, trial, status):
+        trial['status'] = status
+        if self.store is not None:
+            self.store.log_run(trial['id'], status=status)
+
+    def run(self):
+        """Run the search to completion in the calling thread"""
+        self.status = 'running'
+        self.started_at = datetime.now()
+        shared = {}
+        try:
+            self._sample_trials()
+            if self.store is not None:
+                for trial in self.trials:
+                    self.store.log_run(trial['id'], name=f"{trial['family']} {trial['id'][-3:]} ({self.search_id})",
+                                       algorithm=trial['family'], params=trial['params'], search=self.search_id,
+                                       status='pending')
+            shared = self._prepare_data()
+            with ProcessPoolExecutor(max_workers=self.workers, initializer=_init_worker,
+                                     initargs=({name: array.spec for name, array in shared.items()},)) as pool:
+                running = {}
+                while True:
+                    while len(running) < self.workers:
+                        job = self._next_job()
+                        if job is None:
+                            break
+                        trial, rung = job
+                        self._set_status(trial, 'running')
+                        done_budget = trial['results'][-1]['budget'] if trial['results'] else 0
+                        future = pool.submit(_train_trial, trial['family'], trial['params'], trial['seed'],
+                                             trial['model'], done_budget, self._budget(trial, rung))
+                        running[future] = (trial, rung)
+                    if not running:
+                        break
+                    done, _ = wait(running, return_when=FIRST_COMPLETED)
+                    for future in done:
+                        trial, rung = running.pop(future)
+                        trial['model'], metrics, seconds = future.result()
+                        self._record(trial, rung, metrics, seconds)
+                        self._set_status(trial, 'completed' if rung == self.max_rungs - 1 else 'paused')
+            for trial in self.trials:
+                if trial['status'] == 'paused':
+                    self._set_status(trial, 'stopped')
+            self.status = 'completed'
+        except Exception as e:
+            self.status = 'failed'
+            self.error = str(e)
+            raise
+        finally:
+            self.finished_at = datetime.now()
+            for array in shared.values():
+                array.close()
+            if self.store is not None:
+                self.store.flush()
+        return self.leaderboard()
+
+    def start(self):
+        """Run the search on a background thread; poll ``progress`` for results.
+
+        Raises RuntimeError while another search started this way is running.
+        """
+        if not _search_slot.acquire(blocking=False):
+            raise RuntimeError("Another hyperparameter search is still running; wait for it to finish")
+
+        def target():
+            try:
+                self.run()
+            except Exception:
+                pass  # recorded in self.status / self.error
+            finally:
+                _search_slot.release()
+        self.thread = threading.Thread(target=target, name=self.search_id, daemon=True)
+        self.thread.start()
+        return self
+
+    def leaderboard(self, n=None):
+        """Trials ranked by their validation loss at the highest rung they reached"""
+        scored = [t for t in self.trials if t['results']]
+        ranked = sorted(scored, key=lambda t: (-t['rung'], t['results'][-1]['val_loss']))
+        return [{
+            'id': t['id'],
+            'family': t['family'],
+            'params': t['params'],
+            'status': t['status'],
+            'budget': f"{t['results'][-1]['budget']} {BUDGET_UNITS[t['family']]}",
+            **{k: t['results'][-1][k] for k in ('val_loss', 'val_auc', 'val_f1')}
+        } for t in ranked[:n]]
+
+    def progress(self):
+        """Counts of trials per status and units of work done"""
+        counts = {status: 0 for status in ('pending', 'running', 'paused', 'stopped', 'completed')}
+        for trial in self.trials:
+            counts[trial['status']] += 1
+        counts['rung_results'] = sum(len(t['results']) for t in self.trials)
+        counts['trial_seconds'] = sum(r['seconds'] for t in self.trials for r in t['results'])
+        return counts
+
+def main():
+    """Command-line entry point for running a search and reporting scaling"""
+    parser = argparse.ArgumentParser(description="Successive-halving hyperparameter search for the fraud model")
+    parser.add_argument('--configs', type=int, default=27)
+    parser.add_argument('--eta', type=int, default=3)
+    parser.add_argument('--rungs', type=int, default=3)
+    parser.add_argument('--workers', type=int, default=None)
+    parser.add_argument('--train-rows', type=int, default=100_000)
+    parser.add_argument('--seed', type=int, default=0)
+    args = parser.parse_args()
+
+    search = HyperparameterSearch(n_configs=args.configs, eta=args.eta, max_rungs=args.rungs, workers=args.workers,
+                                  n_train=args.train_rows, n_val=args.train_rows // 2, seed=args.seed)
+    leaderboard = search.run()
+    elapsed = (search.finished_at - search.started_at).total_seconds()
+    progress = search.progress()
+    print(f"✅ {args.configs} configs, {progress['rung_results']} rung results in {elapsed:.1f}s "
+          f"on {search.workers} workers ({progress['trial_seconds']:.1f}s of trial compute)")
+    for row in leaderboard[:5]:
+        print(f"   {row['id']}  {row['family']:<20} {row['budget']:<16} "
+              f"loss {row['val_loss']:.4f}  auc {row['val_auc']:.4f}  f1 {row['val_f1']:.3f}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,119 @@
+import json
+import os
+from bisect import bisect
+from collections import defaultdict
+from datetime import date, datetime
+
+GRAINS = ('day', 'month', 'quarter', 'all')
+KINDS = ('savings', 'cost')
+
+def period_keys(day):
+    """Rollup period for each grain, e.g. '2024-05-03', '2024-05', 'Q2 2024'"""
+    return {
+        'day': day.isoformat(),
+        'month': day.strftime('%Y-%m'),
+        'quarter': f"Q{(day.month - 1) // 3 + 1} {day.year}",
+        'all': None
+    }
+
+def format_money_delta(amount):
+    """Signed delta in thousands, e.g. '+$340K'"""
+    return f"{'+' if amount >= 0 else '-'}${abs(amount) / 1e3:,.0f}K"
+
+def _period_order(grain, period):
+    """Sort key for period labels ('Q1 2024' does not sort as a string)"""
+    if grain == 'quarter':
+        quarter, year = period.split()
+        return year, quarter
+    return period
+
+class KpiLedger:
+    """Append-only ledger of savings and cost events with materialized rollups.
+
+    Every insert adds its amount to the running totals of its day, month,
+    quarter and all-time periods, each overall, per category and per fraud
+    type. Dashboard reads are plain dictionary lookups however many years
+    of events have been recorded. Like FlowRunLog, events go to a JSON-lines
+    file when ``path`` is given and are replayed on startup.
+    """
+
+    def __init__(self, path=None):
+        self.path = path
+        self.events = 0
+        self.rollups = defaultdict(float)  # (grain, period, kind, group) -> amount
+        self.periods = {grain: [] for grain in GRAINS if grain != 'all'}
+        self.seen_periods = {grain: set() for grain in self.periods}
+        self.period_keys = {grain: [] for grain in self.periods}  # sort keys parallel to self.periods
+        self.groups = defaultdict(set)  # (kind, dimension) -> values seen
+        if path and os.path.exists(path):
+            with open(path) as f:
+                for line in f:
+                    if line.strip():
+                        self._apply(json.loads(line))
+
+    def _apply(self, event):
+        day = date.fromisoformat(event['date'])
+        groups = [None, f"category:{event['category']}"]
+        if event.get('fraud_type'):
+            groups.append(f"fraud_type:{event['fraud_type']}")
+            self.groups[(event['kind'], 'fraud_type')].add(event['fraud_type'])
+        self.groups[(event['kind'], 'category')].add(event['category'])
+
+        for grain, period in period_keys(day).items():
+            if grain != 'all' and period not in self.seen_periods[grain]:
+                self.seen_periods[grain].add(period)
+                # bisect on a parallel key list; insort(key=...) needs Python 3.10
+                order = _period_order(grain, period)
+                position = bisect(self.period_keys[grain], order)
+                self.period_keys[grain].insert(position, order)
+                self.periods[grain].insert(position, period)
+            for group in groups:
+                self.rollups[(grain, period, event['kind'], group)] += event['amount']
+        self.events += 1
+
+    def add(self, kind, amount, category, day=None, fraud_type=None):
+        """Record a savings or cost event and update every rollup it belongs to"""
+        if kind not in KINDS:
+            raise ValueError(f"Unknown ledger event kind: {kind}")
+        day = day or date.today()
+        if isinstance(day, datetime):
+            day = day.date()
+        event = {'kind': kind, 'amount': float(amount), 'category': category,
+                 'fraud_type': fraud_type, 'date': day.isoformat()}
+        if self.path:
+            with open(self.path, 'a') as f:
+                f.write(json.dumps(event) + '\n')
+        self._apply(event)
+        return event
+
+    def total(self, kind, grain='all', period=None, category=None, fraud_type=None):
+        """Precomputed total for one period, optionally for one category or fraud type"""
+        group = f"category:{category}" if category else f"fraud_type:{fraud_type}" if fraud_type else None
+        return self.rollups.get((grain, period, kind, group), 0.0)
+
+    def latest_periods(self, grain, n, offset=0):
+        """The ``n`` most recent periods with any events, skipping the last ``offset``"""
+        periods = self.periods[grain]
+        return periods[max(0, len(periods) - n - offset):len(periods) - offset]
+
+    def trailing_total(self, kind, grain='month', n=12, offset=0, **group):
+        """Total over the ``n`` most recent periods (e.g. trailing twelve months)"""
+        return sum(self.total(kind, grain, period, **group) for period in self.latest_periods(grain, n, offset))
+
+    def breakdown(self, kind, dimension, grain='all', period=None, periods=None):
+        """Totals per category or fraud type, over one period or a list of periods"""
+        periods = periods if periods is not None else [period]
+        return {
+            value: sum(self.total(kind, grain, p, **{dimension: value}) for p in periods)
+            for value in sorted(self.groups[(kind, dimension)])
+        }
+
+    def cumulative_roi_series(self, grain='quarter'):
+        """(period, cumulative ROI %) where ROI = (savings - cost) / cost"""
+        savings = cost = 0.0
+        series = []
+        for period in self.periods[grain]:
+            savings += self.total('savings', grain, period)
+            cost += self.total('cost', grain, period)
+            series.append((period, (savings - cost) / cost * 100 if cost else 0.0))
+        return series
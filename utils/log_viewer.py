@@ -0,0 +1,205 @@
+import mmap
+import os
+import random
+import re
+import threading
+from bisect import bisect_right
+from datetime import datetime, timedelta
+
+TIMESTAMP_LENGTH = 19  # 'YYYY-MM-DD HH:MM:SS' or 'YYYY-MM-DDTHH:MM:SS'
+
+def parse_timestamp(line):
+    """Parse the leading timestamp of a log line, or None if it has none"""
+    try:
+        return datetime.fromisoformat(line[:TIMESTAMP_LENGTH].decode('ascii'))
+    except (ValueError, UnicodeDecodeError):
+        return None
+
+class LogFile:
+    """Memory-mapped view of a (possibly multi-GB) append-only log file.
+
+    The tail is found by scanning backwards for newlines, new lines are
+    picked up incrementally from the last read offset, and a sparse
+    timestamp index (one sample every ``index_stride`` bytes) turns a time
+    jump into a binary search plus a short forward scan. Lines are assumed
+    to start with an ISO timestamp and to be written in time order.
+    Instances are shared across sessions, so every read holds ``lock``
+    while the file may be remapped; callers keep their own read offsets.
+    """
+
+    def __init__(self, path, index_stride=1 << 20, search_chunk=8 << 20):
+        self.path = path
+        self.index_stride = index_stride
+        self.search_chunk = search_chunk
+        self.lock = threading.RLock()
+        self.file = open(path, 'rb')
+        self.map = None
+        self.size = 0
+        self.index_times = []
+        self.index_offsets = []
+        self._remap()
+
+    def _remap(self):
+        """Map the file again if it grew (or was truncated) since the last look; callers hold ``lock``"""
+        size = os.fstat(self.file.fileno()).st_size
+        if size == self.size and self.map is not None:
+            return False
+        if size < self.size:
+            # Truncated or rotated: start over
+            self.index_times, self.index_offsets = [], []
+        if self.map is not None:
+            self.map.close()
+        self.map = mmap.mmap(self.file.fileno(), size, access=mmap.ACCESS_READ) if size else None
+        self.size = size
+        self._extend_index()
+        return True
+
+    def _line_at(self, offset):
+        """Return (line bytes, next offset) for the line starting at ``offset``"""
+        end = self.map.find(b'\n', offset)
+        end = self.size if end == -1 else end
+        return self.map[offset:end], end + 1
+
+    def _extend_index(self):
+        """Sample one line timestamp per stride over the not-yet-indexed region"""
+        if self.map is None:
+            return
+        position = self.index_offsets[-1] + self.index_stride if self.index_offsets else 0
+        while position < self.size:
+            start = 0 if position == 0 else self.map.find(b'\n', position - 1) + 1
+            if start <= 0 and position != 0:
+                break
+            # Skip lines without a timestamp (stack traces, continuations)
+            while start < self.size:
+                line, next_start = self._line_at(start)
+                timestamp = parse_timestamp(line)
+                if timestamp is not None:
+                    self.index_times.append(timestamp)
+                    self.index_offsets.append(start)
+                    break
+                start = next_start
+            position = max(position, start) + self.index_stride
+
+    def _last_lines(self, begin, stop, n):
+        """Last ``n`` lines in [begin, stop), oldest first"""
+        end = stop
+        if self.map[end - 1:end] == b'\n':
+            end -= 1
+        lines = []
+        while len(lines) < n and end > begin:
+            start = max(begin, self.map.rfind(b'\n', begin, end) + 1)
+            lines.append(self.map[start:end].decode('utf-8', errors='replace'))
+            end = start - 1
+        return lines[::-1]
+
+    def _last_matches(self, regex, begin, stop, n):
+        """Start offsets of the last ``n`` lines in [begin, stop) matching ``regex``, oldest first.
+
+        The range is scanned backwards in ``search_chunk`` blocks cut at line
+        boundaries, so recent matches are found without scanning the whole file.
+        """
+        starts = []
+        chunk_end = stop
+        while chunk_end > begin and len(starts) < n:
+            chunk_start = max(begin, chunk_end - self.search_chunk)
+            if chunk_start > begin:
+                chunk_start = max(begin, self.map.rfind(b'\n', begin, chunk_start) + 1)
+            found = []
+            # re scans the mapped bytes directly; no per-line Python loop
+            for match in regex.finditer(self.map, chunk_start, chunk_end):
+                if match.start() >= chunk_end:
+                    break  # empty match at the cut, which belongs to the next block
+                line_start = self.map.rfind(b'\n', 0, match.start()) + 1
+                if not found or found[-1] != line_start:
+                    found.append(line_start)
+            starts[:0] = found
+            chunk_end = chunk_start
+        return starts[-n:]
+
+    def tail(self, n=50):
+        """Last ``n`` lines, oldest first"""
+        with self.lock:
+            self._remap()
+            if self.map is None:
+                return []
+            return self._last_lines(0, self.size, n)
+
+    def read_from(self, offset):
+        """Complete lines written at or after ``offset``, and the offset to resume from"""
+        with self.lock:
+            self._remap()
+            if self.map is None or offset > self.size:
+                # File was truncated or rotated under the caller
+                offset = 0
+            last_newline = self.map.rfind(b'\n', offset) if self.map is not None else -1
+            if last_newline == -1:
+                return [], offset
+            chunk = self.map[offset:last_newline]
+            return chunk.decode('utf-8', errors='replace').split('\n'), last_newline + 1
+
+    def seek_time(self, when):
+        """Byte offset of the first line stamped at or after ``when``"""
+        with self.lock:
+            self._remap()
+            if self.map is None:
+                return 0
+            slot = bisect_right(self.index_times, when) - 1
+            offset = self.index_offsets[slot] if slot >= 0 else 0
+            while offset < self.size:
+                line, next_offset = self._line_at(offset)
+                timestamp = parse_timestamp(line)
+                if timestamp is not None and timestamp >= when:
+                    return offset
+                offset = next_offset
+            return self.size
+
+    def search(self, pattern=None, start=None, end=None, limit=200):
+        """Newest ``limit`` lines matching a regex, optionally within a [start, end) time range, oldest first"""
+        with self.lock:
+            self._remap()
+            if self.map is None:
+                return []
+            begin = self.seek_time(start) if start else 0
+            stop = self.seek_time(end) if end else self.size
+            if pattern is None:
+                return self._last_lines(begin, stop, limit)
+
+            # MULTILINE so ^ and $ anchor at every line of the mapped file, not only its ends
+            regex = re.compile(pattern.encode() if isinstance(pattern, str) else pattern, re.MULTILINE)
+            return [self._line_at(line_start)[0].decode('utf-8', errors='replace')
+                    for line_start in self._last_matches(regex, begin, stop, limit)]
+
+    def close(self):
+        with self.lock:
+            if self.map is not None:
+                self.map.close()
+                self.map = None
+            self.file.close()
+
+def append_log_line(path, level, source, message, when=None):
+    """Append one line in the viewer's format"""
+    os.makedirs(os.path.dirname(path) or '.', exist_ok=True)
+    with open(path, 'a') as f:
+        f.write(f"{when or datetime.now():%Y-%m-%d %H:%M:%S} {level:<5} [{source}] {message}\n")
+
+def write_sample_log(path, n_lines=100_000, end=None, seconds_per_line=0.5, seed=0):
+    """Write a synthetic deployment/system log ending at ``end`` for trying the viewer"""
+    rng = random.Random(seed)
+    end = end or datetime.now()
+    start = end - timedelta(seconds=n_lines * seconds_per_line)
+    messages = [
+        ('INFO', 'model-serving', 'Inference request served in {n}ms'),
+        ('INFO', 'deployer', 'Deployment dep-{n:05d} progressed to next step'),
+        ('INFO', 'feature-store', 'Feature refresh completed for {n} sellers'),
+        ('WARN', 'node-3', 'Memory usage at {n}%'),
+        ('WARN', 'gateway', 'Slow upstream response: {n}ms'),
+        ('ERROR', 'model-serving', 'Model endpoint timeout after {n}ms'),
+        ('ERROR', 'deployer', 'Quality gate failed for dep-{n:05d}')
+    ]
+    weights = [40, 20, 15, 10, 8, 4, 3]
+    os.makedirs(os.path.dirname(path) or '.', exist_ok=True)
+    with open(path, 'w') as f:
+        for i in range(n_lines):
+            level, source, template = rng.choices(messages, weights)[0]
+            timestamp = start + timedelta(seconds=i * seconds_per_line)
+            f.write(f"{timestamp:%Y-%m-%d %H:%M:%S} {level:<5} [{source}] {template.format(n=rng.randint(1, 99999) % 1000)}\n")
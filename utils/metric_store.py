@@ -0,0 +1,178 @@
+import json
+import os
+import threading
+from collections import defaultdict
+from datetime import datetime
+import numpy as np
+
+STEP_DTYPE = np.dtype('<i4')
+VALUE_DTYPE = np.dtype('<f4')
+
+def _file_size(path):
+    return os.path.getsize(path) if os.path.exists(path) else 0
+
+def _replay_jsonl(path):
+    """(record, end offset) per complete line of a JSON-lines file.
+
+    A torn or unparsable tail, e.g. from a crash mid-append, is truncated
+    away so the next append starts on a fresh line instead of extending it.
+    """
+    records, good = [], 0
+    if not os.path.exists(path):
+        return records
+    with open(path, 'rb+') as f:
+        for line in f:
+            if not line.endswith(b'\n'):
+                break
+            if line.strip():
+                try:
+                    records.append((json.loads(line), good + len(line)))
+                except ValueError:
+                    break
+            good += len(line)
+        f.truncate(good)
+    return records
+
+class MetricStore:
+    """Column-oriented, append-only store of per-step experiment metrics.
+
+    Steps and values are appended to two flat column files. Points are
+    buffered per (run, metric) and written as one contiguous segment once
+    ``flush_points`` have accumulated (or on ``flush``), and every segment
+    gets a line in ``segments.jsonl`` recording where it lives. Reading a
+    run's curve touches only that run's segments, so comparing 50 runs
+    costs the same however many other runs are stored.
+
+    Column data is written before its index line, so a crash can only leave
+    unindexed bytes at the end of the columns or a torn last index line;
+    both are truncated on open.
+    """
+
+    def __init__(self, path, flush_points=4096):
+        self.path = path
+        self.flush_points = flush_points
+        self.steps_path = os.path.join(path, 'steps.i4')
+        self.values_path = os.path.join(path, 'values.f4')
+        self.segments_path = os.path.join(path, 'segments.jsonl')
+        self.runs_path = os.path.join(path, 'runs.jsonl')
+        self.lock = threading.Lock()
+        self.index = defaultdict(list)  # (run_id, metric) -> [(offset, count), ...]
+        self.run_metrics = defaultdict(set)
+        self.runs = {}
+        self.buffers = defaultdict(lambda: ([], []))
+        self.points = 0
+        os.makedirs(path, exist_ok=True)
+        self._recover()
+
+    def _recover(self):
+        """Load the run and segment index, cutting torn lines and unindexed column bytes"""
+        for run, _ in _replay_jsonl(self.runs_path):
+            self.runs.setdefault(run['run_id'], {}).update(run)
+
+        # Segments whose column bytes are missing are dropped along with everything after them
+        capacity = min(_file_size(self.steps_path) // STEP_DTYPE.itemsize,
+                       _file_size(self.values_path) // VALUE_DTYPE.itemsize)
+        segments = _replay_jsonl(self.segments_path)
+        indexed_bytes = 0
+        for segment, end in segments:
+            if segment['offset'] + segment['count'] > capacity:
+                break
+            self._index_segment(segment['run_id'], segment['metric'], segment['offset'], segment['count'])
+            indexed_bytes = end
+        if segments and indexed_bytes < segments[-1][1]:
+            with open(self.segments_path, 'ab') as f:
+                f.truncate(indexed_bytes)
+
+        for column_path, dtype in ((self.steps_path, STEP_DTYPE), (self.values_path, VALUE_DTYPE)):
+            with open(column_path, 'ab') as f:
+                f.truncate(self.points * dtype.itemsize)
+
+    def _index_segment(self, run_id, metric, offset, count):
+        self.index[(run_id, metric)].append((offset, count))
+        self.run_metrics[run_id].add(metric)
+        self.points = max(self.points, offset + count)
+
+    def log_run(self, run_id, **params):
+        """Register a run (or update its parameters, e.g. status)"""
+        record = {'run_id': run_id, **params}
+        with self.lock:
+            if run_id not in self.runs:
+                record.setdefault('created_at', datetime.now().isoformat())
+            with open(self.runs_path, 'a') as f:
+                f.write(json.dumps(record) + '\n')
+            self.runs.setdefault(run_id, {}).update(record)
+
+    def log(self, run_id, metric, step, value):
+        """Append one point; it is written with the rest of its segment"""
+        self.log_many(run_id, metric, [step], [value])
+
+    def log_many(self, run_id, metric, steps, values):
+        """Append a batch of points for one run and metric"""
+        with self.lock:
+            buffered_steps, buffered_values = self.buffers[(run_id, metric)]
+            buffered_steps.extend(np.asarray(steps).tolist())
+            buffered_values.extend(np.asarray(values).tolist())
+            if len(buffered_steps) >= self.flush_points:
+                self._write_segment(run_id, metric)
+
+    def _write_segment(self, run_id, metric):
+        steps, values = self.buffers.pop((run_id, metric))
+        if not steps:
+            return
+        with open(self.steps_path, 'ab') as f:
+            f.write(np.asarray(steps, dtype=STEP_DTYPE).tobytes())
+        with open(self.values_path, 'ab') as f:
+            f.write(np.asarray(values, dtype=VALUE_DTYPE).tobytes())
+        segment = {'run_id': run_id, 'metric': metric, 'offset': self.points, 'count': len(steps)}
+        with open(self.segments_path, 'a') as f:
+            f.write(json.dumps(segment) + '\n')
+        self._index_segment(run_id, metric, segment['offset'], segment['count'])
+
+    def flush(self):
+        """Write every buffered point to the column files"""
+        with self.lock:
+            for key in list(self.buffers):
+                self._write_segment(*key)
+
+    def _columns(self):
+        if not self.points:
+            return np.empty(0, STEP_DTYPE), np.empty(0, VALUE_DTYPE)
+        return (np.memmap(self.steps_path, dtype=STEP_DTYPE, mode='r', shape=(self.points,)),
+                np.memmap(self.values_path, dtype=VALUE_DTYPE, mode='r', shape=(self.points,)))
+
+    def compare(self, run_ids, metric):
+        """{run_id: (steps, values)} for ``metric`` of each run, read in one pass"""
+        with self.lock:
+            steps_column, values_column = self._columns()
+            curves = {}
+            for run_id in run_ids:
+                segments = self.index.get((run_id, metric), [])
+                buffered_steps, buffered_values = self.buffers.get((run_id, metric), ([], []))
+                steps = [steps_column[offset:offset + count] for offset, count in segments]
+                values = [values_column[offset:offset + count] for offset, count in segments]
+                steps.append(np.asarray(buffered_steps, dtype=STEP_DTYPE))
+                values.append(np.asarray(buffered_values, dtype=VALUE_DTYPE))
+                curves[run_id] = (np.concatenate(steps), np.concatenate(values))
+        return curves
+
+    def series(self, run_id, metric):
+        """(steps, values) of one run's metric in logging order"""
+        return self.compare([run_id], metric)[run_id]
+
+    def latest(self, run_id, metric):
+        """Most recently logged value of a metric, or None"""
+        _, values = self.series(run_id, metric)
+        return float(values[-1]) if len(values) else None
+
+    def metrics(self, run_id=None):
+        """Metric names logged for one run, or for any run"""
+        if run_id is not None:
+            return sorted(self.run_metrics.get(run_id, ()) | {m for r, m in self.buffers if r == run_id})
+        return sorted(set().union(*self.run_metrics.values(), {m for _, m in self.buffers}))
+
+    def run_ids(self):
+        """Registered run ids in creation order"""
+        return list(self.runs)
+
+    def close(self):
+        self.flush()
@@ -39,6 +39,8 @@ def get_deployment_flows():
             'description': 'Deploy models within the same project environment',
             'icon': '🗂️',
             'color': '#3b82f6',
+            'complexity': 'Medium',
+            'resources': {'cpu': 1, 'memory_gb': 2},
             'steps': [
                 {
                     'id': 'step1',
@@ -78,6 +80,8 @@ def get_deployment_flows():
             'description': 'Deploy models across different project boundaries',
             'icon': '🔄',
             'color': '#10b981',
+            'complexity': 'High',
+            'resources': {'cpu': 1, 'memory_gb': 2},
             'steps': [
                 {
                     'id': 'step1',
@@ -118,6 +122,8 @@ def get_deployment_flows():
             'description': 'Deploy to Walmart Cloud Native Platform for real-time inference',
             'icon': '⚡',
             'color': '#f59e0b',
+            'complexity': 'Low',
+            'resources': {'cpu': 2, 'memory_gb': 4},
             'steps': [
                 {
                     'id': 'step1',
@@ -158,6 +164,8 @@ def get_deployment_flows():
             'description': 'Import and deploy models from external sources',
             'icon': '☁️',
             'color': '#8b5cf6',
+            'complexity': 'High',
+            'resources': {'cpu': 2, 'memory_gb': 3},
             'steps': [
                 {
                     'id': 'step1',
@@ -194,6 +202,92 @@ def get_deployment_flows():
         }
     ]
 
+def generate_flow_run_history(runs_per_flow=200, days=30):
+    """Generate historical deployment runs for seeding the flow run log"""
+    profiles = {
+        'flow1': {'avg_duration': 512, 'success_rate': 0.973},
+        'flow2': {'avg_duration': 735, 'success_rate': 0.948},
+        'flow3': {'avg_duration': 405, 'success_rate': 0.989},
+        'flow4': {'avg_duration': 920, 'success_rate': 0.921}
+    }
+    
+    runs = []
+    now = datetime.now()
+    for flow_id, profile in profiles.items():
+        for _ in range(runs_per_flow):
+            runs.append({
+                'flow_id': flow_id,
+                'duration_s': max(30, random.gauss(profile['avg_duration'], profile['avg_duration'] * 0.2)),
+                'success': random.random() < profile['success_rate'],
+                'finished_at': now - timedelta(minutes=random.randint(0, days * 24 * 60))
+            })
+    
+    return sorted(runs, key=lambda x: x['finished_at'])
+
+def generate_iam_policies():
+    """Generate IAM policies governing cross-project model transfers"""
+    return [
+        {
+            'id': 'pol-export-source',
+            'effect': 'allow',
+            'principals': ['sa-element-deployer'],
+            'actions': ['model:export', 'model:read', 'feature:read'],
+            'resources': ['projects/element-risk/*']
+        },
+        {
+            'id': 'pol-import-target',
+            'effect': 'allow',
+            'principals': ['sa-element-deployer'],
+            'actions': ['model:*'],
+            'resources': ['projects/element-payments/models/*']
+        },
+        {
+            'id': 'pol-endpoint-invoke',
+            'effect': 'allow',
+            'principals': ['*'],
+            'actions': ['endpoint:invoke'],
+            'resources': ['projects/element-payments/endpoints/*']
+        },
+        {
+            'id': 'pol-deny-pii-export',
+            'effect': 'deny',
+            'principals': ['*'],
+            'actions': ['model:export', 'feature:read'],
+            'resources': ['projects/element-risk/features/pii/*']
+        }
+    ]
+
+def generate_kpi_events(days=730, seed=7):
+    """Generate two years of daily savings and cost events for the KPI ledger"""
+    rng = np.random.default_rng(seed)
+    savings_per_day = {
+        'Fraud Prevention': 3950,
+        'Operational Efficiency': 1975,
+        'Developer Productivity': 1320,
+        'Infrastructure': 660
+    }
+    fraud_type_shares = {'Payment Fraud': 0.50, 'Account Fraud': 0.33, 'Product Fraud': 0.12, 'Other': 0.05}
+    cost_per_day = {'Platform Infrastructure': 700, 'Team': 400, 'Licensing': 110}
+    
+    events = []
+    today = datetime.now().date()
+    for i in range(days):
+        day = today - timedelta(days=days - 1 - i)
+        # Savings ramp up as platform adoption grows
+        growth = 0.35 + 0.65 * i / days
+        for category, amount in savings_per_day.items():
+            if category == 'Fraud Prevention':
+                for fraud_type, share in fraud_type_shares.items():
+                    events.append({'kind': 'savings', 'category': category, 'fraud_type': fraud_type, 'date': day,
+                                   'amount': round(amount * share * growth * rng.lognormal(0, 0.25), 2)})
+            else:
+                events.append({'kind': 'savings', 'category': category, 'date': day,
+                               'amount': round(amount * growth * rng.lognormal(0, 0.25), 2)})
+        for category, amount in cost_per_day.items():
+            events.append({'kind': 'cost', 'category': category, 'date': day,
+                           'amount': round(amount * rng.lognormal(0, 0.1), 2)})
+    return events
+
 def generate_experiment_data():
     """Generate mock experiment data"""
     experiments = []
@@ -216,6 +310,38 @@ def generate_experiment_data():
     
     return experiments
 
+def generate_experiment_runs(n_runs=60, epochs=30, steps_per_epoch=50, seed=11):
+    """Generate per-step training loss and per-epoch validation curves for experiment runs"""
+    rng = np.random.default_rng(seed)
+    algorithms = ['XGBoost', 'Neural Network', 'Random Forest', 'LSTM', 'SVM', 'Gradient Boosting']
+
+    runs = []
+    for i in range(1, n_runs + 1):
+        algorithm = algorithms[rng.integers(len(algorithms))]
+        floor = rng.uniform(0.18, 0.32)
+        rate = rng.uniform(0.08, 0.25)
+        overfit = rng.uniform(0.0, 0.004)
+
+        steps = np.arange(epochs * steps_per_epoch)
+        train_loss = floor + 0.5 * np.exp(-rate * steps / steps_per_epoch) + rng.normal(0, 0.02, len(steps))
+        epoch_steps = (np.arange(1, epochs + 1) * steps_per_epoch) - 1
+        epoch_index = np.arange(1, epochs + 1)
+        val_loss = floor + 0.03 + 0.5 * np.exp(-rate * epoch_index) + overfit * epoch_index + rng.normal(0, 0.008, epochs)
+        val_f1 = np.clip(0.97 - 0.55 * (val_loss - 0.1) + rng.normal(0, 0.005, epochs), 0, 1)
+
+        runs.append({
+            'id': f'exp-{i:03d}',
+            'name': f'Fraud Detection {algorithm} v{rng.integers(1, 4)}.{rng.integers(0, 10)}',
+            'algorithm': algorithm,
+            'metrics': {
+                'train_loss': (steps, np.maximum(train_loss, 0)),
+                'val_loss': (epoch_steps, val_loss),
+                'val_f1': (epoch_steps, val_f1)
+            }
+        })
+
+    return runs
+
 def generate_feature_data():
     """Generate mock feature importance data"""
     features = [
@@ -229,6 +355,14 @@ def generate_feature_data():
     ]
     return features
 
+def generate_country_risk_scores():
+    """Generate country risk scores used by the geo risk resolver"""
+    return {
+        'US': 0.12, 'CA': 0.10, 'GB': 0.14, 'DE': 0.11, 'FR': 0.15, 'JP': 0.09,
+        'AU': 0.13, 'MX': 0.41, 'BR': 0.47, 'IN': 0.38, 'CN': 0.52, 'RU': 0.78,
+        'NG': 0.81, 'VN': 0.58, 'ID': 0.55, 'UA': 0.63, 'RO': 0.49, 'PH': 0.51
+    }
+
 def generate_time_series_data():
     """Generate time series data for charts"""
     # Generate performance trends
@@ -268,6 +402,45 @@ def generate_system_health_data():
     ]
     return components
 
+def generate_infrastructure_metrics(num_nodes=12):
+    """Generate one tick of live infrastructure metrics for alerting"""
+    metrics = {}
+    for node in range(1, num_nodes + 1):
+        # node-3 runs hot to keep the memory alerts realistic
+        memory_base = 84 if node == 3 else 60
+        metrics[f'node-{node}.cpu_pct'] = round(min(100, max(0, random.gauss(55, 15))), 1)
+        metrics[f'node-{node}.memory_pct'] = round(min(100, max(0, memory_base + random.uniform(-6, 6))), 1)
+    
+    metrics['endpoint.latency_ms'] = round(max(5, random.gauss(25, 8)), 1)
+    metrics['endpoint.error_rate'] = round(max(0, random.gauss(0.02, 0.05)), 3)
+    metrics['autoscaler.replicas'] = random.choice([12, 12, 12, 12, 13, 14])
+    return metrics
+
+def generate_alert_rules(num_nodes=12):
+    """Generate the default monitoring rules for the infrastructure metrics"""
+    rules = []
+    for node in range(1, num_nodes + 1):
+        rules.extend([
+            {'metric': f'node-{node}.memory_pct', 'op': '>', 'threshold': 85, 'severity': 'warning',
+             'message': f'High memory usage on node-{node}'},
+            {'metric': f'node-{node}.memory_pct', 'op': '>', 'threshold': 95, 'severity': 'critical',
+             'message': f'Memory exhaustion imminent on node-{node}'},
+            {'metric': f'node-{node}.memory_pct', 'kind': 'rate', 'op': '>', 'threshold': 2.0, 'severity': 'warning',
+             'message': f'Memory climbing rapidly on node-{node}'},
+            {'metric': f'node-{node}.cpu_pct', 'op': '>', 'threshold': 90, 'severity': 'warning',
+             'message': f'CPU saturation on node-{node}'}
+        ])
+    
+    rules.extend([
+        {'metric': 'endpoint.latency_ms', 'op': '>', 'threshold': 45, 'severity': 'critical',
+         'message': 'Model endpoint timeout', 'cooldown': 600},
+        {'metric': 'endpoint.error_rate', 'op': '>', 'threshold': 0.1, 'severity': 'critical',
+         'message': 'Elevated model endpoint error rate'},
+        {'metric': 'autoscaler.replicas', 'kind': 'rate', 'op': '>', 'threshold': 0, 'severity': 'info',
+         'message': 'Auto-scaling triggered', 'cooldown': 60}
+    ])
+    return rules
+
 def generate_recent_activity():
     """Generate recent activity feed"""
     activities = [
@@ -293,14 +466,141 @@ def generate_model_performance_data():
     ]
     return models
 
-def generate_fraud_detection_data():
-    """Generate real-time fraud detection events"""
+def generate_seller_linkage_data(n_sellers=90_000, n_rings=400, seed=5):
+    """Generate seller attribute edges with fraud rings sharing devices, bank accounts or payout methods.
+
+    Seller ``i`` is ``S{10000 + i}``, matching the IDs in fraud detection events.
+    Attribute kinds index ``utils.account_linkage.ATTRIBUTE_KINDS``.
+    """
+    rng = np.random.default_rng(seed)
+    n_kinds = 4
+    values = np.tile(np.arange(n_sellers), (n_kinds, 1))  # every seller starts with its own values
+
+    # Households and shared offices: a few sellers share an address
+    movers = rng.random(n_sellers) < 0.02
+    values[2, movers] = rng.integers(0, n_sellers, movers.sum())
+
+    risk_scores = rng.beta(2, 10, n_sellers)
+    for _ in range(n_rings):
+        members = rng.choice(n_sellers, rng.integers(3, 13), replace=False)
+        for kind in rng.choice([0, 1, 3], rng.integers(1, 3), replace=False):  # device, bank account, payout method
+            values[kind, members] = members[0]
+        risk_scores[members] = np.maximum(risk_scores[members], rng.uniform(0.35, 0.7, len(members)))
+        if rng.random() < 0.4:
+            risk_scores[members[rng.integers(len(members))]] = rng.uniform(0.85, 0.99)
+
+    return {
+        'sellers': np.repeat(np.arange(n_sellers)[None, :], n_kinds, axis=0).ravel(),
+        'kinds': np.repeat(np.arange(n_kinds, dtype=np.int8), n_sellers),
+        'values': values.ravel(),
+        'cardinality': n_sellers,
+        'risk_scores': risk_scores,
+        'id_offset': 10000
+    }
+
+def generate_seller_profiles(n_sellers=90_000, duplicate_rate=0.01, seed=9):
+    """Generate seller profile text with planted near-duplicate re-registrations.
+
+    Each profile is "storefront | owner | address". A ``duplicate_rate``
+    fraction of sellers are re-registrations of another seller with small
+    edits (typos, abbreviations, a changed house number or storefront
+    suffix). Returns the texts and the planted (original, duplicate) pairs.
+    """
+    rng = np.random.default_rng(seed)
+    adjectives = ['Golden', 'Prime', 'Urban', 'Blue', 'Swift', 'Lucky', 'Royal', 'Green', 'Bright', 'Silver',
+                  'Happy', 'Smart', 'Global', 'Classic', 'Fresh', 'Modern', 'Star', 'Sunny', 'Ocean', 'Peak']
+    nouns = ['Deals', 'Gadgets', 'Outlet', 'Traders', 'Emporium', 'Supply', 'Corner', 'Market', 'Bazaar', 'Goods',
+             'Electronics', 'Fashion', 'Home', 'Store', 'Depot', 'Boutique', 'Wholesale', 'Direct', 'Hub', 'Mart']
+    first_names = ['James', 'Maria', 'Wei', 'Aisha', 'Carlos', 'Olga', 'Ravi', 'Emma', 'Kenji', 'Fatima',
+                   'Liam', 'Sofia', 'Ahmed', 'Chloe', 'Ivan', 'Priya', 'Lucas', 'Mei', 'Omar', 'Nina']
+    last_names = ['Smith', 'Garcia', 'Chen', 'Khan', 'Lopez', 'Ivanova', 'Patel', 'Brown', 'Sato', 'Ali',
+                  'Jones', 'Rossi', 'Hassan', 'Martin', 'Petrov', 'Sharma', 'Silva', 'Wang', 'Haddad', 'Novak']
+    streets = ['Oak', 'Maple', 'Cedar', 'Pine', 'Elm', 'Lake', 'Hill', 'Park', 'River', 'Sunset',
+               'Main', 'Church', 'Mill', 'Station', 'Bridge', 'Market', 'King', 'Queen', 'Forest', 'Harbor']
+    street_types = [('Street', 'St'), ('Avenue', 'Ave'), ('Road', 'Rd'), ('Boulevard', 'Blvd'), ('Lane', 'Ln')]
+    cities = ['Springfield', 'Riverside', 'Fairview', 'Franklin', 'Greenville', 'Bristol', 'Clinton', 'Salem',
+              'Madison', 'Georgetown', 'Arlington', 'Ashland', 'Dover', 'Oxford', 'Milton', 'Newport']
+
+    picks = rng.integers(0, 20, (n_sellers, 7))
+    numbers = rng.integers(1, 9999, n_sellers)
+    types = rng.integers(0, len(street_types), n_sellers)
+    city_picks = rng.integers(0, len(cities), n_sellers)
+    store_numbers = rng.integers(1, 999, n_sellers)
+    texts = [
+        f"{adjectives[p[0]]} {nouns[p[1]]} {nouns[p[2]]} {store_numbers[i]} | {first_names[p[3]]} {last_names[p[4]]} | "
+        f"{numbers[i]} {streets[p[5]]} {street_types[types[i]][0]}, {cities[city_picks[i]]}"
+        for i, p in enumerate(picks)
+    ]
+
+    def perturb(text):
+        edits = rng.choice(['typo', 'abbreviate', 'number', 'suffix', 'case'], rng.integers(1, 3), replace=False)
+        for edit in edits:
+            if edit == 'typo':
+                position = rng.integers(1, len(text) - 1)
+                text = text[:position] + text[position + 1] + text[position] + text[position + 2:]
+            elif edit == 'abbreviate':
+                for full, short in street_types:
+                    text = text.replace(f" {full},", f" {short}.,")
+            elif edit == 'number':
+                text = text.replace(' | ', f"{rng.integers(0, 10)} | ", 1)
+            elif edit == 'suffix':
+                text = text.replace(' | ', f" {rng.choice(['LLC', 'Shop', 'Co', 'Online'])} | ", 1)
+            else:
+                text = text.upper()
+        return text
+
+    n_duplicates = int(n_sellers * duplicate_rate)
+    duplicates = rng.choice(n_sellers, 2 * n_duplicates, replace=False).reshape(-1, 2) if n_duplicates else np.empty((0, 2), int)
+    for original, duplicate in duplicates:
+        texts[duplicate] = perturb(texts[original])
+
+    return {'texts': texts, 'duplicates': [tuple(pair) for pair in duplicates.tolist()], 'id_offset': 10000}
+
+def generate_transaction_stream(n_sellers=50_000, n_events=200_000, minutes=10, card_testers=50, seed=13):
+    """Generate a recent transaction stream for the velocity sketches.
+
+    Columns are integer arrays ordered by ``timestamp`` (epoch seconds,
+    ending now). Seller ``i`` is ``10000 + i``. Activity is heavy-tailed,
+    most sellers reuse a handful of cards and buyers, and ``card_testers``
+    sellers run bursts of transactions on many distinct cards.
+    """
+    rng = np.random.default_rng(seed)
+    weights = rng.lognormal(0.0, 1.2, n_sellers)
+    testers = rng.choice(n_sellers, card_testers, replace=False)
+    weights[testers] *= 20
+    sellers = rng.choice(n_sellers, n_events, p=weights / weights.sum())
+
+    testing = np.isin(sellers, testers)
+    cards = np.where(testing, rng.integers(0, 2**40, n_events), sellers * 16 + rng.integers(0, 4, n_events))
+    buyers = np.where(rng.random(n_events) < 0.3, sellers * 64 + rng.integers(0, 8, n_events),
+                      rng.integers(0, 10 * n_sellers, n_events))
+    ips = np.where(testing, rng.integers(0, 2**32, n_events), buyers % 2**32)
+    now = datetime.now().timestamp()
+    timestamps = np.sort(now - rng.random(n_events) * minutes * 60)
+    return {
+        'seller_id': sellers + 10000,
+        'timestamp': timestamps,
+        'buyer_id': buyers,
+        'card_id': cards,
+        'ip_address': ips
+    }
+
+def generate_fraud_detection_data(since=None, now=None, events_per_hour=10):
+    """Generate real-time fraud detection events timestamped after ``since``.
+
+    Without ``since`` the last two hours are backfilled. Calling again with
+    ``since`` set to the previous ``now`` yields only events that arrived in
+    between.
+    """
+    now = now or datetime.now()
+    since = since or now - timedelta(hours=2)
+    elapsed = max((now - since).total_seconds(), 0.0)
     events = []
     risk_levels = ['LOW', 'MEDIUM', 'HIGH', 'CRITICAL']
     
-    for i in range(20):
+    for i in range(np.random.poisson(events_per_hour * elapsed / 3600)):
         event = {
-            'timestamp': datetime.now() - timedelta(minutes=random.randint(1, 120)),
+            'timestamp': now - timedelta(seconds=random.uniform(0, elapsed)),
             'seller_id': f'S{random.randint(10000, 99999)}',
             'risk_score': round(random.uniform(0.1, 0.95), 3),
             'risk_level': random.choice(risk_levels),
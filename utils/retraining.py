@@ -0,0 +1,182 @@
+import argparse
+import json
+import os
+import threading
+import time
+from datetime import datetime
+import numpy as np
+from utils.dataset_factory import generate_seller_chunk
+from utils.fraud_model import LogisticFraudModel, encode_features, log_loss, roc_auc
+
+class SellerDataFeed:
+    """Labelled seller data arriving in daily partitions.
+
+    Partition ``day`` is generated from its own seed, so any day can be
+    re-read without keeping earlier ones around.
+    """
+
+    def __init__(self, rows_per_day=50_000, fraud_rate=0.02, seed=0):
+        self.rows_per_day = rows_per_day
+        self.fraud_rate = fraud_rate
+        self.seed = seed
+
+    def load(self, start_day, end_day):
+        """Encoded design matrix and labels for days ``[start_day, end_day)``"""
+        chunks = [
+            generate_seller_chunk(self.rows_per_day, self.fraud_rate, seed=[self.seed, day],
+                                  start_id=day * self.rows_per_day)
+            for day in range(start_day, end_day)
+        ]
+        X, _ = encode_features({name: np.concatenate([c[name] for c in chunks]) for name in chunks[0]})
+        y = np.concatenate([c['is_fraud'] for c in chunks])
+        return X, y
+
+def evaluate(model, X, y):
+    """Validation metrics used by the promotion gate"""
+    p = model.predict_proba(X)
+    return {'log_loss': log_loss(y, p), 'auc': roc_auc(y, p)}
+
+class RetrainingPipeline:
+    """Checkpointed fraud model retraining with a validation gate.
+
+    Each retrain reads only the partitions after the incumbent's watermark.
+    The newest ``validation_days`` of them are held out, and the candidate
+    trains on the rest. In ``incremental`` mode the candidate is the
+    incumbent updated with ``partial_fit``, so wall time grows with the new
+    data, not the history. ``full`` mode refits on every day up to the new
+    watermark, for comparison. The candidate is promoted only if it is no
+    worse than the incumbent on the held-out days. Held-out days are not
+    consumed: the watermark stops before them, so the next retrain trains
+    on them. A rejected candidate does not move the watermark, but the
+    next retrain still reads the days after the newest window already
+    tried: it trains from the incumbent's watermark through those new days
+    (the ``expand`` policy, recorded on each checkpoint), so it sees fresh
+    data and a fresh validation day instead of rebuilding the same
+    rejected candidate.
+
+    Like FlowRunLog, checkpoint records are appended to a JSON-lines file
+    and replayed on startup. Model weights live in one JSON file per
+    version.
+    """
+
+    def __init__(self, path, feed=None, validation_days=1, max_loss_increase=0.0005, max_auc_drop=0.002):
+        self.path = path
+        self.feed = feed or SellerDataFeed()
+        self.validation_days = validation_days
+        self.max_loss_increase = max_loss_increase
+        self.max_auc_drop = max_auc_drop
+        self.lock = threading.Lock()
+        self.history = []
+        self.log_path = os.path.join(path, 'checkpoints.jsonl')
+        os.makedirs(path, exist_ok=True)
+        if os.path.exists(self.log_path):
+            with open(self.log_path) as f:
+                self.history = [json.loads(line) for line in f if line.strip()]
+
+    @property
+    def incumbent(self):
+        """Record of the currently promoted checkpoint, or None"""
+        promoted = [record for record in self.history if record['promoted']]
+        return promoted[-1] if promoted else None
+
+    def _model_path(self, version):
+        return os.path.join(self.path, f'model-v{version:04d}.json')
+
+    def load_model(self, version=None):
+        """Model weights of a checkpoint (the incumbent by default)"""
+        version = version or self.incumbent['version']
+        return LogisticFraudModel.load(self._model_path(version))
+
+    def _checkpoint(self, model, record):
+        record['version'] = len(self.history) + 1
+        record['created_at'] = datetime.now().isoformat()
+        model.save(self._model_path(record['version']))
+        with open(self.log_path, 'a') as f:
+            f.write(json.dumps(record) + '\n')
+        self.history.append(record)
+        return record
+
+    def bootstrap(self, days=28):
+        """Fit the first checkpoint on ``days`` of history and promote it"""
+        with self.lock:
+            started = time.perf_counter()
+            X, y = self.feed.load(0, days)
+            model = LogisticFraudModel().fit(X, y)
+            return self._checkpoint(model, {
+                'mode': 'full',
+                'policy': 'bootstrap',
+                'parent': None,
+                'trained_days': [0, days],
+                'watermark': days,
+                'new_rows': len(y),
+                'seconds': time.perf_counter() - started,
+                'promoted': True,
+                'metrics': None,
+                'incumbent_metrics': None
+            })
+
+    def retrain(self, new_days=7, mode='incremental'):
+        """Train a candidate on days since the watermark and gate it against the incumbent"""
+        if mode not in ('incremental', 'full'):
+            raise ValueError(f"Unknown retraining mode: {mode}")
+        if new_days <= self.validation_days:
+            raise ValueError("new_days must exceed validation_days")
+        with self.lock:
+            incumbent = self.incumbent
+            if incumbent is None:
+                raise ValueError("No incumbent model; call bootstrap() first")
+            start = incumbent['watermark']
+            # Resume after the newest window already tried, so a rejection is not retried verbatim
+            tried_through = max(record['trained_days'][1] for record in self.history)
+            train_end = max(start, tried_through) + new_days - self.validation_days
+
+            started = time.perf_counter()
+            if mode == 'incremental':
+                X, y = self.feed.load(start, train_end)
+                candidate = self.load_model(incumbent['version']).partial_fit(X, y)
+            else:
+                X, y = self.feed.load(0, train_end)
+                candidate = LogisticFraudModel().fit(X, y)
+            seconds = time.perf_counter() - started
+
+            X_val, y_val = self.feed.load(train_end, train_end + self.validation_days)
+            metrics = evaluate(candidate, X_val, y_val)
+            incumbent_metrics = evaluate(self.load_model(incumbent['version']), X_val, y_val)
+            promoted = (metrics['log_loss'] <= incumbent_metrics['log_loss'] + self.max_loss_increase
+                        and metrics['auc'] >= incumbent_metrics['auc'] - self.max_auc_drop)
+
+            return self._checkpoint(candidate, {
+                'mode': mode,
+                'policy': 'expand',
+                'parent': incumbent['version'],
+                'trained_days': [start if mode == 'incremental' else 0, train_end],
+                'watermark': train_end if promoted else incumbent['watermark'],
+                'new_rows': len(y),
+                'seconds': seconds,
+                'promoted': promoted,
+                'metrics': metrics,
+                'incumbent_metrics': incumbent_metrics
+            })
+
+def main():
+    """Command-line entry point for weekly retraining runs"""
+    parser = argparse.ArgumentParser(description="Retrain the fraud model and gate it against the incumbent")
+    parser.add_argument('path', help="checkpoint directory")
+    parser.add_argument('--mode', choices=['incremental', 'full'], default='incremental')
+    parser.add_argument('--history-days', type=int, default=28)
+    parser.add_argument('--weeks', type=int, default=4)
+    parser.add_argument('--rows-per-day', type=int, default=50_000)
+    args = parser.parse_args()
+
+    pipeline = RetrainingPipeline(args.path, SellerDataFeed(args.rows_per_day))
+    if pipeline.incumbent is None:
+        record = pipeline.bootstrap(args.history_days)
+        print(f"✅ Bootstrapped v{record['version']} on {record['new_rows']:,} rows in {record['seconds']:.1f}s")
+    for _ in range(args.weeks):
+        record = pipeline.retrain(mode=args.mode)
+        print(f"✅ v{record['version']} {'promoted' if record['promoted'] else 'rejected'}: "
+              f"{args.mode} on {record['new_rows']:,} rows in {record['seconds']:.2f}s, "
+              f"val loss {record['metrics']['log_loss']:.5f} vs incumbent {record['incumbent_metrics']['log_loss']:.5f}")
+
+if __name__ == "__main__":
+    main()
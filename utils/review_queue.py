@@ -0,0 +1,219 @@
+import heapq
+import itertools
+import threading
+import time
+
+# Which analyst team reviews a case, by risk reason
+TEAM_ROUTING = {
+    'High payment decline rate': 'payments',
+    'Unusual transaction pattern': 'payments',
+    'New seller from high-risk region': 'onboarding',
+    'Multiple account flags': 'trust',
+    'Rapid price changes detected': 'marketplace',
+    'Suspicious inventory behavior': 'marketplace'
+}
+DEFAULT_TEAM = 'trust'
+
+class ReviewQueue:
+    """Max-priority queue of manual-review cases with aging.
+
+    A case's effective priority is ``risk_score + aging_per_hour * hours
+    waited``. Since every queued case ages at the same rate, the order only
+    depends on the time-invariant key ``risk_score - aging_per_hour *
+    enqueued_hours``, so the heap never needs re-sorting as time passes yet
+    old low-score cases still overtake newer higher-score ones eventually.
+    The heap is indexed (case id -> heap slot), which makes push, pop,
+    reprioritize and cancel all O(log n).
+    """
+
+    def __init__(self, aging_per_hour=0.05, clock=time.time, max_wait_samples=10000):
+        self.aging_per_hour = aging_per_hour
+        self.clock = clock
+        self.heap = []  # [sort key, sequence, case id]
+        self.slots = {}  # case id -> index in heap
+        self.cases = {}  # case id -> case
+        self.sequence = itertools.count()
+        self.lock = threading.Lock()
+        self.wait_times = []
+        self.max_wait_samples = max_wait_samples
+        self.popped = 0
+
+    def _key(self, risk_score, enqueued_at):
+        return -(risk_score - self.aging_per_hour * enqueued_at / 3600)
+
+    def effective_priority(self, case, now=None):
+        now = self.clock() if now is None else now
+        return case['risk_score'] + self.aging_per_hour * (now - case['enqueued_at']) / 3600
+
+    def _swap(self, i, j):
+        heap = self.heap
+        heap[i], heap[j] = heap[j], heap[i]
+        self.slots[heap[i][2]] = i
+        self.slots[heap[j][2]] = j
+
+    def _sift_up(self, i):
+        heap = self.heap
+        while i > 0:
+            parent = (i - 1) >> 1
+            if heap[i] >= heap[parent]:
+                break
+            self._swap(i, parent)
+            i = parent
+
+    def _sift_down(self, i):
+        heap = self.heap
+        size = len(heap)
+        while True:
+            child = 2 * i + 1
+            if child >= size:
+                return
+            if child + 1 < size and heap[child + 1] < heap[child]:
+                child += 1
+            if heap[i] <= heap[child]:
+                return
+            self._swap(i, child)
+            i = child
+
+    def _remove_slot(self, i):
+        """Remove the heap entry at slot ``i`` and return its case"""
+        last = len(self.heap) - 1
+        if i != last:
+            self._swap(i, last)
+        _, _, case_id = self.heap.pop()
+        del self.slots[case_id]
+        if i < len(self.heap):
+            self._sift_down(i)
+            self._sift_up(i)
+        return self.cases.pop(case_id)
+
+    def push(self, case_id, risk_score, now=None, **fields):
+        """Queue a new case; raises ValueError if the case is already open"""
+        with self.lock:
+            if case_id in self.slots:
+                raise ValueError(f"Case {case_id} is already queued")
+            now = self.clock() if now is None else now
+            case = dict(fields, case_id=case_id, risk_score=risk_score, enqueued_at=now)
+            self.cases[case_id] = case
+            self.slots[case_id] = len(self.heap)
+            self.heap.append([self._key(risk_score, now), next(self.sequence), case_id])
+            self._sift_up(len(self.heap) - 1)
+            return case
+
+    def reprioritize(self, case_id, risk_score):
+        """Change a queued case's risk score, keeping its original wait time"""
+        with self.lock:
+            case = self.cases[case_id]
+            case['risk_score'] = risk_score
+            i = self.slots[case_id]
+            self.heap[i][0] = self._key(risk_score, case['enqueued_at'])
+            self._sift_up(i)
+            self._sift_down(self.slots[case_id])
+            return case
+
+    def cancel(self, case_id):
+        """Withdraw a queued case (e.g. the seller was cleared); returns it or None"""
+        with self.lock:
+            i = self.slots.get(case_id)
+            return None if i is None else self._remove_slot(i)
+
+    def pop(self, now=None):
+        """Hand the highest-priority case to an analyst, or None if the queue is empty"""
+        with self.lock:
+            if not self.heap:
+                return None
+            case = self._remove_slot(0)
+            now = self.clock() if now is None else now
+            case['waited_s'] = now - case['enqueued_at']
+            self.wait_times.append(case['waited_s'])
+            if len(self.wait_times) > self.max_wait_samples:
+                del self.wait_times[:len(self.wait_times) - self.max_wait_samples]
+            self.popped += 1
+            return case
+
+    def peek(self, n=10):
+        """Top ``n`` cases without removing them, in O(n log n)"""
+        with self.lock:
+            result = []
+            frontier = [(self.heap[0], 0)] if self.heap else []
+            while frontier and len(result) < n:
+                entry, i = heapq.heappop(frontier)
+                result.append(self.cases[entry[2]])
+                for child in (2 * i + 1, 2 * i + 2):
+                    if child < len(self.heap):
+                        heapq.heappush(frontier, (self.heap[child], child))
+            return result
+
+    def __len__(self):
+        return len(self.heap)
+
+    def __contains__(self, case_id):
+        return case_id in self.slots
+
+    def stats(self, now=None):
+        """Queue depth, oldest-case age and wait-time percentiles of handed-out cases"""
+        now = self.clock() if now is None else now
+        with self.lock:
+            waits = sorted(self.wait_times)
+            top = self.cases[self.heap[0][2]] if self.heap else None
+
+        def percentile(q):
+            return waits[min(len(waits) - 1, int(q * len(waits)))] if waits else 0.0
+
+        return {
+            'depth': len(self.heap),
+            'reviewed': self.popped,
+            'wait_p50': percentile(0.50),
+            'wait_p95': percentile(0.95),
+            'next_priority': self.effective_priority(top, now) if top else None
+        }
+
+class ReviewQueues:
+    """One review queue per analyst team, with cases routed by risk reason.
+
+    ``lock`` covers the case -> team lookup together with the queue update,
+    so sessions submitting the same case concurrently see one open case.
+    It is always taken before a queue's own lock.
+    """
+
+    def __init__(self, teams=None, aging_per_hour=0.05, clock=time.time):
+        teams = teams or sorted(set(TEAM_ROUTING.values()) | {DEFAULT_TEAM})
+        self.queues = {team: ReviewQueue(aging_per_hour, clock) for team in teams}
+        self.case_teams = {}
+        self.lock = threading.Lock()
+
+    def route(self, reason):
+        team = TEAM_ROUTING.get(reason, DEFAULT_TEAM)
+        return team if team in self.queues else next(iter(self.queues))
+
+    def submit(self, case_id, risk_score, reason=None, team=None, **fields):
+        """Queue a case, or raise its score if it is already open; returns (case, team, created)"""
+        with self.lock:
+            existing = self.case_teams.get(case_id)
+            if existing is not None and case_id in self.queues[existing]:
+                queue = self.queues[existing]
+                case = queue.cases[case_id]
+                if risk_score > case['risk_score']:
+                    queue.reprioritize(case_id, risk_score)
+                return case, existing, False
+
+            team = team or self.route(reason)
+            case = self.queues[team].push(case_id, risk_score, reason=reason, **fields)
+            self.case_teams[case_id] = team
+            return case, team, True
+
+    def pop(self, team):
+        with self.lock:
+            case = self.queues[team].pop()
+            if case is not None:
+                self.case_teams.pop(case['case_id'], None)
+            return case
+
+    def cancel(self, case_id):
+        with self.lock:
+            team = self.case_teams.pop(case_id, None)
+            return self.queues[team].cancel(case_id) if team else None
+
+    def stats(self):
+        """Per-team stats plus overall depth"""
+        per_team = {team: queue.stats() for team, queue in self.queues.items()}
+        return {'teams': per_team, 'depth': sum(s['depth'] for s in per_team.values())}
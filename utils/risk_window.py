@@ -0,0 +1,79 @@
+from datetime import datetime
+
+RISK_LEVELS = ['LOW', 'MEDIUM', 'HIGH', 'CRITICAL']
+
+class SlidingWindowCounter:
+    """Per-key event counts over a sliding time window.
+
+    Events are folded into fixed-width time buckets and running totals are
+    kept alongside, so adding an event and reading the totals are both O(1)
+    in the number of events. Buckets are expired from the totals as the
+    window slides, touching at most window/bucket buckets per advance.
+    """
+
+    def __init__(self, window_seconds=3600, bucket_seconds=60):
+        self.window_seconds = window_seconds
+        self.bucket_seconds = bucket_seconds
+        self.buckets = {}  # bucket index -> {key: count}
+        self.totals = {}
+        self.cutoff = None  # buckets at or below this index are expired
+
+    def _bucket(self, timestamp):
+        return int(timestamp // self.bucket_seconds)
+
+    def advance(self, now):
+        """Expire every bucket that has fallen out of the window ending at ``now``"""
+        cutoff = self._bucket(now - self.window_seconds)
+        if self.cutoff is not None and cutoff <= self.cutoff:
+            return
+        self.cutoff = cutoff
+        # At most window/bucket live buckets, independent of the event count
+        for index in [i for i in self.buckets if i <= cutoff]:
+            for key, count in self.buckets.pop(index).items():
+                remaining = self.totals[key] - count
+                if remaining:
+                    self.totals[key] = remaining
+                else:
+                    del self.totals[key]
+
+    def add(self, key, timestamp, count=1):
+        """Count an event; events already outside the window are ignored"""
+        index = self._bucket(timestamp)
+        if self.cutoff is not None and index <= self.cutoff:
+            return False
+        bucket = self.buckets.setdefault(index, {})
+        bucket[key] = bucket.get(key, 0) + count
+        self.totals[key] = self.totals.get(key, 0) + count
+        return True
+
+    def counts(self, now=None):
+        """Current per-key totals for the window ending at ``now``"""
+        self.advance(datetime.now().timestamp() if now is None else now)
+        return dict(self.totals)
+
+class RiskEventWindow:
+    """Sliding-window risk level and reason counts for the fraud event stream"""
+
+    def __init__(self, window_seconds=3600, bucket_seconds=60):
+        self.by_level = SlidingWindowCounter(window_seconds, bucket_seconds)
+        self.by_reason = SlidingWindowCounter(window_seconds, bucket_seconds)
+
+    def ingest(self, events):
+        """Fold newly arrived fraud detection events into the window counters (each event once)"""
+        now = datetime.now().timestamp()
+        self.by_level.advance(now)
+        self.by_reason.advance(now)
+        for event in events:
+            timestamp = event['timestamp'].timestamp()
+            self.by_level.add(event['risk_level'], timestamp)
+            self.by_reason.add(event['reason'], timestamp)
+
+    def level_counts(self, now=None):
+        """Counts for every risk level, including levels with no events"""
+        counts = self.by_level.counts(now)
+        return {level: counts.get(level, 0) for level in RISK_LEVELS}
+
+    def reason_counts(self, now=None):
+        """Counts per risk reason, most frequent first"""
+        counts = self.by_reason.counts(now)
+        return dict(sorted(counts.items(), key=lambda item: item[1], reverse=True))
@@ -0,0 +1,189 @@
+import argparse
+import os
+import sqlite3
+import threading
+import time
+import uuid
+
+# Action -> seller status it leaves behind (None leaves the status unchanged)
+ACTIONS = {
+    'block': 'blocked',
+    'unblock': 'active',
+    'escalate': 'in_review',
+    'alert': None
+}
+
+RISK_LEVEL_ORDER = ['LOW', 'MEDIUM', 'HIGH', 'CRITICAL']
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS action_requests (
+    idempotency_key TEXT PRIMARY KEY,
+    action TEXT NOT NULL,
+    actor TEXT NOT NULL,
+    reason TEXT,
+    seller_count INTEGER NOT NULL,
+    created_at REAL NOT NULL
+);
+CREATE TABLE IF NOT EXISTS seller_actions (
+    id INTEGER PRIMARY KEY,
+    request_key TEXT NOT NULL REFERENCES action_requests(idempotency_key),
+    seller_id TEXT NOT NULL,
+    action TEXT NOT NULL,
+    created_at REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS seller_actions_seller ON seller_actions(seller_id);
+CREATE TABLE IF NOT EXISTS seller_status (
+    seller_id TEXT PRIMARY KEY,
+    status TEXT NOT NULL,
+    updated_at REAL NOT NULL
+) WITHOUT ROWID;
+"""
+
+def new_idempotency_key():
+    """Key for one submission; callers keep it until the write succeeds and reuse it on retry"""
+    return uuid.uuid4().hex
+
+def sellers_matching(events, min_risk_score=None, min_risk_level=None, reasons=None):
+    """Seller ids from fraud events that match a simple strategy"""
+    min_rank = RISK_LEVEL_ORDER.index(min_risk_level) if min_risk_level else 0
+    matched = []
+    for event in events:
+        if min_risk_score is not None and event['risk_score'] < min_risk_score:
+            continue
+        if RISK_LEVEL_ORDER.index(event['risk_level']) < min_rank:
+            continue
+        if reasons and event['reason'] not in reasons:
+            continue
+        matched.append(event['seller_id'])
+    return list(dict.fromkeys(matched))
+
+class SellerActionLedger:
+    """SQLite ledger of bulk seller actions.
+
+    The database runs in WAL mode so dashboard reads never block on a bulk
+    write. A bulk request is applied in a single transaction with rows
+    inserted in ``batch_size`` chunks through ``executemany``, so blocking
+    100k sellers costs one commit instead of 100k. Every request carries an
+    idempotency key recorded in the same transaction: replaying a request
+    returns the original result without touching any seller again. A key
+    names one submission, not its content, so repeating an identical
+    action later (escalate, block, escalate again) is applied each time.
+    """
+
+    def __init__(self, path, batch_size=50_000):
+        self.path = path
+        self.batch_size = batch_size
+        os.makedirs(os.path.dirname(path) or '.', exist_ok=True)
+        # Shared across Streamlit sessions, so serialize access ourselves
+        self.connection = sqlite3.connect(path, check_same_thread=False, isolation_level=None)
+        self.lock = threading.Lock()
+        with self.lock:
+            self.connection.execute("PRAGMA journal_mode=WAL")
+            self.connection.execute("PRAGMA synchronous=NORMAL")
+            self.connection.executescript(SCHEMA)
+
+    def apply(self, action, seller_ids, actor, reason='', idempotency_key=None):
+        """Apply an action to many sellers at once; returns a summary of the request"""
+        if action not in ACTIONS:
+            raise ValueError(f"Unknown seller action: {action}")
+        seller_ids = list(dict.fromkeys(seller_ids))
+        key = idempotency_key or new_idempotency_key()
+        status = ACTIONS[action]
+        started = time.perf_counter()
+        now = time.time()
+
+        with self.lock:
+            cursor = self.connection.cursor()
+            cursor.execute("BEGIN IMMEDIATE")
+            try:
+                existing = cursor.execute(
+                    "SELECT action, seller_count, created_at FROM action_requests WHERE idempotency_key = ?", (key,)
+                ).fetchone()
+                if existing:
+                    cursor.execute("ROLLBACK")
+                    return {'key': key, 'action': existing[0], 'sellers': existing[1],
+                            'created_at': existing[2], 'duplicate': True, 'seconds': time.perf_counter() - started}
+
+                cursor.execute(
+                    "INSERT INTO action_requests VALUES (?, ?, ?, ?, ?, ?)",
+                    (key, action, actor, reason, len(seller_ids), now)
+                )
+                for start in range(0, len(seller_ids), self.batch_size):
+                    batch = seller_ids[start:start + self.batch_size]
+                    cursor.executemany(
+                        "INSERT INTO seller_actions (request_key, seller_id, action, created_at) VALUES (?, ?, ?, ?)",
+                        ((key, seller_id, action, now) for seller_id in batch)
+                    )
+                    if status is not None:
+                        cursor.executemany(
+                            "INSERT INTO seller_status VALUES (?, ?, ?) "
+                            "ON CONFLICT(seller_id) DO UPDATE SET status = excluded.status, updated_at = excluded.updated_at",
+                            ((seller_id, status, now) for seller_id in batch)
+                        )
+                cursor.execute("COMMIT")
+            except Exception:
+                cursor.execute("ROLLBACK")
+                raise
+
+        return {'key': key, 'action': action, 'sellers': len(seller_ids), 'created_at': now,
+                'duplicate': False, 'seconds': time.perf_counter() - started}
+
+    def statuses(self, seller_ids):
+        """Current status per seller ('active' when no action changed it)"""
+        result = dict.fromkeys(seller_ids, 'active')
+        seller_ids = list(result)
+        with self.lock:
+            for start in range(0, len(seller_ids), 500):
+                batch = seller_ids[start:start + 500]
+                rows = self.connection.execute(
+                    f"SELECT seller_id, status FROM seller_status WHERE seller_id IN ({','.join('?' * len(batch))})", batch
+                )
+                result.update(rows)
+        return result
+
+    def status_counts(self):
+        with self.lock:
+            return dict(self.connection.execute("SELECT status, COUNT(*) FROM seller_status GROUP BY status"))
+
+    def history(self, seller_id, limit=20):
+        """Most recent actions taken on one seller"""
+        with self.lock:
+            rows = self.connection.execute(
+                "SELECT a.action, r.actor, r.reason, a.created_at FROM seller_actions a "
+                "JOIN action_requests r ON r.idempotency_key = a.request_key "
+                "WHERE a.seller_id = ? ORDER BY a.id DESC LIMIT ?", (seller_id, limit)
+            ).fetchall()
+        return [dict(zip(('action', 'actor', 'reason', 'created_at'), row)) for row in rows]
+
+    def recent_requests(self, limit=10):
+        with self.lock:
+            rows = self.connection.execute(
+                "SELECT idempotency_key, action, actor, reason, seller_count, created_at FROM action_requests "
+                "ORDER BY created_at DESC LIMIT ?", (limit,)
+            ).fetchall()
+        return [dict(zip(('key', 'action', 'actor', 'reason', 'sellers', 'created_at'), row)) for row in rows]
+
+    def close(self):
+        self.connection.close()
+
+def main():
+    """Command-line entry point: time a bulk block of synthetic sellers"""
+    parser = argparse.ArgumentParser(description="Benchmark bulk seller actions against a SQLite ledger")
+    parser.add_argument('ledger', help="path of the SQLite ledger")
+    parser.add_argument('--sellers', type=int, default=100_000)
+    args = parser.parse_args()
+
+    ledger = SellerActionLedger(args.ledger)
+    seller_ids = [f'S{i:08d}' for i in range(args.sellers)]
+    result = ledger.apply('block', seller_ids, actor='cli', reason='incident response')
+    if result['duplicate']:
+        print(f"Request {result['key'][:12]} was already applied to this ledger; nothing to do")
+    else:
+        replay = ledger.apply('block', seller_ids, actor='cli', reason='incident response')
+        print(f"✅ Blocked {result['sellers']:,} sellers in {result['seconds']:.2f}s "
+              f"({result['sellers'] / result['seconds']:,.0f} sellers/s); "
+              f"replay was {'a no-op' if replay['duplicate'] else 'applied again'} in {replay['seconds']:.3f}s")
+    ledger.close()
+
+if __name__ == "__main__":
+    main()
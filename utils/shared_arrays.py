@@ -0,0 +1,51 @@
+from multiprocessing import shared_memory
+import numpy as np
+
+class SharedArray:
+    """NumPy array backed by a named shared memory block.
+
+    The creating process owns the block and unlinks it on ``close``; its
+    multiprocessing workers ``attach`` with the spec returned by ``spec`` and
+    get a zero-copy view of the same memory.
+    """
+
+    def __init__(self, shm, shape, dtype, owner):
+        self.shm = shm
+        self.owner = owner
+        self.array = np.ndarray(shape, dtype=dtype, buffer=shm.buf)
+
+    @classmethod
+    def create(cls, shape, dtype):
+        """Allocate an uninitialized shared array"""
+        dtype = np.dtype(dtype)
+        size = max(1, int(np.prod(shape)) * dtype.itemsize)
+        shm = shared_memory.SharedMemory(create=True, size=size)
+        return cls(shm, shape, dtype, owner=True)
+
+    @classmethod
+    def from_array(cls, array):
+        """Copy an existing array into shared memory"""
+        shared = cls.create(array.shape, array.dtype)
+        shared.array[...] = array
+        return shared
+
+    @classmethod
+    def attach(cls, spec):
+        """Attach to a shared array described by ``spec``"""
+        name, shape, dtype = spec
+        # Pool workers share the owner's resource tracker, so attaching here
+        # does not cause the block to be unlinked when a worker exits
+        shm = shared_memory.SharedMemory(name=name)
+        return cls(shm, shape, dtype, owner=False)
+
+    @property
+    def spec(self):
+        """Picklable description for attaching from another process"""
+        return (self.shm.name, self.array.shape, self.array.dtype.str)
+
+    def close(self):
+        """Drop the view and detach; the owner also frees the block"""
+        self.array = None
+        self.shm.close()
+        if self.owner:
+            self.shm.unlink()
@@ -0,0 +1,97 @@
+import os
+import struct
+from multiprocessing import shared_memory, resource_tracker
+
+ENV_VAR = 'MLOPS_SHARED_METRICS'
+
+METRIC_KEYS = [
+    'total_models',
+    'active_deployments',
+    'avg_latency',
+    'fraud_prevented',
+    'cost_savings',
+    'system_uptime',
+    'throughput'
+]
+INTEGER_METRICS = {'total_models', 'active_deployments'}
+
+# Layout: one uint64 sequence counter followed by one float64 per metric
+_HEADER = struct.Struct('<Q')
+_VALUES = struct.Struct(f'<{len(METRIC_KEYS)}d')
+SIZE = _HEADER.size + _VALUES.size
+
+class SharedMetrics:
+    """Platform metrics published through a shared memory block.
+
+    A single writer (the launcher) updates the block under a sequence lock:
+    the counter is odd while a write is in progress, so readers retry until
+    they copy a consistent snapshot. Every Streamlit worker attached to the
+    block therefore shows identical numbers.
+    """
+
+    def __init__(self, shm, owner):
+        self.shm = shm
+        self.owner = owner
+
+    @classmethod
+    def create(cls):
+        """Allocate a new block; the caller owns it and must unlink it"""
+        shm = shared_memory.SharedMemory(create=True, size=SIZE)
+        _HEADER.pack_into(shm.buf, 0, 0)
+        return cls(shm, owner=True)
+
+    @classmethod
+    def attach(cls, name):
+        """Attach to a block created by another process"""
+        shm = shared_memory.SharedMemory(name=name)
+        # Readers must not unlink the owner's block when they exit
+        resource_tracker.unregister(shm._name, 'shared_memory')
+        return cls(shm, owner=False)
+
+    @property
+    def name(self):
+        return self.shm.name
+
+    def write(self, metrics):
+        """Publish a new metrics snapshot"""
+        sequence = _HEADER.unpack_from(self.shm.buf, 0)[0]
+        _HEADER.pack_into(self.shm.buf, 0, sequence + 1)
+        _VALUES.pack_into(self.shm.buf, _HEADER.size, *[float(metrics[key]) for key in METRIC_KEYS])
+        _HEADER.pack_into(self.shm.buf, 0, sequence + 2)
+
+    def read(self, max_attempts=1000):
+        """Return a consistent metrics snapshot, or None if nothing was published yet"""
+        for _ in range(max_attempts):
+            before = _HEADER.unpack_from(self.shm.buf, 0)[0]
+            if before % 2:
+                continue
+            values = _VALUES.unpack_from(self.shm.buf, _HEADER.size)
+            if _HEADER.unpack_from(self.shm.buf, 0)[0] == before:
+                if before == 0:
+                    return None
+                return {
+                    key: int(value) if key in INTEGER_METRICS else value
+                    for key, value in zip(METRIC_KEYS, values)
+                }
+        return None
+
+    def close(self):
+        """Detach, and release the block if this process owns it"""
+        self.shm.close()
+        if self.owner:
+            self.shm.unlink()
+
+_attached = None
+
+def get_shared_metrics():
+    """Attach to the launcher's metrics block named in the environment, if any"""
+    global _attached
+    name = os.environ.get(ENV_VAR)
+    if not name:
+        return None
+    if _attached is None:
+        try:
+            _attached = SharedMetrics.attach(name)
+        except FileNotFoundError:
+            return None
+    return _attached
@@ -0,0 +1,365 @@
+import argparse
+import time
+import numpy as np
+import pandas as pd
+
+DISTINCT_FIELDS = ('buyer_id', 'card_id', 'ip_address')
+# Distinct cards per seller in the window at which payment method risk becomes medium / high.
+# Set above the few-item error of low estimates so sellers reusing a handful of cards stay low.
+PAYMENT_METHOD_RISK_CUTS = (8, 16)
+
+def hash_values(values, seed=0):
+    """64-bit hashes (splitmix64) of integer or string values, one independent family per seed"""
+    values = np.asarray(values)
+    if values.dtype.kind not in 'iub':
+        values = pd.util.hash_array(values.astype(object))
+    h = values.astype(np.uint64) + np.uint64(0x9E3779B97F4A7C15 * (seed + 1) % 2**64)
+    h = (h ^ (h >> np.uint64(30))) * np.uint64(0xBF58476D1CE4E5B9)
+    h = (h ^ (h >> np.uint64(27))) * np.uint64(0x94D049BB133111EB)
+    return h ^ (h >> np.uint64(31))
+
+def hll_estimate(registers):
+    """HyperLogLog cardinality estimate over the last axis of ``registers``"""
+    m = registers.shape[-1]
+    alpha = {16: 0.673, 32: 0.697, 64: 0.709}.get(m, 0.7213 / (1 + 1.079 / m))
+    raw = alpha * m * m / np.ldexp(1.0, -registers.astype(np.int32)).sum(axis=-1)
+    zeros = (registers == 0).sum(axis=-1)
+    # Linear counting is more accurate while many registers are still empty
+    linear = m * np.log(m / np.maximum(zeros, 1))
+    return np.where((raw <= 2.5 * m) & (zeros > 0), linear, raw)
+
+class _SlotRing:
+    """Ring of fixed-width time slots, each holding one sketch table.
+
+    Like SlidingWindowCounter, events are folded into time buckets and
+    buckets are expired as the window slides. Slot ``i`` lives at ring
+    position ``i % n_slots``, so the window covers the current (partial)
+    slot plus the ``n_slots - 1`` before it.
+    """
+
+    def __init__(self, window_seconds, slot_seconds, table_shape, dtype):
+        self.window_seconds = window_seconds
+        self.slot_seconds = slot_seconds
+        self.n_slots = max(1, window_seconds // slot_seconds)
+        self.slots = np.zeros((self.n_slots, *table_shape), dtype=dtype)
+        self.slot_ids = np.full(self.n_slots, -1, dtype=np.int64)
+        self.head = None  # newest slot seen
+
+    @property
+    def nbytes(self):
+        """Memory held by the sketch tables, fixed at construction"""
+        return self.slots.nbytes
+
+    def _clear(self, position):
+        self.slots[position] = 0
+        self.slot_ids[position] = -1
+
+    def advance(self, now):
+        """Expire every slot that has fallen out of the window ending at ``now``"""
+        head = int(now // self.slot_seconds)
+        if self.head is not None and head <= self.head:
+            return
+        self.head = head
+        for position in np.flatnonzero((self.slot_ids >= 0) & (self.slot_ids <= head - self.n_slots)):
+            self._clear(position)
+
+    def _slot_groups(self, timestamps):
+        """(ring position, event mask) per live slot in a batch; late events are dropped"""
+        slot = (np.asarray(timestamps, dtype=np.float64) // self.slot_seconds).astype(np.int64)
+        if len(slot):
+            self.advance(slot.max() * self.slot_seconds)
+        live = slot > self.head - self.n_slots if self.head is not None else np.zeros(len(slot), dtype=bool)
+        for slot_id in np.unique(slot[live]):
+            position = slot_id % self.n_slots
+            if self.slot_ids[position] != slot_id:
+                self._clear(position)
+                self.slot_ids[position] = slot_id
+            yield position, slot == slot_id
+
+    def _check_compatible(self, other):
+        if (type(other) is not type(self) or other.slots.shape != self.slots.shape
+                or other.slot_seconds != self.slot_seconds or other.seed != self.seed):
+            raise ValueError("Sketches must share type, shape, slot width and seed to merge")
+
+    def merge(self, other):
+        """Fold another shard's sketch into this one (same configuration required)"""
+        self._check_compatible(other)
+        for position in range(self.n_slots):
+            mine, theirs = self.slot_ids[position], other.slot_ids[position]
+            if theirs > mine:
+                self.slots[position] = other.slots[position]
+                self.slot_ids[position] = theirs
+            elif theirs == mine and theirs >= 0:
+                self._combine(position, other.slots[position])
+        if other.head is not None:
+            self.advance(other.head * self.slot_seconds)
+        return self
+
+class CountMinWindow(_SlotRing):
+    """Windowed count-min sketch of event counts per key.
+
+    Each slot is a ``depth`` x ``width`` table of uint32 counters, and a
+    running total table is kept alongside so queries read one table rather
+    than summing every slot. Estimates never undercount. With ``N`` events
+    in the window, an estimate exceeds the true count by more than
+    ``e / width * N`` with probability at most ``exp(-depth)``. Memory is
+    ``(n_slots + 1) * depth * width * 4`` bytes whatever the number of keys.
+    """
+
+    def __init__(self, window_seconds=600, slot_seconds=60, width=2**18, depth=4, seed=0):
+        super().__init__(window_seconds, slot_seconds, (depth, width), np.uint32)
+        self.width = width
+        self.depth = depth
+        self.seed = seed
+        self.totals = np.zeros((depth, width), dtype=np.uint32)
+
+    @property
+    def nbytes(self):
+        return self.slots.nbytes + self.totals.nbytes
+
+    def _columns(self, keys):
+        return np.stack([hash_values(keys, self.seed + row) % np.uint64(self.width) for row in range(self.depth)])
+
+    def _clear(self, position):
+        self.totals -= self.slots[position]
+        super()._clear(position)
+
+    def _combine(self, position, table):
+        self.slots[position] += table
+        self.totals += table
+
+    def merge(self, other):
+        super().merge(other)
+        self.totals = self.slots.sum(axis=0, dtype=np.uint32)
+        return self
+
+    def add(self, keys, timestamps):
+        """Count one event per (key, timestamp); events older than the window are ignored"""
+        columns = self._columns(keys)
+        for position, mask in self._slot_groups(timestamps):
+            for row in range(self.depth):
+                counts = np.bincount(columns[row, mask].astype(np.int64), minlength=self.width).astype(np.uint32)
+                self.slots[position, row] += counts
+                self.totals[row] += counts
+
+    def estimate(self, keys):
+        """Estimated event count per key over the current window"""
+        columns = self._columns(keys).astype(np.int64)
+        return self.totals[np.arange(self.depth)[:, None], columns].min(axis=0)
+
+    def total(self):
+        """Exact number of events in the current window"""
+        return int(self.totals[0].sum(dtype=np.int64))
+
+class HyperLogLogWindow(_SlotRing):
+    """Windowed distinct counts per key from a count-min grid of HyperLogLogs.
+
+    Each key hashes to one cell in each of ``depth`` rows of ``width``
+    cells, and each cell holds ``2**precision`` one-byte HLL registers for
+    the items seen with the keys hashed there. Registers take the max when
+    slots or shards combine, so merging is exact. A cell also counts the
+    items of other keys hashed to it, on average the row's total over
+    ``width``; that load is subtracted from each row's cell estimate and
+    the rows are averaged. Relative standard error is
+    ``1.04 / sqrt(2**precision)`` of a cell's count per row (26% at the
+    default precision), reduced by averaging the rows. Keys with few items
+    read within about one item of the truth while the active keys in the
+    window stay below ``width``, and drift up by a few items as cells get
+    more crowded; large counts are within the relative error. Memory is
+    ``n_slots * depth * width * 2**precision`` bytes.
+    """
+
+    def __init__(self, window_seconds=600, slot_seconds=60, width=2**16, depth=4, precision=4, seed=0):
+        super().__init__(window_seconds, slot_seconds, (depth * width, 2**precision), np.uint8)
+        self.width = width
+        self.depth = depth
+        self.precision = precision
+        self.seed = seed
+        self.cell_estimates = None  # cached until the registers change
+
+    def _cells(self, keys):
+        return np.stack([
+            hash_values(keys, self.seed + row) % np.uint64(self.width) + np.uint64(row * self.width)
+            for row in range(self.depth)
+        ]).astype(np.int64)
+
+    def _clear(self, position):
+        super()._clear(position)
+        self.cell_estimates = None
+
+    def _combine(self, position, table):
+        np.maximum(self.slots[position], table, out=self.slots[position])
+
+    def merge(self, other):
+        super().merge(other)
+        self.cell_estimates = None
+        return self
+
+    def add(self, keys, items, timestamps):
+        """Record ``items[i]`` as seen with ``keys[i]``; events older than the window are ignored"""
+        h = hash_values(items, self.seed + self.depth)
+        register = (h >> np.uint64(64 - self.precision)).astype(np.int64)
+        # Rank is the position of the lowest set bit of the low 32 hash bits
+        low = (h & np.uint64(0xFFFFFFFF)).astype(np.int64)
+        rank = np.where(low == 0, 33, np.log2(low & -low).astype(np.int64) + 1).astype(np.uint8)
+        cells = self._cells(keys)
+        m = 2**self.precision
+        for position, mask in self._slot_groups(timestamps):
+            table = self.slots[position].reshape(-1)
+            for row in range(self.depth):
+                np.maximum.at(table, cells[row, mask] * m + register[mask], rank[mask])
+        self.cell_estimates = None
+
+    def _cell_estimates(self):
+        """HLL estimate of every cell over the live slots, shape (depth, width)"""
+        if self.cell_estimates is None:
+            live = np.flatnonzero(self.slot_ids >= 0)
+            if len(live):
+                union = self.slots[live[0]].copy()
+                for position in live[1:]:
+                    np.maximum(union, self.slots[position], out=union)
+                self.cell_estimates = hll_estimate(union).reshape(self.depth, self.width)
+            else:
+                self.cell_estimates = np.zeros((self.depth, self.width))
+        return self.cell_estimates
+
+    def estimate(self, keys):
+        """Estimated distinct item count per key over the current window"""
+        estimates = self._cell_estimates()
+        cells = self._cells(keys) - (np.arange(self.depth) * self.width)[:, None]
+        raw = estimates[np.arange(self.depth)[:, None], cells]
+        if self.width == 1:
+            return raw[0]
+        load = estimates.sum(axis=1, keepdims=True) / self.width
+        corrected = ((raw - load) * self.width / (self.width - 1)).mean(axis=0)
+        return np.clip(corrected, 0, raw.min(axis=0))
+
+class SellerVelocityAggregator:
+    """Streaming per-seller velocity and payment-method features in bounded memory.
+
+    Counts transactions per seller with a CountMinWindow and distinct
+    buyers, cards and IPs with one HyperLogLogWindow each, plus a single
+    high-precision HLL of active sellers. Every table is allocated up
+    front (see ``nbytes``). Shards built with the same arguments combine
+    with ``merge``. Size ``distinct_width`` to at least the sellers active
+    in one window: payment method tiers are then exact for over 99% of
+    sellers, and they degrade as the grid gets more crowded.
+    """
+
+    def __init__(self, window_seconds=600, slot_seconds=60, count_width=2**18, count_depth=4,
+                 distinct_width=2**16, distinct_depth=4, precision=4, seed=0):
+        self.transactions = CountMinWindow(window_seconds, slot_seconds, count_width, count_depth, seed)
+        self.distinct = {
+            field: HyperLogLogWindow(window_seconds, slot_seconds, distinct_width, distinct_depth, precision, seed + 10 * (i + 1))
+            for i, field in enumerate(DISTINCT_FIELDS)
+        }
+        self.active_sellers = HyperLogLogWindow(window_seconds, slot_seconds, 1, 1, 12, seed + 100)
+
+    @property
+    def nbytes(self):
+        """Total sketch memory, fixed at construction"""
+        sketches = [self.transactions, self.active_sellers, *self.distinct.values()]
+        return sum(sketch.nbytes for sketch in sketches)
+
+    def ingest(self, columns):
+        """Fold a batch of transactions (``seller_id``, ``timestamp`` in epoch seconds and DISTINCT_FIELDS)"""
+        sellers, timestamps = columns['seller_id'], columns['timestamp']
+        self.transactions.add(sellers, timestamps)
+        for field, sketch in self.distinct.items():
+            sketch.add(sellers, columns[field], timestamps)
+        self.active_sellers.add(np.zeros(len(sellers), dtype=np.int64), sellers, timestamps)
+
+    def advance(self, now):
+        """Slide every window to end at ``now``"""
+        for sketch in [self.transactions, self.active_sellers, *self.distinct.values()]:
+            sketch.advance(now)
+
+    def merge(self, other):
+        """Fold another shard's aggregator into this one"""
+        self.transactions.merge(other.transactions)
+        self.active_sellers.merge(other.active_sellers)
+        for field, sketch in self.distinct.items():
+            sketch.merge(other.distinct[field])
+        return self
+
+    def features(self, seller_ids, now=None):
+        """Window counts plus model features for each seller.
+
+        ``velocity_score`` is the seller's transaction count relative to
+        the average active seller in the window (1.0 is typical).
+        ``payment_method_risk`` is the ordinal low/medium/high code from
+        distinct cards used (PAYMENT_METHOD_RISK_CUTS).
+        """
+        if now is not None:
+            self.advance(now)
+        transactions = self.transactions.estimate(seller_ids).astype(np.float64)
+        active = max(float(self.active_sellers.estimate([0])[0]), 1.0)
+        average = self.transactions.total() / active
+        distinct = {field: sketch.estimate(seller_ids) for field, sketch in self.distinct.items()}
+        return {
+            'transactions': transactions,
+            'distinct_buyers': distinct['buyer_id'],
+            'distinct_cards': distinct['card_id'],
+            'distinct_ips': distinct['ip_address'],
+            'velocity_score': (transactions / average if average else np.zeros_like(transactions)).astype(np.float32),
+            'payment_method_risk': np.searchsorted(PAYMENT_METHOD_RISK_CUTS, np.round(distinct['card_id']),
+                                                   side='right').astype(np.int8)
+        }
+
+def main():
+    """Command-line entry point for checking sketch accuracy and throughput"""
+    from utils.mock_data import generate_transaction_stream
+
+    parser = argparse.ArgumentParser(description="Stream synthetic transactions through the velocity sketches")
+    parser.add_argument('--sellers', type=int, default=1_000_000)
+    parser.add_argument('--events', type=int, default=5_000_000)
+    parser.add_argument('--shards', type=int, default=2, help="aggregate in this many shards, then merge")
+    parser.add_argument('--batch-size', type=int, default=500_000)
+    parser.add_argument('--count-width', type=int, default=2**18)
+    parser.add_argument('--distinct-width', type=int, default=2**16)
+    parser.add_argument('--distinct-depth', type=int, default=4)
+    parser.add_argument('--precision', type=int, default=4)
+    args = parser.parse_args()
+
+    stream = generate_transaction_stream(args.sellers, args.events)
+    shards = [SellerVelocityAggregator(count_width=args.count_width, distinct_width=args.distinct_width,
+                                       distinct_depth=args.distinct_depth, precision=args.precision)
+              for _ in range(args.shards)]
+    started = time.perf_counter()
+    for batch_index, start in enumerate(range(0, args.events, args.batch_size)):
+        batch = {name: values[start:start + args.batch_size] for name, values in stream.items()}
+        shards[batch_index % args.shards].ingest(batch)
+    merged = shards[0]
+    for shard in shards[1:]:
+        merged.merge(shard)
+    elapsed = time.perf_counter() - started
+
+    # Accuracy against exact window counts for the busiest sellers and a random sample
+    window_start = (int(stream['timestamp'].max() // merged.transactions.slot_seconds) - merged.transactions.n_slots + 1) \
+        * merged.transactions.slot_seconds
+    in_window = stream['timestamp'] >= window_start
+    window = pd.DataFrame({'seller': stream['seller_id'][in_window], 'card': stream['card_id'][in_window]})
+    exact_transactions = window.groupby('seller').size()
+    exact_cards = window.drop_duplicates().groupby('seller').size()
+    rng = np.random.default_rng(0)
+    sample = np.concatenate([exact_transactions.nlargest(1000).index, rng.choice(exact_transactions.index, 1000)])
+    features = merged.features(sample)
+    transactions, cards = exact_transactions.reindex(sample).to_numpy(), exact_cards.reindex(sample).to_numpy()
+    many = cards >= 20
+    print(f"✅ {args.events:,} events over {args.sellers:,} sellers in {elapsed:.1f}s "
+          f"({args.events / elapsed:,.0f}/s) with {merged.nbytes / 2**20:.0f} MiB of sketches")
+    print(f"   transactions: mean error {np.abs(features['transactions'] - transactions).mean():.2f} events")
+    print(f"   distinct cards: {np.mean(np.abs(features['distinct_cards'][many] - cards[many]) / cards[many]):.1%} "
+          f"relative error at 20+ cards, {np.abs(features['distinct_cards'][~many] - cards[~many]).mean():.2f} "
+          f"cards absolute error below")
+    print(f"   active sellers: {len(exact_transactions):,} exact, {merged.active_sellers.estimate([0])[0]:,.0f} estimated")
+
+    # Payment method risk tier of every active seller against the tier of its exact card count
+    estimated_tiers = merged.features(exact_cards.index.to_numpy())['payment_method_risk']
+    exact_tiers = np.searchsorted(PAYMENT_METHOD_RISK_CUTS, exact_cards.to_numpy(), side='right')
+    print(f"   payment method risk: {np.mean(estimated_tiers == exact_tiers):.2%} of {len(exact_tiers):,} tiers exact, "
+          f"{np.sum((exact_tiers == 0) & (estimated_tiers > 0)):,} low sellers raised, "
+          f"{np.sum((exact_tiers > 0) & (estimated_tiers == 0)):,} elevated sellers missed")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,225 @@
+import argparse
+import time
+import numpy as np
+from utils.fraud_model import score_sellers
+
+ALL_SEGMENTS = 'All'
+# Default cost of flagging a legitimate seller (review time, friction) and of missing a fraudulent one
+FALSE_POSITIVE_COST = 25.0
+FALSE_NEGATIVE_COST = 500.0
+
+def _ordered_bits(scores):
+    """uint32 codes that sort like the float32 scores (negative scores included)"""
+    bits = np.ascontiguousarray(scores, dtype=np.float32).view(np.uint32)
+    return np.where(bits & np.uint32(0x80000000), ~bits, bits | np.uint32(0x80000000))
+
+def _score_groups(keys, chunk_rows=10_000_000):
+    """Distinct ``key >> 1`` values of sorted keys with their positive and row counts"""
+    values, positives, sizes = [], [], []
+    for start in range(0, len(keys), chunk_rows):
+        chunk = keys[start:start + chunk_rows]
+        group = chunk >> np.uint64(1)
+        starts = np.flatnonzero(np.r_[True, group[1:] != group[:-1]])
+        values.append(group[starts])
+        positives.append(np.add.reduceat((chunk & np.uint64(1)).astype(np.int64), starts))
+        sizes.append(np.diff(np.r_[starts, len(chunk)]))
+    if not values:
+        return np.empty(0, dtype=np.uint64), np.empty(0, dtype=np.int64), np.empty(0, dtype=np.int64)
+    values, positives, sizes = np.concatenate(values), np.concatenate(positives), np.concatenate(sizes)
+    # A group can straddle a chunk boundary; fold its pieces together
+    starts = np.flatnonzero(np.r_[True, values[1:] != values[:-1]])
+    return values[starts], np.add.reduceat(positives, starts), np.add.reduceat(sizes, starts)
+
+class ThresholdCurve:
+    """Confusion counts at every distinct score threshold, highest threshold first.
+
+    Entry ``i`` describes flagging every row scoring at least
+    ``thresholds[i]``: ``tp[i]`` fraud rows and ``fp[i]`` legitimate rows.
+    Built from one sort and cumulative sums, so every threshold costs the
+    same as one; lookups afterwards are binary searches. Scores are
+    compared as float32.
+    """
+
+    def __init__(self, thresholds, tp, fp, n_pos, n_neg):
+        self.thresholds = thresholds
+        self.tp = tp
+        self.fp = fp
+        self.n_pos = int(n_pos)
+        self.n_neg = int(n_neg)
+        self.search_keys = -thresholds  # ascending, for binary search
+
+    @classmethod
+    def from_counts(cls, thresholds, positives, sizes):
+        """Curve from per-threshold positive and row counts in ascending threshold order"""
+        tp = np.cumsum(positives[::-1])
+        fp = np.cumsum((sizes - positives)[::-1])
+        n_pos, n_neg = (int(tp[-1]), int(fp[-1])) if len(tp) else (0, 0)
+        return cls(thresholds[::-1].copy(), tp, fp, n_pos, n_neg)
+
+    @property
+    def precision(self):
+        return self.tp / np.maximum(self.tp + self.fp, 1)
+
+    @property
+    def recall(self):
+        return self.tp / max(self.n_pos, 1)
+
+    @property
+    def fpr(self):
+        return self.fp / max(self.n_neg, 1)
+
+    def f1(self):
+        return 2 * self.tp / (self.tp + self.fp + self.n_pos)
+
+    def cost(self, fp_cost=FALSE_POSITIVE_COST, fn_cost=FALSE_NEGATIVE_COST):
+        """Total cost of false positives and missed fraud at every threshold"""
+        return self.fp * fp_cost + (self.n_pos - self.tp) * fn_cost
+
+    def _index(self, threshold):
+        """Index of the lowest curve threshold >= ``threshold``, or -1 when nothing is flagged"""
+        return int(np.searchsorted(self.search_keys, -np.float32(threshold), side='right')) - 1
+
+    def at(self, threshold, fp_cost=FALSE_POSITIVE_COST, fn_cost=FALSE_NEGATIVE_COST):
+        """Metrics when flagging every row scoring at least ``threshold``"""
+        i = self._index(threshold)
+        tp, fp = (int(self.tp[i]), int(self.fp[i])) if i >= 0 else (0, 0)
+        return {
+            'threshold': float(threshold),
+            'flagged': tp + fp,
+            'tp': tp,
+            'fp': fp,
+            'precision': tp / max(tp + fp, 1),
+            'recall': tp / max(self.n_pos, 1),
+            'fpr': fp / max(self.n_neg, 1),
+            'f1': 2 * tp / max(tp + fp + self.n_pos, 1),
+            'cost': fp * fp_cost + (self.n_pos - tp) * fn_cost
+        }
+
+    def threshold_for_fpr(self, target):
+        """Lowest threshold (highest recall) whose false positive rate stays within ``target``"""
+        i = int(np.searchsorted(self.fp, np.floor(target * self.n_neg), side='right')) - 1
+        return float(self.thresholds[i]) if i >= 0 else float('inf')
+
+    def min_cost_threshold(self, fp_cost=FALSE_POSITIVE_COST, fn_cost=FALSE_NEGATIVE_COST):
+        """Threshold with the lowest total cost"""
+        return float(self.thresholds[int(np.argmin(self.cost(fp_cost, fn_cost)))]) if len(self.tp) else float('inf')
+
+    def sample(self, points=400):
+        """Indexes of the entries at about ``points`` evenly spaced threshold values, for plotting"""
+        if not len(self.thresholds):
+            return np.empty(0, dtype=np.int64)
+        grid = np.linspace(self.thresholds[-1], self.thresholds[0], points).astype(np.float32)
+        indexes = np.searchsorted(self.search_keys, -grid, side='right') - 1
+        return np.unique(indexes[indexes >= 0])
+
+def threshold_curve(scores, labels):
+    """ThresholdCurve of one score array against binary labels"""
+    return segment_curves(scores, labels, None)[0]
+
+def segment_curves(scores, labels, segments=None):
+    """ThresholdCurve per segment code from one sort of packed (segment, score, label) keys"""
+    keys = _ordered_bits(scores).astype(np.uint64)
+    keys <<= np.uint64(1)
+    keys |= np.asarray(labels).astype(bool)
+    if segments is not None:
+        keys |= np.asarray(segments).astype(np.uint64) << np.uint64(33)
+    keys.sort()
+    values, positives, sizes = _score_groups(keys)
+    del keys
+
+    curves = {}
+    segment = values >> np.uint64(32)
+    bounds = np.flatnonzero(np.r_[True, segment[1:] != segment[:-1], True]) if len(values) else []
+    for start, stop in zip(bounds[:-1], bounds[1:]):
+        bits = (values[start:stop] & np.uint64(0xFFFFFFFF)).astype(np.uint32)
+        bits = np.where(bits & np.uint32(0x80000000), bits & np.uint32(0x7FFFFFFF), ~bits)
+        curves[int(segment[start])] = ThresholdCurve.from_counts(
+            bits.view(np.float32), positives[start:stop], sizes[start:stop])
+    if segments is None and not curves:
+        curves[0] = ThresholdCurve(np.empty(0, dtype=np.float32), np.empty(0, dtype=np.int64),
+                                   np.empty(0, dtype=np.int64), 0, 0)
+    return curves
+
+class ThresholdSweep:
+    """Threshold curves per strategy and segment, computed once and cached.
+
+    Each strategy's scores are swept once overall and once across all
+    segments together, so a threshold slider or an FPR target is answered
+    by a lookup on a cached curve however many rows were scored.
+    """
+
+    def __init__(self, segment_names=()):
+        self.segment_names = list(segment_names)
+        self.curves = {}
+        self.rows = {}
+
+    def add_strategy(self, strategy, scores, labels, segments=None):
+        """Sweep one strategy's scores; ``segments`` are codes into ``segment_names``"""
+        self.curves[strategy, ALL_SEGMENTS] = threshold_curve(scores, labels)
+        if segments is not None:
+            for code, curve in segment_curves(scores, labels, segments).items():
+                self.curves[strategy, self.segment_names[code]] = curve
+        self.rows[strategy] = len(labels)
+        return self
+
+    @property
+    def strategies(self):
+        return list(self.rows)
+
+    def curve(self, strategy, segment=ALL_SEGMENTS):
+        return self.curves[strategy, segment]
+
+    def at(self, strategy, threshold, segment=ALL_SEGMENTS, **costs):
+        """Metrics for one strategy and segment at ``threshold``"""
+        return self.curve(strategy, segment).at(threshold, **costs)
+
+    def threshold_for_fpr(self, strategy, target, segment=ALL_SEGMENTS):
+        return self.curve(strategy, segment).threshold_for_fpr(target)
+
+def strategy_scores(columns, model):
+    """Score per active risk strategy for seller feature columns (higher means flag)"""
+    velocity = columns['velocity_score'].astype(np.float32)
+    return {
+        'Fraud Model': score_sellers(model, columns).astype(np.float32),
+        'High Decline Rate Block': columns['payment_decline_rate_7d'].astype(np.float32),
+        'New Seller Verification': (30.0 / (30.0 + columns['seller_age_days'])).astype(np.float32),
+        'Velocity Check': velocity / (1.0 + velocity)
+    }
+
+def main():
+    """Command-line entry point for timing sweeps over large synthetic score sets"""
+    parser = argparse.ArgumentParser(description="Sweep precision/recall/FPR over every threshold")
+    parser.add_argument('--rows', type=int, default=100_000_000)
+    parser.add_argument('--segments', type=int, default=3)
+    parser.add_argument('--fraud-rate', type=float, default=0.02)
+    parser.add_argument('--target-fpr', type=float, default=0.05)
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(0)
+    labels = rng.random(args.rows, dtype=np.float32) < args.fraud_rate
+    segments = rng.integers(0, args.segments, args.rows, dtype=np.int8)
+    scores = rng.standard_normal(args.rows, dtype=np.float32)
+    scores += 2.0 * labels + 0.3 * segments
+    np.negative(scores, out=scores)
+    np.exp(scores, out=scores)
+    scores = 1.0 / (1.0 + scores)
+
+    sweep = ThresholdSweep([f"segment-{i}" for i in range(args.segments)])
+    started = time.perf_counter()
+    sweep.add_strategy('synthetic', scores, labels, segments)
+    elapsed = time.perf_counter() - started
+
+    curve = sweep.curve('synthetic')
+    started = time.perf_counter()
+    threshold = curve.threshold_for_fpr(args.target_fpr)
+    metrics = curve.at(threshold)
+    for value in rng.random(1000):
+        curve.at(value)
+    lookup_ms = (time.perf_counter() - started) * 1000 / 1001
+    print(f"✅ Swept {args.rows:,} scores into {len(sweep.curves)} curves "
+          f"({len(curve.thresholds):,} thresholds overall) in {elapsed:.1f}s; lookups take {lookup_ms:.3f}ms")
+    print(f"   FPR target {args.target_fpr:.1%} → threshold {threshold:.4f}: precision {metrics['precision']:.3f}, "
+          f"recall {metrics['recall']:.3f}, FPR {metrics['fpr']:.2%}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,165 @@
+import numpy as np
+from utils.fraud_model import _sigmoid
+
+def bin_features(X, n_bins=32, edges=None):
+    """Quantize each column into at most ``n_bins`` uint8 bins.
+
+    Pass the ``edges`` returned for the training set to bin validation data
+    the same way.
+    """
+    if edges is None:
+        quantiles = np.linspace(0, 1, n_bins + 1)[1:-1]
+        edges = [np.unique(np.quantile(X[:, j], quantiles)) for j in range(X.shape[1])]
+    bins = np.empty(X.shape, dtype=np.uint8)
+    for j, column_edges in enumerate(edges):
+        bins[:, j] = np.searchsorted(column_edges, X[:, j], side='right')
+    return bins, edges
+
+def grow_tree(bins, g, h, rows, max_depth, l2=1.0, min_child_weight=1.0, features=None, n_bins=32):
+    """Fit one second-order regression tree to gradients ``g`` and hessians ``h``.
+
+    Split search uses per-node gradient histograms: one ``bincount`` over the
+    node's rows covers every candidate feature at once, and cumulative sums
+    give the gain of every threshold. Returns flat node arrays; leaves have
+    ``feature == -1``.
+    """
+    features = np.arange(bins.shape[1]) if features is None else np.asarray(features)
+    feature, threshold, left, right, value = [], [], [], [], []
+
+    def leaf(G, H):
+        return -G / (H + l2)
+
+    stack = [(rows, 0, len(feature))]
+    feature.append(-1), threshold.append(0), left.append(-1), right.append(-1), value.append(0.0)
+    while stack:
+        node_rows, depth, node = stack.pop()
+        g_node, h_node = g[node_rows], h[node_rows]
+        G, H = g_node.sum(), h_node.sum()
+        value[node] = leaf(G, H)
+        if depth >= max_depth or H < 2 * min_child_weight:
+            continue
+
+        block = bins[np.ix_(node_rows, features)].astype(np.int64) + np.arange(len(features)) * n_bins
+        shape = (len(features), n_bins)
+        G_hist = np.bincount(block.ravel(), weights=np.repeat(g_node, len(features)), minlength=shape[0] * shape[1]).reshape(shape)
+        H_hist = np.bincount(block.ravel(), weights=np.repeat(h_node, len(features)), minlength=shape[0] * shape[1]).reshape(shape)
+        GL, HL = np.cumsum(G_hist, axis=1)[:, :-1], np.cumsum(H_hist, axis=1)[:, :-1]
+        GR, HR = G - GL, H - HL
+        gain = GL ** 2 / (HL + l2) + GR ** 2 / (HR + l2) - G ** 2 / (H + l2)
+        gain[(HL < min_child_weight) | (HR < min_child_weight)] = -np.inf
+
+        best = np.unravel_index(np.argmax(gain), gain.shape)
+        if not gain[best] > 1e-9:
+            continue
+        split_feature, split_bin = int(features[best[0]]), int(best[1])
+        goes_left = bins[node_rows, split_feature] <= split_bin
+
+        feature[node], threshold[node] = split_feature, split_bin
+        for rows_child, side in ((node_rows[goes_left], left), (node_rows[~goes_left], right)):
+            side[node] = len(feature)
+            stack.append((rows_child, depth + 1, len(feature)))
+            feature.append(-1), threshold.append(0), left.append(-1), right.append(-1), value.append(0.0)
+
+    return {
+        'feature': np.array(feature, dtype=np.int16),
+        'threshold': np.array(threshold, dtype=np.uint8),
+        'left': np.array(left, dtype=np.int32),
+        'right': np.array(right, dtype=np.int32),
+        'value': np.array(value)
+    }
+
+def predict_tree(tree, bins, max_depth):
+    """Leaf value for every row of ``bins``"""
+    node = np.zeros(len(bins), dtype=np.int32)
+    rows = np.arange(len(bins))
+    for _ in range(max_depth):
+        split = tree['feature'][node]
+        internal = split >= 0
+        if not internal.any():
+            break
+        goes_left = bins[rows, np.maximum(split, 0)] <= tree['threshold'][node]
+        node = np.where(internal, np.where(goes_left, tree['left'][node], tree['right'][node]), node)
+    return tree['value'][node]
+
+class GradientBoostedTrees:
+    """XGBoost-style boosting: second-order histogram trees on log-loss.
+
+    ``fit_more`` adds rounds to the existing ensemble, so training can be
+    resumed with a larger budget.
+    """
+
+    def __init__(self, learning_rate=0.1, max_depth=3, l2=1.0, min_child_weight=1.0, subsample=1.0, seed=0):
+        self.learning_rate = learning_rate
+        self.max_depth = max_depth
+        self.l2 = l2
+        self.min_child_weight = min_child_weight
+        self.subsample = subsample
+        self.seed = seed
+        self.base = None
+        self.trees = []
+
+    @property
+    def budget(self):
+        return len(self.trees)
+
+    def decision_function(self, bins):
+        raw = np.full(len(bins), self.base)
+        for tree in self.trees:
+            raw += self.learning_rate * predict_tree(tree, bins, self.max_depth)
+        return raw
+
+    def fit_more(self, bins, y, n_rounds):
+        """Add ``n_rounds`` boosting rounds"""
+        if self.base is None:
+            rate = y.mean()
+            self.base = float(np.log((rate + 1e-9) / (1 - rate + 1e-9)))
+        rng = np.random.default_rng([self.seed, len(self.trees)])
+        raw = self.decision_function(bins)
+        all_rows = np.arange(len(y))
+        for _ in range(n_rounds):
+            p = _sigmoid(raw)
+            rows = all_rows if self.subsample >= 1 else np.flatnonzero(rng.random(len(y)) < self.subsample)
+            tree = grow_tree(bins, p - y, p * (1 - p), rows, self.max_depth, self.l2, self.min_child_weight)
+            self.trees.append(tree)
+            raw += self.learning_rate * predict_tree(tree, bins, self.max_depth)
+        return self
+
+class RandomForest:
+    """Bagged regression trees on bootstrap samples with per-tree feature subsampling.
+
+    Trees fit the labels with squared loss, so each leaf holds the fraud
+    rate of its rows and the forest averages those probabilities.
+    """
+
+    def __init__(self, max_depth=6, feature_fraction=0.6, min_child_weight=5.0, seed=0):
+        self.max_depth = max_depth
+        self.feature_fraction = feature_fraction
+        self.min_child_weight = min_child_weight
+        self.seed = seed
+        self.rate = None
+        self.trees = []
+
+    @property
+    def budget(self):
+        return len(self.trees)
+
+    def predict_proba(self, bins):
+        if not self.trees:
+            return np.full(len(bins), self.rate)
+        return np.mean([predict_tree(tree, bins, self.max_depth) for tree in self.trees], axis=0)
+
+    def decision_function(self, bins):
+        p = np.clip(self.predict_proba(bins), 1e-6, 1 - 1e-6)
+        return np.log(p / (1 - p))
+
+    def fit_more(self, bins, y, n_trees):
+        """Add ``n_trees`` trees to the forest"""
+        self.rate = float(y.mean())
+        g, h = -y, np.ones(len(y))
+        n_features = max(1, int(round(self.feature_fraction * bins.shape[1])))
+        for _ in range(n_trees):
+            rng = np.random.default_rng([self.seed, len(self.trees)])
+            rows = rng.integers(0, len(y), len(y))
+            features = np.sort(rng.choice(bins.shape[1], n_features, replace=False))
+            self.trees.append(grow_tree(bins, g, h, rows, self.max_depth, 1e-3, self.min_child_weight, features))
+        return self